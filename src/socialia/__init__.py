@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 try:
-    from importlib.metadata import version as _v, PackageNotFoundError
+    from importlib.metadata import PackageNotFoundError
+    from importlib.metadata import version as _v
     try:
         __version__ = _v("socialia")
     except PackageNotFoundError:
@@ -11,18 +15,49 @@ try:
     del _v, PackageNotFoundError
 except ImportError:  # pragma: no cover — only on ancient Pythons
     __version__ = "0.0.0+local"
-from .twitter import Twitter
-from .linkedin import LinkedIn
-from .reddit import Reddit
-from .slack import Slack
-from .analytics import GoogleAnalytics
-from .youtube import YouTube
-from .org_files import move_to_scheduled, move_to_posted, ensure_project_dirs
+# Applies $SOCIALIA_ENV_FILE on import; kept eager (and MCP-free) so the CLI
+# and library see env-file credentials even though the clients load lazily.
+from . import _env_file  # noqa: F401
+from .org_files import ensure_project_dirs, move_to_posted, move_to_scheduled
+
+if TYPE_CHECKING:
+    from .analytics import GoogleAnalytics
+    from .linkedin import LinkedIn
+    from .reddit import Reddit
+    from .slack import Slack
+    from .twitter import Twitter
+    from .youtube import YouTube
+
+# Platform clients (and the MCP strategies table, which pulls in fastmcp) are
+# imported on first attribute access, so ``import socialia`` does not load
+# every platform's HTTP/OAuth stack up front.
+_LAZY_ATTRS = {
+    "Twitter": ".twitter",
+    "LinkedIn": ".linkedin",
+    "Reddit": ".reddit",
+    "Slack": ".slack",
+    "GoogleAnalytics": ".analytics",
+    "YouTube": ".youtube",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name == "PLATFORM_STRATEGIES":
+        try:
+            from ._server import PLATFORM_STRATEGIES as value
+        except ImportError:
+            value = {}
+    elif name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(_LAZY_ATTRS[name], __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
 
-try:
-    from ._server import PLATFORM_STRATEGIES
-except ImportError:
-    PLATFORM_STRATEGIES = {}
 
 __all__ = [
     # Platform clients
@@ -16,6 +16,7 @@ Public API:
   - ``get_env(key, default=None)``
   - ``get_env_var_name(key)``
   - ``get_mcp_server_name()``
+  - ``refresh()``
 """
 
 from __future__ import annotations
@@ -23,25 +24,42 @@ from __future__ import annotations
 import os
 from typing import Optional
 
-__all__ = ["get_env", "get_env_var_name", "get_mcp_server_name"]
+__all__ = ["get_env", "get_env_var_name", "get_mcp_server_name", "refresh"]
 
 try:
     from scitex_dev._branding import get as _brand_get
     from scitex_dev._branding import get_env as _central_get_env
 
     _HAS_REGISTRY = True
-    ENV_PREFIX = _brand_get("socialia", "env_prefix")
-    BRAND_NAME = _brand_get("socialia", "display")
 except ModuleNotFoundError:
     _HAS_REGISTRY = False
     _brand_get = None  # type: ignore[assignment]
     _central_get_env = None  # type: ignore[assignment]
-    # Local fallback mirrors the pre-registry behaviour.
-    BRAND_NAME = os.environ.get("SOCIALIA_BRAND", "socialia")
-    ENV_PREFIX = os.environ.get("SOCIALIA_ENV_PREFIX", "SOCIALIA")
 
 _ORIGINAL_PREFIX = "SOCIALIA"
 
+ENV_PREFIX: str
+BRAND_NAME: str
+
+
+def refresh() -> None:
+    """Re-read ``ENV_PREFIX`` / ``BRAND_NAME`` after the environment changes.
+
+    Runs once at import; call it again (instead of reloading the module)
+    when ``$SOCIALIA_ENV_PREFIX`` or ``$SOCIALIA_BRAND`` change at runtime.
+    """
+    global ENV_PREFIX, BRAND_NAME
+    if _HAS_REGISTRY:
+        ENV_PREFIX = _brand_get("socialia", "env_prefix")
+        BRAND_NAME = _brand_get("socialia", "display")
+    else:
+        # Local fallback mirrors the pre-registry behaviour.
+        BRAND_NAME = os.environ.get("SOCIALIA_BRAND", "socialia")
+        ENV_PREFIX = os.environ.get("SOCIALIA_ENV_PREFIX", "SOCIALIA")
+
+
+refresh()
+
 
 def get_env(key: str, default: Optional[str] = None) -> Optional[str]:
     """Get an environment variable using the socialia brand's env_prefix
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""Load ``SOCIALIA_ENV_FILE`` into ``os.environ``.
+
+Imported eagerly from ``socialia/__init__.py`` so CLI and library users get
+env-file credentials without pulling in the MCP server (and fastmcp).
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+__all__ = ["load_env_file"]
+
+
+def load_env_file(env_file: str) -> None:
+    """Load environment variables from a file."""
+    path = Path(os.path.expandvars(env_file)).expanduser()
+    if not path.exists():
+        print(f"Warning: SOCIALIA_ENV_FILE not found: {path}", file=sys.stderr)
+        return
+
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            line = line.removeprefix("export ")
+            if "=" in line:
+                key, _, value = line.partition("=")
+                key = key.strip()
+                value = value.strip().strip('"').strip("'")
+                value = os.path.expandvars(value)
+                os.environ[key] = value
+
+
+# Load env file if specified
+if env_file := os.environ.get("SOCIALIA_ENV_FILE"):
+    load_env_file(env_file)
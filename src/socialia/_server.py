@@ -13,48 +13,12 @@ from __future__ import annotations
 
 __all__ = ["PLATFORM_STRATEGIES"]
 
-import os
-import sys
-from pathlib import Path
-
 from fastmcp import FastMCP
 
 from ._branding import get_mcp_server_name
 from ._mcp.tools import register_all_tools
 
 
-# =============================================================================
-# Environment Loading
-# =============================================================================
-
-
-def _load_env_file(env_file: str) -> None:
-    """Load environment variables from a file."""
-    path = Path(os.path.expandvars(env_file)).expanduser()
-    if not path.exists():
-        print(f"Warning: SOCIALIA_ENV_FILE not found: {path}", file=sys.stderr)
-        return
-
-    with open(path) as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-            if line.startswith("export "):
-                line = line[7:]
-            if "=" in line:
-                key, _, value = line.partition("=")
-                key = key.strip()
-                value = value.strip().strip('"').strip("'")
-                value = os.path.expandvars(value)
-                os.environ[key] = value
-
-
-# Load env file if specified
-if env_file := os.environ.get("SOCIALIA_ENV_FILE"):
-    _load_env_file(env_file)
-
-
 # =============================================================================
 # Platform Strategies (Resource)
 # =============================================================================
@@ -67,7 +67,7 @@ class TwitterGrowthMixin:
         if not self.validate_credentials():
             return {"success": False, "error": "Missing credentials"}
 
-        me = self.me()
+        me = self._own_user()
         if not me.get("success"):
             return me
 
@@ -97,7 +97,7 @@ class TwitterGrowthMixin:
         if not self.validate_credentials():
             return {"success": False, "error": "Missing credentials"}
 
-        me = self.me()
+        me = self._own_user()
         if not me.get("success"):
             return me
 
@@ -144,7 +144,7 @@ class TwitterGrowthMixin:
         if not self.validate_credentials():
             return {"success": False, "error": "Missing credentials"}
 
-        me = self.me()
+        me = self._own_user()
         if not me.get("success"):
             return me
 
@@ -205,7 +205,7 @@ class TwitterGrowthMixin:
         if not self.validate_credentials():
             return {"success": False, "error": "Missing credentials"}
 
-        me = self.me()
+        me = self._own_user()
         if not me.get("success"):
             return me
 
@@ -1,8 +1,9 @@
 """Twitter media upload functionality (images and videos)."""
 
+import os
 import time
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, BinaryIO, Optional
 
 if TYPE_CHECKING:
     from requests_oauthlib import OAuth1Session
@@ -23,36 +24,96 @@ VIDEO_EXTENSIONS = {".mp4", ".mov"}
 
 MEDIA_UPLOAD_ENDPOINT = "https://upload.twitter.com/1.1/media/upload.json"
 
+# Twitter rejects larger simple uploads only after receiving every byte.
+IMAGE_SIZE_LIMIT = 5 * 1024 * 1024
+GIF_SIZE_LIMIT = 15 * 1024 * 1024
 
-def upload_media(oauth: "OAuth1Session", file_path: str) -> dict:
+# Leading bytes of each image format (WebP is checked separately).
+_IMAGE_SIGNATURES = {
+    ".jpg": (b"\xff\xd8\xff",),
+    ".jpeg": (b"\xff\xd8\xff",),
+    ".png": (b"\x89PNG",),
+    ".gif": (b"GIF87a", b"GIF89a"),
+}
+
+
+def _check_image(f: BinaryIO, file_path: str, ext: str) -> Optional[str]:
+    """Return why Twitter would reject the open image *f*, or None.
+
+    Only an fstat and a 12-byte header read, so oversized or mislabelled
+    files fail before their upload is sent.
+    """
+    size = os.fstat(f.fileno()).st_size
+    limit = GIF_SIZE_LIMIT if ext == ".gif" else IMAGE_SIZE_LIMIT
+    if size > limit:
+        return f"Image too large: {file_path} ({size} bytes, max {limit})"
+    header = f.read(12)
+    f.seek(0)
+    if ext == ".webp":
+        valid = header[:4] == b"RIFF" and header[8:12] == b"WEBP"
+    else:
+        valid = header.startswith(_IMAGE_SIGNATURES[ext])
+    if not valid:
+        return f"Not a valid {MEDIA_TYPES[ext]} file: {file_path}"
+    return None
+
+
+def preflight_media(file_path: str) -> Optional[str]:
+    """Check *file_path* locally and return why its upload would fail, or None.
+
+    Videos are only checked for existence; their limits depend on the
+    chunked upload's processing step.
+    """
+    path = Path(file_path)
+    ext = path.suffix.lower()
+    if ext not in MEDIA_TYPES:
+        return f"Unsupported file type: {ext}. Supported: {list(MEDIA_TYPES.keys())}"
+    try:
+        with open(path, "rb") as f:
+            if ext in VIDEO_EXTENSIONS:
+                return None
+            return _check_image(f, file_path, ext)
+    except FileNotFoundError:
+        return f"File not found: {file_path}"
+
+
+def upload_media(
+    oauth: "OAuth1Session", file_path: str, preflighted: bool = False
+) -> dict:
     """
     Upload media file to Twitter (auto-detects image vs video).
 
     Args:
         oauth: Authenticated OAuth1Session
         file_path: Path to media file (jpg, png, gif, webp, mp4, mov)
+        preflighted: *file_path* already passed ``preflight_media``, so
+            the image size and signature checks are not repeated
 
     Returns:
         dict with 'success', 'media_id' or 'error'
     """
     path = Path(file_path)
-    if not path.exists():
-        return {"success": False, "error": f"File not found: {file_path}"}
-
     ext = path.suffix.lower()
+
+    # Route videos to chunked upload (which reports missing files itself)
+    if ext in VIDEO_EXTENSIONS:
+        return upload_video(oauth, file_path)
+
     if ext not in MEDIA_TYPES:
         return {
             "success": False,
             "error": f"Unsupported file type: {ext}. Supported: {list(MEDIA_TYPES.keys())}",
         }
 
-    # Route videos to chunked upload
-    if ext in VIDEO_EXTENSIONS:
-        return upload_video(oauth, file_path)
-
-    # Simple upload for images
-    with open(path, "rb") as f:
-        media_data = f.read()
+    # Simple upload for images; opening doubles as the existence check
+    try:
+        with open(path, "rb") as f:
+            error = None if preflighted else _check_image(f, file_path, ext)
+            if error:
+                return {"success": False, "error": error}
+            media_data = f.read()
+    except FileNotFoundError:
+        return {"success": False, "error": f"File not found: {file_path}"}
 
     files = {"media": media_data}
     response = oauth.post(MEDIA_UPLOAD_ENDPOINT, files=files)
@@ -70,7 +131,10 @@ def upload_media(oauth: "OAuth1Session", file_path: str) -> dict:
 
 
 def upload_video(
-    oauth: "OAuth1Session", file_path: str, chunk_size: int = 4 * 1024 * 1024
+    oauth: "OAuth1Session",
+    file_path: str,
+    chunk_size: int = 4 * 1024 * 1024,
+    status_timeout: float = 600.0,
 ) -> dict:
     """
     Upload video to Twitter using chunked upload API.
@@ -81,17 +145,34 @@ def upload_video(
         oauth: Authenticated OAuth1Session
         file_path: Path to video file (mp4, mov)
         chunk_size: Upload chunk size in bytes (default 4MB, max 5MB)
+        status_timeout: Give up waiting for video processing after this many
+            seconds (default 10 minutes)
 
     Returns:
         dict with 'success', 'media_id' or 'error'
     """
     path = Path(file_path)
-    if not path.exists():
+    # Open once and fstat the descriptor: existence, size and the handle
+    # used for APPEND all come from a single open.
+    try:
+        with open(path, "rb") as f:
+            return _upload_video_file(
+                oauth, f, path.suffix.lower(), chunk_size, status_timeout
+            )
+    except FileNotFoundError:
         return {"success": False, "error": f"File not found: {file_path}"}
 
-    ext = path.suffix.lower()
+
+def _upload_video_file(
+    oauth: "OAuth1Session",
+    f: BinaryIO,
+    ext: str,
+    chunk_size: int,
+    status_timeout: float,
+) -> dict:
+    """Run the chunked upload flow for the already-open video file *f*."""
     media_type = MEDIA_TYPES.get(ext, "video/mp4")
-    total_bytes = path.stat().st_size
+    total_bytes = os.fstat(f.fileno()).st_size
 
     # Step 1: INIT
     init_params = {
@@ -111,30 +192,27 @@ def upload_video(
     media_id = response.json()["media_id_string"]
 
     # Step 2: APPEND (chunked upload)
-    with open(path, "rb") as f:
-        segment_index = 0
-        while True:
-            chunk = f.read(chunk_size)
-            if not chunk:
-                break
-
-            append_params = {
-                "command": "APPEND",
-                "media_id": media_id,
-                "segment_index": segment_index,
-            }
-            files = {"media": chunk}
-            response = oauth.post(
-                MEDIA_UPLOAD_ENDPOINT, data=append_params, files=files
-            )
+    segment_index = 0
+    while True:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            break
+
+        append_params = {
+            "command": "APPEND",
+            "media_id": media_id,
+            "segment_index": segment_index,
+        }
+        files = {"media": chunk}
+        response = oauth.post(MEDIA_UPLOAD_ENDPOINT, data=append_params, files=files)
 
-            if response.status_code not in (200, 201, 202, 204):
-                return {
-                    "success": False,
-                    "error": f"APPEND segment {segment_index} failed: {response.status_code}: {response.text}",
-                }
+        if response.status_code not in (200, 201, 202, 204):
+            return {
+                "success": False,
+                "error": f"APPEND segment {segment_index} failed: {response.status_code}: {response.text}",
+            }
 
-            segment_index += 1
+        segment_index += 1
 
     # Step 3: FINALIZE
     finalize_params = {
@@ -156,14 +234,19 @@ def upload_video(
     if processing_info:
         state = processing_info.get("state")
         check_after_secs = processing_info.get("check_after_secs", 5)
+        deadline = time.monotonic() + status_timeout
+        status_params = {"command": "STATUS", "media_id": media_id}
 
         while state in ("pending", "in_progress"):
-            time.sleep(check_after_secs)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return {
+                    "success": False,
+                    "error": f"Video processing timed out after {status_timeout:g}s",
+                }
+            # Twitter says when to check back; never sleep past the deadline.
+            time.sleep(min(check_after_secs, remaining))
 
-            status_params = {
-                "command": "STATUS",
-                "media_id": media_id,
-            }
             response = oauth.get(MEDIA_UPLOAD_ENDPOINT, params=status_params)
 
             if response.status_code != 200:
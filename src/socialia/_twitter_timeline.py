@@ -0,0 +1,184 @@
+"""Twitter timeline reads: own tweets, mentions and replies."""
+
+__all__ = ["TwitterTimelineMixin"]
+
+
+class TwitterTimelineMixin:
+    """Mixin providing timeline reads for ``Twitter``.
+
+    Uses the host class's endpoints, ``_own_user`` lookup and optional
+    read backend.
+    """
+
+    def feed(self, limit: int = 10) -> dict:
+        """
+        Get user's recent tweets.
+
+        Args:
+            limit: Maximum number of tweets to return (max 100)
+
+        Returns:
+            dict with 'success', 'tweets' list or 'error'
+        """
+        backend_result = self._read_backend_user_call("user_tweets", limit=limit)
+        if backend_result is not None:
+            return backend_result
+
+        if not self.validate_credentials():
+            return {"success": False, "error": "Missing credentials"}
+
+        # First get user ID
+        user_info = self._own_user()
+        if not user_info.get("success"):
+            return user_info
+
+        oauth = self._get_session()
+        url = self.USER_TWEETS_ENDPOINT.format(user_id=user_info["id"])
+        response = oauth.get(
+            url,
+            params={
+                "max_results": max(5, min(limit, 100)),  # Twitter API requires 5-100
+                "tweet.fields": "created_at,public_metrics,text",
+            },
+        )
+
+        if response.status_code == 200:
+            data = response.json()
+            tweets = []
+            for tweet in data.get("data", []):
+                metrics = tweet.get("public_metrics", {})
+                tweets.append(
+                    {
+                        "id": tweet["id"],
+                        "text": tweet["text"],
+                        "created_at": tweet.get("created_at"),
+                        "likes": metrics.get("like_count", 0),
+                        "retweets": metrics.get("retweet_count", 0),
+                        "replies": metrics.get("reply_count", 0),
+                        "url": f"https://x.com/i/web/status/{tweet['id']}",
+                    }
+                )
+            return {"success": True, "tweets": tweets, "count": len(tweets)}
+        return {"success": False, "error": f"{response.status_code}: {response.text}"}
+
+    def mentions(self, limit: int = 10) -> dict:
+        """
+        Get recent mentions of the user.
+
+        Args:
+            limit: Maximum number of mentions to return (max 100)
+
+        Returns:
+            dict with 'success', 'mentions' list or 'error'
+        """
+        backend_result = self._read_backend_user_call("mentions", limit=limit)
+        if backend_result is not None:
+            return backend_result
+
+        if not self.validate_credentials():
+            return {"success": False, "error": "Missing credentials"}
+
+        # First get user ID
+        user_info = self._own_user()
+        if not user_info.get("success"):
+            return user_info
+
+        oauth = self._get_session()
+        url = self.USER_MENTIONS_ENDPOINT.format(user_id=user_info["id"])
+        response = oauth.get(
+            url,
+            params={
+                "max_results": max(5, min(limit, 100)),  # Twitter API requires 5-100
+                "tweet.fields": "created_at,public_metrics,text,author_id",
+                "expansions": "author_id",
+                "user.fields": "username,name",
+            },
+        )
+
+        if response.status_code == 200:
+            data = response.json()
+            # Build user lookup
+            users = {}
+            for user in data.get("includes", {}).get("users", []):
+                users[user["id"]] = user
+
+            mentions = []
+            for tweet in data.get("data", []):
+                author = users.get(tweet.get("author_id"), {})
+                mentions.append(
+                    {
+                        "id": tweet["id"],
+                        "text": tweet["text"],
+                        "created_at": tweet.get("created_at"),
+                        "author_id": tweet.get("author_id"),
+                        "author_username": author.get("username"),
+                        "author_name": author.get("name"),
+                        "url": f"https://x.com/i/web/status/{tweet['id']}",
+                    }
+                )
+            return {"success": True, "mentions": mentions, "count": len(mentions)}
+        return {"success": False, "error": f"{response.status_code}: {response.text}"}
+
+    def replies(self, limit: int = 10) -> dict:
+        """
+        Get recent replies to the user's tweets.
+
+        Args:
+            limit: Maximum number of replies to return (max 100)
+
+        Returns:
+            dict with 'success', 'replies' list or 'error'
+        """
+        backend_result = self._read_backend_user_call("replies", limit=limit)
+        if backend_result is not None:
+            return backend_result
+
+        if not self.validate_credentials():
+            return {"success": False, "error": "Missing credentials"}
+
+        # First get user info
+        user_info = self._own_user()
+        if not user_info.get("success"):
+            return user_info
+
+        oauth = self._get_session()
+        # Search for replies to this user (excluding own tweets)
+        query = f"to:{user_info['username']} -from:{user_info['username']}"
+        response = oauth.get(
+            self.SEARCH_ENDPOINT,
+            params={
+                "query": query,
+                "max_results": max(10, min(limit, 100)),  # Search requires 10-100
+                "tweet.fields": "created_at,public_metrics,text,author_id,in_reply_to_user_id,conversation_id",
+                "expansions": "author_id",
+                "user.fields": "username,name",
+            },
+        )
+
+        if response.status_code == 200:
+            data = response.json()
+            # Build user lookup
+            users = {}
+            for user in data.get("includes", {}).get("users", []):
+                users[user["id"]] = user
+
+            replies = []
+            for tweet in data.get("data", []):
+                author = users.get(tweet.get("author_id"), {})
+                metrics = tweet.get("public_metrics", {})
+                replies.append(
+                    {
+                        "id": tweet["id"],
+                        "text": tweet["text"],
+                        "created_at": tweet.get("created_at"),
+                        "author_id": tweet.get("author_id"),
+                        "author_username": author.get("username"),
+                        "author_name": author.get("name"),
+                        "conversation_id": tweet.get("conversation_id"),
+                        "likes": metrics.get("like_count", 0),
+                        "retweets": metrics.get("retweet_count", 0),
+                        "url": f"https://x.com/i/web/status/{tweet['id']}",
+                    }
+                )
+            return {"success": True, "replies": replies, "count": len(replies)}
+        return {"success": False, "error": f"{response.status_code}: {response.text}"}
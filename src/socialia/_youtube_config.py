@@ -0,0 +1,476 @@
+"""YouTube upload configs: YAML loading, directory scans and SciTeX presets."""
+
+import functools
+import os
+from collections import defaultdict
+from pathlib import Path
+from typing import Optional
+
+
+@functools.cache
+def _yaml():
+    """Import PyYAML on first use; return ``(yaml, Loader, Dumper)``.
+
+    Prefers the libyaml bindings and falls back to the pure-Python
+    implementation. Building a batch from an in-memory dict never pays
+    the import.
+    """
+    import yaml
+
+    return (
+        yaml,
+        getattr(yaml, "CSafeLoader", yaml.SafeLoader),
+        getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+    )
+
+
+# Default video presets for common use cases
+PRESETS = {
+    "scitex-demo": {
+        "category_id": "28",  # Science & Technology
+        "privacy_status": "unlisted",
+        "default_tags": [
+            "scitex",
+            "AI research",
+            "research automation",
+            "scientific computing",
+            "MCP",
+            "Claude AI",
+        ],
+    },
+    "tutorial": {
+        "category_id": "27",  # Education
+        "privacy_status": "unlisted",
+        "default_tags": ["tutorial", "how-to", "guide"],
+    },
+    "presentation": {
+        "category_id": "28",  # Science & Technology
+        "privacy_status": "unlisted",
+        "default_tags": ["presentation", "conference", "talk"],
+    },
+}
+
+
+def load_video_config(config_path: str) -> dict:
+    """
+    Load video upload configuration from YAML file.
+
+    Expected YAML format:
+    ```yaml
+    defaults:
+      category_id: "28"
+      privacy_status: unlisted
+      tags:
+        - scitex
+        - research
+
+    videos:
+      - path: /path/to/video.mp4
+        title: Video Title
+        description: |
+          Multi-line description
+          with details
+        tags:
+          - extra-tag
+      - path: /path/to/another.mp4
+        title: Another Video
+    ```
+    """
+    yaml, loader, _ = _yaml()
+    # Bytes go straight to libyaml, which detects the encoding itself.
+    with open(config_path, "rb") as f:
+        return yaml.load(f, Loader=loader)
+
+
+def load_defaults_only(config_path: str) -> dict:
+    """
+    Load just the ``defaults`` mapping from a video upload config.
+
+    The file is scanned as a YAML event stream: the ``videos`` list is
+    skipped without being built, so a caller that only needs the defaults
+    does not pay for constructing thousands of video entries.
+
+    Returns:
+        The ``defaults`` dict, or ``{}`` if the config has none.
+    """
+    yaml, loader, _ = _yaml()
+    with open(config_path, "rb") as f:
+        events = yaml.parse(f, Loader=loader)
+        for event in events:
+            if isinstance(event, yaml.MappingStartEvent):
+                break
+            if isinstance(event, (yaml.SequenceStartEvent, yaml.ScalarEvent)):
+                return {}
+        else:
+            return {}
+
+        for key in events:
+            if isinstance(key, yaml.MappingEndEvent):
+                break
+            if not isinstance(key, yaml.ScalarEvent):
+                _take_node(yaml, key, events)
+            value = _take_node(yaml, next(events), events)
+            if isinstance(key, yaml.ScalarEvent) and key.value == "defaults":
+                if any(isinstance(event, yaml.AliasEvent) for event in value):
+                    # The anchor may live outside ``defaults``; only a full
+                    # load can resolve it.
+                    return load_video_config(config_path).get("defaults") or {}
+                document = yaml.emit(
+                    [
+                        yaml.StreamStartEvent(),
+                        yaml.DocumentStartEvent(),
+                        *value,
+                        yaml.DocumentEndEvent(),
+                        yaml.StreamEndEvent(),
+                    ]
+                )
+                return yaml.load(document, Loader=loader) or {}
+    return {}
+
+
+def _take_node(yaml, first, events) -> list:
+    """Consume the events of the node starting at *first* and return them."""
+    taken = [first]
+    depth = int(isinstance(first, yaml.CollectionStartEvent))
+    while depth:
+        event = next(events)
+        taken.append(event)
+        if isinstance(event, yaml.CollectionStartEvent):
+            depth += 1
+        elif isinstance(event, yaml.CollectionEndEvent):
+            depth -= 1
+    return taken
+
+
+# Filename separators turned into spaces when deriving a video title
+_TITLE_TRANS = str.maketrans({"-": " ", "_": " "})
+
+
+def _title_from_path(path: str) -> str:
+    """Turn a file name into a title (``my-demo_v2.mp4`` -> ``My Demo V2``)."""
+    return os.path.splitext(os.path.basename(path))[0].translate(_TITLE_TRANS).title()
+
+
+def _dump_config(config: dict, output_path: str) -> None:
+    """Write *config* to *output_path* as block-style UTF-8 YAML.
+
+    The document is rendered in one go and written with a single call;
+    non-ASCII text (box drawing, accents) is kept as-is rather than escaped.
+    """
+    yaml, _, dumper = _yaml()
+    data = yaml.dump(
+        config,
+        Dumper=dumper,
+        default_flow_style=False,
+        sort_keys=False,
+        allow_unicode=True,
+    )
+    Path(output_path).write_text(data, encoding="utf-8")
+
+
+def _iter_mp4s(root: str):
+    """Yield paths of ``.mp4`` files under *root*, walking with ``os.scandir``.
+
+    ``DirEntry`` caches the file type from the directory listing, so entries
+    are classified without an extra ``stat`` per file.
+    """
+    stack = [root]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            # Missing or unreadable directories are skipped, as Path.glob does.
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".mp4") and entry.is_file():
+                    yield entry.path
+
+
+def _existing_paths(paths) -> set:
+    """Return the subset of *paths* that exist.
+
+    Paths are grouped by parent directory and each directory is listed once
+    with ``os.scandir``; a name found in the listing counts as present
+    without a ``stat``. Any miss (case-insensitive filesystems, symlinks,
+    unlistable directories) is settled by ``os.path.exists`` as before.
+    """
+    by_parent = defaultdict(list)
+    for path in paths:
+        if path:
+            by_parent[os.path.dirname(path)].append(path)
+
+    present = set()
+    for parent, group in by_parent.items():
+        try:
+            with os.scandir(parent or ".") as entries:
+                names = {entry.name for entry in entries if not entry.is_symlink()}
+        except OSError:
+            names = set()
+        present.update(
+            p for p in group if os.path.basename(p) in names or os.path.exists(p)
+        )
+    return present
+
+
+def generate_config_from_directory(
+    directory: str,
+    preset: str = "scitex-demo",
+    output_path: Optional[str] = None,
+) -> dict:
+    """
+    Scan directory for MP4 files and generate upload config.
+
+    Args:
+        directory: Path to directory containing MP4 files
+        preset: Preset name for default settings
+        output_path: Optional path to save YAML config
+
+    Returns:
+        dict with generated configuration
+    """
+    # Sort on path components, the way Path objects order.
+    mp4_files = sorted(_iter_mp4s(str(Path(directory))), key=lambda p: p.split(os.sep))
+
+    preset_config = PRESETS.get(preset, PRESETS["scitex-demo"])
+
+    config = {
+        "defaults": {
+            "category_id": preset_config["category_id"],
+            "privacy_status": preset_config["privacy_status"],
+            "tags": preset_config["default_tags"],
+        },
+        "videos": [
+            {
+                "path": mp4,
+                "title": (name := _title_from_path(mp4)),
+                "description": f"Demo video: {name}",
+                "tags": [],
+            }
+            for mp4 in mp4_files
+        ],
+    }
+
+    if output_path:
+        _dump_config(config, output_path)
+
+    return config
+
+
+# Standard footer for all SciTeX demo videos
+_CROSS_REFERENCES = """
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+🔬 SciTeX Demo Series
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+▶ Automated Research Demo (40 min) - Full AI-driven research workflow
+▶ CrossRef Local Demo - 167M+ papers local database
+▶ FigRecipe Demo - Publication-ready figures
+▶ SciTeX Writer Demo - LaTeX manuscript compilation
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+📚 Resources
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+🌐 Website: https://scitex.ai
+📺 All Demos: https://scitex.ai/demos/
+💻 GitHub: https://github.com/ywatanabe1989/scitex
+📖 Documentation: https://scitex.ai/docs/
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+🏷️ Tags
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+#SciTeX #AI #Research #Automation #Science #MCP #ClaudeAI #Python
+#MachineLearning #DataScience #AcademicWriting #ScientificComputing
+"""
+
+# SciTeX demo video metadata, keyed by filename (see create_scitex_config)
+_SCITEX_VIDEOS = {
+    "scitex-automated-research-demo.mp4": {
+        "title": "SciTeX: Automated Research by AI Agent | 40-min Full Demo",
+        "description": f"""🤖 AI agent conducting a COMPLETE research workflow with minimal human intervention.
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+📋 Overview
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+This demo showcases an AI agent leveraging the SciTeX MCP (Model Context Protocol) server to execute an entire research pipeline autonomously.
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+✨ What the AI Agent Does
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+📚 Literature discovery and retrieval
+📊 Data analysis (3×3 factorial design, N=180)
+📈 Statistical testing (ANOVA + post-hoc comparisons)
+🎨 Generation of 4 publication-ready figures
+📝 Creation of a 21-page manuscript
+✍️ Peer review response preparation
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+⏱️ Duration: 40 minutes
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+{_CROSS_REFERENCES}""",
+        "tags": [
+            "automated research",
+            "AI agent",
+            "manuscript generation",
+            "full demo",
+        ],
+        "priority": 1,
+    },
+    "crossref-local-v0.3.1-demo.mp4": {
+        "title": "CrossRef Local v0.3.1 | 167M+ Academic Papers Database Demo",
+        "description": f"""📚 Local database with 167M+ academic papers for lightning-fast literature search.
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+📋 Overview
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+CrossRef Local brings the entire CrossRef database to your local machine, enabling instant full-text search across 167M+ academic papers without API rate limits.
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+✨ Features
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+🔍 Full-text search across paper metadata
+🔗 Fast DOI lookup and resolution
+📊 Citation count enrichment
+💾 Local caching for offline use
+⚡ No API rate limits
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+💻 GitHub: https://github.com/ywatanabe1989/crossref-local
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+{_CROSS_REFERENCES}""",
+        "tags": [
+            "crossref",
+            "literature database",
+            "doi lookup",
+            "academic search",
+        ],
+        "priority": 2,
+    },
+    "figrecipe-v0.14.0-demo.mp4": {
+        "title": "FigRecipe v0.14.0 | Publication-Ready Scientific Figures Demo",
+        "description": f"""🎨 Create publication-ready scientific figures with automatic data export.
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+📋 Overview
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+FigRecipe is a declarative figure generation library that creates publication-quality plots while automatically exporting the underlying data for reproducibility.
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+✨ Features
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+📐 Declarative figure specification
+📁 Automatic CSV export for reproducibility
+📊 20+ plot types supported
+🎭 Publication-ready styling
+🔧 Matplotlib-based, highly customizable
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+💻 GitHub: https://github.com/ywatanabe1989/figrecipe
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+{_CROSS_REFERENCES}""",
+        "tags": [
+            "data visualization",
+            "matplotlib",
+            "publication figures",
+            "reproducibility",
+        ],
+        "priority": 3,
+    },
+    "scitex-writer-v2.2.0-demo.mp4": {
+        "title": "SciTeX Writer v2.2.0 | LaTeX Manuscript Compilation Demo",
+        "description": f"""📝 Automated LaTeX manuscript compilation with figure and bibliography management.
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+📋 Overview
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+SciTeX Writer automates the entire manuscript compilation process, from organizing figures and tables to managing bibliographies and generating multiple output formats.
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+✨ Features
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+📊 Automatic figure and table management
+📚 BibTeX bibliography integration
+📄 Multiple output formats (PDF, DOCX)
+📋 Journal template support
+🔄 Revision tracking and diff generation
+✍️ Peer review response automation
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+{_CROSS_REFERENCES}""",
+        "tags": ["latex", "manuscript", "academic writing", "bibliography"],
+        "priority": 4,
+    },
+}
+
+
+def create_scitex_config(
+    video_dir: str = "/home/ywatanabe/proj/scitex-cloud/media/videos",
+    output_path: Optional[str] = None,
+) -> dict:
+    """
+    Create upload configuration for SciTeX demo videos.
+
+    Args:
+        video_dir: Directory containing demo videos
+        output_path: Optional path to save YAML config
+
+    Returns:
+        Configuration dict
+    """
+    config = {
+        "defaults": {
+            "category_id": "28",  # Science & Technology
+            "privacy_status": "unlisted",
+            "tags": [
+                "scitex",
+                "AI research",
+                "research automation",
+                "scientific computing",
+                "MCP",
+                "Model Context Protocol",
+                "Claude AI",
+                "python",
+            ],
+        },
+        "videos": [],
+    }
+
+    video_dir = Path(video_dir)
+
+    # One directory listing instead of a stat per candidate file
+    try:
+        with os.scandir(video_dir) as entries:
+            present = {entry.name for entry in entries if entry.is_file()}
+    except OSError:
+        present = set()
+
+    # Add videos with metadata, sorted by priority
+    config["videos"] = [
+        {
+            "path": str(video_dir / filename),
+            "title": meta["title"],
+            "description": meta["description"],
+            "tags": list(meta["tags"]),
+        }
+        for filename, meta in sorted(
+            _SCITEX_VIDEOS.items(), key=lambda x: x[1].get("priority", 99)
+        )
+        if filename in present
+    ]
+
+    if output_path:
+        _dump_config(config, output_path)
+
+    return config
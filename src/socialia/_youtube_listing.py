@@ -0,0 +1,125 @@
+"""Listing a YouTube channel's uploads, with batched statistics lookups."""
+
+__all__ = ["YouTubeListingMixin"]
+
+from typing import Optional
+
+from ._youtube_transport import _MAX_IDS_PER_CALL, _google_api, _requires_client
+
+
+class YouTubeListingMixin:
+    """Mixin providing upload listing for ``YouTube``."""
+
+    @_requires_client
+    def list_videos(self, max_results: int = 10, include_stats: bool = False) -> dict:
+        """List user's uploaded videos.
+
+        Args:
+            max_results: Maximum number of videos to return. More than 50 are
+                fetched page by page.
+            include_stats: Also fetch view/like/comment counts and privacy
+                status, looked up 50 videos per ``videos.list`` call rather
+                than one call per video.
+
+        Returns:
+            dict with videos list or error
+        """
+        youtube = self._youtube
+        try:
+            uploads_id = self._get_uploads_playlist_id(youtube)
+            if not uploads_id:
+                return {"success": False, "error": "No channel found"}
+
+            videos = []
+            page_token = None
+            while len(videos) < max_results:
+                try:
+                    videos_response = (
+                        youtube.playlistItems()
+                        .list(
+                            part="snippet",
+                            playlistId=uploads_id,
+                            maxResults=min(
+                                _MAX_IDS_PER_CALL, max_results - len(videos)
+                            ),
+                            pageToken=page_token,
+                            fields="nextPageToken,items(snippet(title,description,"
+                            "publishedAt,resourceId/videoId))",
+                        )
+                        .execute()
+                    )
+                except _google_api().HttpError as e:
+                    # A stale cached playlist id: look it up again next time.
+                    if e.resp.status == 404:
+                        self._uploads_playlist_id = None
+                    raise
+
+                for item in videos_response.get("items", []):
+                    snippet = item["snippet"]
+                    video_id = snippet["resourceId"]["videoId"]
+                    videos.append(
+                        {
+                            "id": video_id,
+                            "title": snippet["title"],
+                            "description": snippet.get("description", "")[:100],
+                            "published_at": snippet["publishedAt"],
+                            "url": f"https://www.youtube.com/watch?v={video_id}",
+                        }
+                    )
+                page_token = videos_response.get("nextPageToken")
+                if not page_token:
+                    break
+
+            if include_stats and videos:
+                self._add_video_stats(youtube, videos)
+
+            return {"success": True, "videos": videos, "count": len(videos)}
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+    def _get_uploads_playlist_id(self, youtube) -> Optional[str]:
+        """Return the channel's uploads playlist id, cached per instance."""
+        if self._uploads_playlist_id is None:
+            channels = (
+                youtube.channels()
+                .list(
+                    part="contentDetails",
+                    mine=True,
+                    fields="items(contentDetails/relatedPlaylists/uploads)",
+                )
+                .execute()
+            )
+            if not channels.get("items"):
+                return None
+            self._uploads_playlist_id = channels["items"][0]["contentDetails"][
+                "relatedPlaylists"
+            ]["uploads"]
+        return self._uploads_playlist_id
+
+    def _add_video_stats(self, youtube, videos: list) -> None:
+        """Merge statistics and privacy status into *videos*.
+
+        Ids are looked up ``_MAX_IDS_PER_CALL`` at a time, the most a single
+        ``videos.list`` call accepts.
+        """
+        items = {}
+        for start in range(0, len(videos), _MAX_IDS_PER_CALL):
+            batch = videos[start : start + _MAX_IDS_PER_CALL]
+            response = (
+                youtube.videos()
+                .list(
+                    part="statistics,status",
+                    id=",".join(v["id"] for v in batch),
+                    fields="items(id,statistics(viewCount,likeCount,commentCount),"
+                    "status/privacyStatus)",
+                )
+                .execute()
+            )
+            items.update((item["id"], item) for item in response.get("items", []))
+        for video in videos:
+            item = items.get(video["id"], {})
+            video_stats = item.get("statistics", {})
+            video["views"] = int(video_stats.get("viewCount", 0))
+            video["likes"] = int(video_stats.get("likeCount", 0))
+            video["comments"] = int(video_stats.get("commentCount", 0))
+            video["privacy_status"] = item.get("status", {}).get("privacyStatus")
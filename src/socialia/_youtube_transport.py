@@ -0,0 +1,290 @@
+"""Google client loading, upload transport and credential helpers for YouTube.
+
+Shared by ``youtube.YouTube`` and its ``_youtube_update`` mixin; nothing
+here is public API.
+"""
+
+import datetime
+import functools
+import importlib.util
+import json
+import mmap
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Optional
+
+from scitex_dev import try_import_optional
+
+if TYPE_CHECKING:
+    from google.oauth2.credentials import Credentials
+
+# The Google client stack costs a few hundred milliseconds to import, so only
+# probe for it here and defer the real imports to the first API call.
+HAS_YOUTUBE = all(
+    importlib.util.find_spec(name) is not None
+    for name in (
+        "googleapiclient",
+        "google_auth_oauthlib",
+        "google_auth_httplib2",
+        "httplib2",
+    )
+)
+
+
+# orjson is an optional speed-up for token, API-request and API-response JSON.
+orjson = try_import_optional("orjson", extra="youtube", pkg="orjson")
+
+
+def _json_loads(data):
+    """Parse JSON *data* with orjson when installed, else the stdlib."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _fast_json_model(base: type) -> type:
+    """Subclass googleapiclient's ``JsonModel`` to use orjson both ways."""
+    if orjson is None:
+        return base
+
+    class _OrjsonModel(base):
+        def serialize(self, body_value):
+            if (
+                isinstance(body_value, dict)
+                and "data" not in body_value
+                and self._data_wrapper
+            ):
+                body_value = {"data": body_value}
+            try:
+                # Batch requests splice the body into a text MIME part, so
+                # keep returning str like the stdlib model does.
+                return orjson.dumps(body_value).decode()
+            except orjson.JSONEncodeError:
+                return super().serialize(body_value)
+
+        def deserialize(self, content):
+            try:
+                body = orjson.loads(content)
+            except orjson.JSONDecodeError:
+                return super().deserialize(content)
+            if self._data_wrapper and "data" in body:
+                body = body["data"]
+            return body
+
+    return _OrjsonModel
+
+
+_google_lock = threading.Lock()
+_google: Optional[SimpleNamespace] = None
+
+
+def _google_api() -> SimpleNamespace:
+    """Import the Google client symbols on first use and cache them."""
+    global _google
+    if _google is None:
+        with _google_lock:
+            if _google is None:
+                import google_auth_httplib2
+                import httplib2
+                from google.auth.transport.requests import Request
+                from google.oauth2.credentials import Credentials
+                from google_auth_oauthlib.flow import InstalledAppFlow
+                from googleapiclient.discovery import build_from_document
+                from googleapiclient.discovery_cache import get_static_doc
+                from googleapiclient.errors import HttpError
+                from googleapiclient.http import MediaFileUpload, MediaIoBaseUpload
+                from googleapiclient.model import JsonModel
+
+                _google = SimpleNamespace(
+                    Credentials=Credentials,
+                    InstalledAppFlow=InstalledAppFlow,
+                    Request=Request,
+                    build_from_document=build_from_document,
+                    get_static_doc=get_static_doc,
+                    HttpError=HttpError,
+                    MediaFileUpload=MediaFileUpload,
+                    MediaIoBaseUpload=MediaIoBaseUpload,
+                    AuthorizedHttp=google_auth_httplib2.AuthorizedHttp,
+                    httplib2=httplib2,
+                    JsonModel=_fast_json_model(JsonModel),
+                )
+    return _google
+
+
+@functools.cache
+def _youtube_discovery() -> dict:
+    """Parse the YouTube v3 discovery document bundled with googleapiclient.
+
+    ``build()`` would re-read and re-parse this ~400 KB file for every client;
+    the parsed document is shared by all ``YouTube`` instances instead.
+    """
+    return _json_loads(_google_api().get_static_doc("youtube", "v3"))
+
+
+# Parts written by videos.insert and read back before a merged videos.update.
+_VIDEO_PARTS = "snippet,status"
+
+# Upper bound on ids per videos.list call and items per playlistItems page.
+_MAX_IDS_PER_CALL = 50
+
+
+# Resumable-upload chunks must be multiples of 256 KiB.
+_CHUNK_ALIGN = 256 * 1024
+_MIN_CHUNK = 1024 * 1024
+_MAX_CHUNK = 32 * 1024 * 1024
+
+
+def _upload_chunksize(size: int) -> int:
+    """Pick a chunk size giving roughly ten round trips for a *size*-byte file."""
+    chunk = -(-size // 10 // _CHUNK_ALIGN) * _CHUNK_ALIGN
+    return min(max(chunk, _MIN_CHUNK), _MAX_CHUNK)
+
+
+class _ReadAheadMap:
+    """Seekable view of an upload mmap that prefetches the next chunk.
+
+    googleapiclient seeks to the start of each chunk before reading it.
+    At that point the following chunk is handed to
+    ``madvise(MADV_WILLNEED)``, so the kernel reads it from disk while the
+    current chunk is on the wire. Chunk offsets are multiples of
+    ``_CHUNK_ALIGN`` and therefore page aligned, as madvise requires.
+    """
+
+    def __init__(self, mm: mmap.mmap, chunksize: int) -> None:
+        self._mm = mm
+        self._chunksize = chunksize
+        self._size = len(mm)
+        self._advise = getattr(mm, "madvise", None)
+        if self._advise is not None and hasattr(mmap, "MADV_SEQUENTIAL"):
+            self._advise(mmap.MADV_SEQUENTIAL)
+
+    def seek(self, pos: int, whence: int = os.SEEK_SET) -> int:
+        self._mm.seek(pos, whence)
+        pos = self._mm.tell()
+        ahead = pos + self._chunksize
+        if (
+            self._advise is not None
+            and whence == os.SEEK_SET
+            and pos % self._chunksize == 0
+            and ahead < self._size
+        ):
+            self._advise(
+                mmap.MADV_WILLNEED, ahead, min(self._chunksize, self._size - ahead)
+            )
+        return pos
+
+    def tell(self) -> int:
+        return self._mm.tell()
+
+    def read(self, n: int = -1) -> bytes:
+        return self._mm.read(n)
+
+
+# Resumable-upload chunks are retried on these statuses / network errors.
+_RETRYABLE_STATUSES = frozenset({500, 502, 503, 504})
+_MAX_CHUNK_RETRIES = 7
+
+
+def _next_chunk_with_retry(request, http=None, sleep=time.sleep):
+    """Call ``request.next_chunk()``, retrying transient failures.
+
+    The resumable session lives server-side, so calling ``next_chunk()``
+    again resumes from the last byte YouTube acknowledged.
+    """
+    google = _google_api()
+    attempt = 0
+    while True:
+        try:
+            return request.next_chunk(http=http)
+        except google.HttpError as e:
+            if e.resp.status not in _RETRYABLE_STATUSES:
+                raise
+            error = e
+        except (google.httplib2.HttpLib2Error, ConnectionError) as e:
+            error = e
+        attempt += 1
+        if attempt > _MAX_CHUNK_RETRIES:
+            raise error
+        sleep(min(64, 2**attempt) + random.random())
+
+
+# Cached credentials are re-checked this many seconds before they expire.
+_EXPIRY_MARGIN = 60
+
+
+def _good_until(creds) -> float:
+    """Return the ``time.monotonic()`` deadline for trusting *creds* unchecked."""
+    expiry = getattr(creds, "expiry", None)
+    if expiry is None:
+        return 0.0
+    # google-auth stores expiry as a naive UTC datetime.
+    now = datetime.datetime.now(datetime.UTC).replace(tzinfo=None)
+    remaining = (expiry - now).total_seconds() - _EXPIRY_MARGIN
+    return time.monotonic() + remaining if remaining > 0 else 0.0
+
+
+# Credentials loaded by any YouTube instance, keyed by absolute token file
+# path, so later instances in the same process skip re-reading and
+# re-refreshing the token.
+_CRED_CACHE: dict[str, "Credentials"] = {}
+
+
+# Thumbnails are optional, so post() hands them to a small background pool
+# instead of blocking on a second upload.
+_THUMB_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="yt-thumb")
+
+
+def _set_thumbnail(youtube, video_id: str, thumbnail_path: str, http) -> Optional[str]:
+    """Upload a custom thumbnail; return why it failed, or None.
+
+    Thumbnails are optional, so a failure never fails the video upload.
+    """
+    google = _google_api()
+    try:
+        youtube.thumbnails().set(
+            videoId=video_id,
+            media_body=google.MediaFileUpload(thumbnail_path),
+        ).execute(http=http)
+    except (google.HttpError, google.httplib2.HttpLib2Error, OSError) as e:
+        return str(e)
+    return None
+
+
+def _settle_thumbnail(result: dict) -> dict:
+    """Wait for *result*'s background thumbnail, if any, and record failure.
+
+    Replaces ``thumbnail_future`` with ``thumbnail_error`` (only when the
+    upload failed), leaving *result* JSON-serializable. Returns *result*.
+    """
+    future = result.pop("thumbnail_future", None)
+    if future is not None:
+        error = future.result()
+        if error:
+            result["thumbnail_error"] = error
+    return result
+
+
+def _requires_client(method):
+    """Run *method* only once the YouTube client is available.
+
+    Otherwise the usual error dict is returned. Once the client is built,
+    the check is a single cached attribute lookup, and the method body
+    reads it from ``self._youtube``.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not HAS_YOUTUBE:
+            return {"success": False, "error": "YouTube libraries not installed"}
+        if self._youtube is None:
+            if not self.validate_credentials():
+                return {"success": False, "error": "Missing credentials"}
+            if not self._get_client():
+                return {"success": False, "error": "Could not create YouTube client"}
+        return method(self, *args, **kwargs)
+
+    return wrapper
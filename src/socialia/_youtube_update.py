@@ -0,0 +1,293 @@
+"""YouTube video metadata updates and playlist inserts."""
+
+__all__ = ["YouTubeUpdateMixin"]
+
+from typing import Optional
+
+from ._youtube_transport import _MAX_IDS_PER_CALL, _VIDEO_PARTS, _requires_client
+
+# Mutable snippet/status fields read back before a merged videos.update.
+_UPDATE_FETCH_ITEM_FIELDS = (
+    "snippet(title,description,tags,categoryId,defaultLanguage),"
+    "status(privacyStatus,embeddable,license,publicStatsViewable,publishAt,"
+    "selfDeclaredMadeForKids,containsSyntheticMedia)"
+)
+_UPDATE_FETCH_FIELDS = f"items({_UPDATE_FETCH_ITEM_FIELDS})"
+# Several videos per videos.list call need the id to match items back up.
+_UPDATE_BULK_FETCH_FIELDS = f"items(id,{_UPDATE_FETCH_ITEM_FIELDS})"
+
+
+def _video_update_body(
+    video_id: str,
+    current: Optional[dict] = None,
+    title: Optional[str] = None,
+    description: Optional[str] = None,
+    tags: Optional[list] = None,
+    privacy_status: Optional[str] = None,
+    category_id: Optional[str] = None,
+    replace_parts: bool = False,
+) -> Optional[dict]:
+    """Build the ``videos.update`` body for the given changes.
+
+    *current* is the video's fetched snippet/status item. ``None`` is
+    returned when it is needed but has not been supplied, i.e. unless
+    *replace_parts* allows sending the changes as whole parts (see
+    ``YouTubeUpdateMixin.update``).
+    """
+    snippet_changed = bool(title or description or tags or category_id)
+    if replace_parts and privacy_status and not snippet_changed:
+        return {"id": video_id, "status": {"privacyStatus": privacy_status}}
+    if replace_parts and title and category_id and not privacy_status:
+        snippet = {"title": title, "categoryId": category_id}
+        if description:
+            snippet["description"] = description
+        if tags:
+            snippet["tags"] = tags
+        return {"id": video_id, "snippet": snippet}
+    if current is None:
+        return None
+
+    snippet = dict(current["snippet"])
+    status = dict(current["status"])
+
+    if title:
+        snippet["title"] = title
+    if description:
+        snippet["description"] = description
+    if tags:
+        snippet["tags"] = tags
+    if category_id:
+        snippet["categoryId"] = category_id
+    if privacy_status:
+        status["privacyStatus"] = privacy_status
+
+    body = {"id": video_id}
+    if snippet_changed or not privacy_status:
+        body["snippet"] = snippet
+    if privacy_status or not snippet_changed:
+        body["status"] = status
+    return body
+
+
+def _update_part(body: dict) -> str:
+    """Return the ``part`` parameter naming the parts present in *body*."""
+    return ",".join(p for p in ("snippet", "status") if p in body)
+
+
+class YouTubeUpdateMixin:
+    """Mixin providing metadata updates and playlist inserts for ``YouTube``."""
+
+    @_requires_client
+    def update(
+        self,
+        video_id: str,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        tags: Optional[list] = None,
+        privacy_status: Optional[str] = None,
+        category_id: Optional[str] = None,
+        replace_parts: bool = False,
+    ) -> dict:
+        """Update video metadata.
+
+        The current snippet/status is fetched, the new values are merged
+        into it, and only the parts that change are sent back.
+
+        With ``replace_parts=True`` the fetch is skipped when the changes
+        name a whole part on their own (``privacy_status`` alone, or
+        ``title`` with ``category_id``). YouTube replaces a part wholesale,
+        so every other writable field of that part (e.g. publishAt,
+        description, tags) is cleared; only opt in when that is intended.
+
+        Args:
+            video_id: YouTube video ID
+            title: New title (optional)
+            description: New description (optional)
+            tags: New tags (optional)
+            privacy_status: New privacy status (optional)
+            category_id: New category ID (optional)
+            replace_parts: Send the changes as whole parts without fetching
+                the current metadata (clears omitted fields)
+
+        Returns:
+            dict with 'success' or 'error'
+        """
+        youtube = self._youtube
+
+        changes = {
+            "title": title,
+            "description": description,
+            "tags": tags,
+            "privacy_status": privacy_status,
+            "category_id": category_id,
+            "replace_parts": replace_parts,
+        }
+        try:
+            body = _video_update_body(video_id, **changes)
+            if body is None:
+                # Every mutable field is requested, because whatever is left
+                # out of the PUT below would be cleared by YouTube.
+                current = (
+                    youtube.videos()
+                    .list(
+                        part=_VIDEO_PARTS,
+                        id=video_id,
+                        fields=_UPDATE_FETCH_FIELDS,
+                    )
+                    .execute()
+                )
+                if not current.get("items"):
+                    return {"success": False, "error": f"Video not found: {video_id}"}
+                body = _video_update_body(video_id, current["items"][0], **changes)
+
+            youtube.videos().update(
+                part=_update_part(body), body=body, fields="id"
+            ).execute()
+
+            return {
+                "success": True,
+                "id": video_id,
+                "url": f"https://www.youtube.com/watch?v={video_id}",
+            }
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+    @_requires_client
+    def update_many(self, updates: list[dict]) -> dict:
+        """Update metadata of several videos with batched API calls.
+
+        Videos whose current metadata must be merged (see ``update``) are
+        fetched ``_MAX_IDS_PER_CALL`` ids per ``videos.list`` call, and the
+        updates go out in batch HTTP requests of the same size, so N
+        updates cost about 2 * N / 50 round trips instead of up to 2 * N.
+
+        Args:
+            updates: One dict per video with 'video_id' plus any of
+                ``update``'s keyword arguments
+
+        Returns:
+            dict with 'success' (all updates succeeded) and 'results', one
+            ``update``-style result per entry in the same order, or 'error'
+        """
+        youtube = self._youtube
+        changes = [
+            {k: v for k, v in update.items() if k != "video_id"} for update in updates
+        ]
+        video_ids = [update["video_id"] for update in updates]
+        bodies = [_video_update_body(v, **c) for v, c in zip(video_ids, changes)]
+        results: list[Optional[dict]] = [None] * len(updates)
+
+        def _collect(request_id, response, exception):
+            i = int(request_id)
+            if exception is None:
+                results[i] = {
+                    "success": True,
+                    "id": video_ids[i],
+                    "url": f"https://www.youtube.com/watch?v={video_ids[i]}",
+                }
+            else:
+                results[i] = {"success": False, "error": str(exception)}
+
+        try:
+            to_fetch = list(
+                dict.fromkeys(v for v, b in zip(video_ids, bodies) if b is None)
+            )
+            current = {}
+            for start in range(0, len(to_fetch), _MAX_IDS_PER_CALL):
+                response = (
+                    youtube.videos()
+                    .list(
+                        part=_VIDEO_PARTS,
+                        id=",".join(to_fetch[start : start + _MAX_IDS_PER_CALL]),
+                        fields=_UPDATE_BULK_FETCH_FIELDS,
+                    )
+                    .execute()
+                )
+                current.update((item["id"], item) for item in response.get("items", []))
+
+            for i, body in enumerate(bodies):
+                if body is not None:
+                    continue
+                if video_ids[i] in current:
+                    bodies[i] = _video_update_body(
+                        video_ids[i], current[video_ids[i]], **changes[i]
+                    )
+                else:
+                    results[i] = {
+                        "success": False,
+                        "error": f"Video not found: {video_ids[i]}",
+                    }
+
+            to_send = [i for i, body in enumerate(bodies) if body is not None]
+            for start in range(0, len(to_send), _MAX_IDS_PER_CALL):
+                batch = youtube.new_batch_http_request(callback=_collect)
+                for i in to_send[start : start + _MAX_IDS_PER_CALL]:
+                    batch.add(
+                        youtube.videos().update(
+                            part=_update_part(bodies[i]), body=bodies[i], fields="id"
+                        ),
+                        request_id=str(i),
+                    )
+                batch.execute()
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+        return {"success": all(r["success"] for r in results), "results": results}
+
+    @_requires_client
+    def add_to_playlist(self, playlist_id: str, video_ids: list[str]) -> dict:
+        """Append videos to a playlist.
+
+        Inserts go out ``_MAX_IDS_PER_CALL`` at a time, each group packed
+        into a single batch HTTP request rather than one round trip per
+        video. YouTube does not promise to run the requests of a batch in
+        order, so the resulting playlist order is not guaranteed; call
+        once per video when order matters.
+
+        Args:
+            playlist_id: YouTube playlist ID
+            video_ids: Video IDs to add
+
+        Returns:
+            dict with 'success', 'added' (video IDs) and 'errors'
+            (video ID and error message per failed insert)
+        """
+        youtube = self._youtube
+
+        results = {}
+
+        def _collect(request_id, response, exception):
+            results[int(request_id)] = exception
+
+        try:
+            for start in range(0, len(video_ids), _MAX_IDS_PER_CALL):
+                batch = youtube.new_batch_http_request(callback=_collect)
+                for i in range(start, min(start + _MAX_IDS_PER_CALL, len(video_ids))):
+                    batch.add(
+                        youtube.playlistItems().insert(
+                            part="snippet",
+                            body={
+                                "snippet": {
+                                    "playlistId": playlist_id,
+                                    "resourceId": {
+                                        "kind": "youtube#video",
+                                        "videoId": video_ids[i],
+                                    },
+                                }
+                            },
+                            fields="id",
+                        ),
+                        request_id=str(i),
+                    )
+                batch.execute()
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+        added = []
+        errors = []
+        for i, video_id in enumerate(video_ids):
+            if results.get(i) is None:
+                added.append(video_id)
+            else:
+                errors.append({"id": video_id, "error": str(results[i])})
+        return {"success": not errors, "added": added, "errors": errors}
@@ -11,6 +11,7 @@ from ..reddit import Reddit
 from ..slack import Slack
 from ..analytics import GoogleAnalytics
 from ..youtube import YouTube
+from .._youtube_transport import _settle_thumbnail
 
 
 def get_client(platform: str):
@@ -91,22 +92,12 @@ def cmd_post(args, output_json: bool = False) -> int:
 
     client = get_client(args.platform)
     if args.platform == "twitter":
-        media_ids = None
         image_path = getattr(args, "image", None)
-        if image_path:
-            upload_result = client.upload_media(str(image_path))
-            if upload_result["success"]:
-                media_ids = [upload_result["media_id"]]
-            else:
-                print(
-                    f"Error uploading image: {upload_result['error']}", file=sys.stderr
-                )
-                return 1
         result = client.post(
             text,
             reply_to=getattr(args, "reply_to", None),
             quote_tweet_id=getattr(args, "quote", None),
-            media_ids=media_ids,
+            media_paths=[str(image_path)] if image_path else None,
         )
     elif args.platform == "reddit":
         result = client.post(
@@ -123,15 +114,17 @@ def cmd_post(args, output_json: bool = False) -> int:
     elif args.platform == "youtube":
         video_path = getattr(args, "video", None)
         tags = getattr(args, "tags", None)
-        result = client.post(
-            text,
-            video_path=str(video_path) if video_path else None,
-            title=getattr(args, "title", None),
-            tags=tags.split(",") if tags else None,
-            privacy_status=getattr(args, "privacy", "public"),
-            thumbnail_path=str(getattr(args, "thumbnail", None))
-            if getattr(args, "thumbnail", None)
-            else None,
+        result = _settle_thumbnail(
+            client.post(
+                text,
+                video_path=str(video_path) if video_path else None,
+                title=getattr(args, "title", None),
+                tags=tags.split(",") if tags else None,
+                privacy_status=getattr(args, "privacy", "public"),
+                thumbnail_path=str(getattr(args, "thumbnail", None))
+                if getattr(args, "thumbnail", None)
+                else None,
+            )
         )
     else:
         result = client.post(text)
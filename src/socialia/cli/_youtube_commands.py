@@ -22,6 +22,7 @@ def cmd_youtube(args, output_json: bool = False) -> int:
 
 def cmd_youtube_batch(args, output_json: bool = False) -> int:
     """Handle batch upload command."""
+    from .._youtube_transport import _settle_thumbnail
     from ..youtube_batch import YouTubeBatch, create_scitex_config
 
     config_path = getattr(args, "config", None)
@@ -68,7 +69,7 @@ def cmd_youtube_batch(args, output_json: bool = False) -> int:
         if dry_run:
             print("  [DRY RUN]")
 
-        result = batch.upload_one(video, dry_run=dry_run)
+        result = _settle_thumbnail(batch.upload_one(video, dry_run=dry_run))
 
         if output_json:
             print(json.dumps(result, indent=2))
@@ -31,13 +31,15 @@ class LinkedIn(_Base):
     ):
         # ``http`` is an injectable requests-shaped HTTP client (anything
         # exposing ``get`` / ``post`` / ``delete``).  Production code leaves
-        # it ``None`` so we use the ``requests`` module.  Tests inject a
-        # hand-rolled fake to assert call shape without hitting the network.
+        # it ``None`` so we use a ``requests.Session``, whose keep-alive
+        # pool lets consecutive API calls reuse one TLS connection.  Tests
+        # inject a hand-rolled fake to assert call shape without hitting
+        # the network.
         self.access_token = access_token or get_env("LINKEDIN_ACCESS_TOKEN")
         self.client_id = client_id or get_env("LINKEDIN_CLIENT_ID")
         self.client_secret = client_secret or get_env("LINKEDIN_CLIENT_SECRET")
         self._user_urn: Optional[str] = None
-        self._http = http or requests
+        self._http = http or requests.Session()
 
     def _get_headers(self) -> dict:
         """Get headers for LinkedIn API requests."""
@@ -51,6 +51,7 @@ class OrgParser:
         r">"
     )
     PROPERTY_RE = re.compile(r":(\w+):\s*(.+)")
+    STARS_RE = re.compile(r"^(\*+\s+)")
     PROPERTY_DRAWER_START = ":PROPERTIES:"
     PROPERTY_DRAWER_END = ":END:"
 
@@ -160,7 +161,7 @@ class OrgParser:
             new_line = line.replace(draft.status, new_status, 1)
         else:
             # Insert status after asterisks
-            new_line = re.sub(r"^(\*+\s+)", rf"\1{new_status} ", line)
+            new_line = self.STARS_RE.sub(rf"\1{new_status} ", line)
         self.lines[draft.line_number] = new_line
         self.content = "\n".join(self.lines)
         self.filepath.write_text(self.content)
@@ -56,18 +56,13 @@ def add_human_fluctuation(
     return dt + timedelta(minutes=offset)
 
 
-def _ensure_schedule_file(schedule_file=None):
-    """Ensure schedule directory and file exist."""
-    sf = _resolve_schedule_file(schedule_file)
-    sf.parent.mkdir(parents=True, exist_ok=True)
-    if not sf.exists():
-        sf.write_text("[]")
-    return sf
-
-
 def _load_schedule(schedule_file=None) -> list:
-    """Load scheduled jobs."""
-    sf = _ensure_schedule_file(schedule_file)
+    """Load scheduled jobs.
+
+    A missing file means no jobs; reading never creates it, so listing an
+    empty schedule touches the disk only once.
+    """
+    sf = _resolve_schedule_file(schedule_file)
     try:
         return json.loads(sf.read_text())
     except (json.JSONDecodeError, FileNotFoundError):
@@ -75,12 +70,13 @@ def _load_schedule(schedule_file=None) -> list:
 
 
 def _save_schedule(jobs: list, schedule_file=None):
-    """Save scheduled jobs."""
-    sf = _ensure_schedule_file(schedule_file)
+    """Save scheduled jobs, creating the schedule directory if needed."""
+    sf = _resolve_schedule_file(schedule_file)
+    sf.parent.mkdir(parents=True, exist_ok=True)
     sf.write_text(json.dumps(jobs, indent=2))
 
 
-def parse_schedule_time(time_str: str) -> datetime:
+def parse_schedule_time(time_str: str, *, now: datetime | None = None) -> datetime:
     """
     Parse schedule time string.
 
@@ -89,8 +85,12 @@ def parse_schedule_time(time_str: str) -> datetime:
         - "2026-01-23 10:00" - specific date and time
         - "+1h" - 1 hour from now
         - "+30m" - 30 minutes from now
+
+    ``now`` defaults to the current time; tests pass a fixed value so
+    relative times resolve deterministically.
     """
-    now = datetime.now()
+    if now is None:
+        now = datetime.now()
 
     # Relative time (+1h, +30m)
     if time_str.startswith("+"):
@@ -2,17 +2,19 @@
 
 __all__ = ["Twitter"]
 
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Callable, Optional
 
-from requests_oauthlib import OAuth1Session
-
 from ._branding import get_env
 from ._base import _Base
 from ._twitter_growth import TwitterGrowthMixin
+from ._twitter_timeline import TwitterTimelineMixin
 from ._twitter_read_backend import XquikReadBackend
 
 
-class Twitter(TwitterGrowthMixin, _Base):
+class Twitter(TwitterGrowthMixin, TwitterTimelineMixin, _Base):
     """Twitter/X API v2 client using OAuth 1.0a."""
 
     platform_name = "twitter"
@@ -58,6 +60,10 @@ class Twitter(TwitterGrowthMixin, _Base):
             "@"
         )
         self._read_backend = read_backend or self._configured_read_backend()
+        self._own_user_info: Optional[dict] = None
+        # One keep-alive OAuth1Session per thread (see _get_session);
+        # requests sessions are not safe to share across threads.
+        self._local = threading.local()
 
     def _configured_read_backend(self) -> Optional[XquikReadBackend]:
         backend = (get_env("X_READ_BACKEND") or "").lower().replace("_", "-")
@@ -87,15 +93,27 @@ class Twitter(TwitterGrowthMixin, _Base):
         return self._read_backend_call(method_name, self.read_username, **kwargs)
 
     def _get_session(self):
-        """Create OAuth1 session (or the injected fake session)."""
+        """Return this thread's OAuth1 session (or the injected fake session).
+
+        The session is built on first use and then reused, so later calls
+        ride its pooled keep-alive connections instead of paying a fresh
+        TLS handshake each time.
+        """
         if self._session_factory is not None:
             return self._session_factory()
-        return OAuth1Session(
-            self.consumer_key,
-            client_secret=self.consumer_secret,
-            resource_owner_key=self.access_token,
-            resource_owner_secret=self.access_token_secret,
-        )
+        session = getattr(self._local, "session", None)
+        if session is None:
+            # Imported here so clients built with an injected session
+            # factory never load requests_oauthlib.
+            from requests_oauthlib import OAuth1Session
+
+            session = self._local.session = OAuth1Session(
+                self.consumer_key,
+                client_secret=self.consumer_secret,
+                resource_owner_key=self.access_token,
+                resource_owner_secret=self.access_token_secret,
+            )
+        return session
 
     def validate_credentials(self) -> bool:
         """Check if all credentials are set."""
@@ -135,12 +153,54 @@ class Twitter(TwitterGrowthMixin, _Base):
 
         return _twitter_media.upload_media(self._get_session(), file_path)
 
+    def upload_media_many(self, file_paths: list[str], max_workers: int = 4) -> dict:
+        """
+        Upload several media files concurrently (e.g. up to 4 tweet images).
+
+        All files are checked locally first (existence, type, size and
+        image signature), so a bad file costs no uploads. Each worker
+        uploads through its own OAuth session. Media IDs come back in the
+        order of ``file_paths``.
+
+        Args:
+            file_paths: Paths to media files
+            max_workers: Maximum number of concurrent uploads
+
+        Returns:
+            dict with 'success', 'media_ids' or 'error' (every local check
+            failure joined with "; ", otherwise the first failed upload)
+        """
+        from . import _twitter_media
+
+        if not self.validate_credentials():
+            return {"success": False, "error": "Missing credentials"}
+        if not file_paths:
+            return {"success": True, "media_ids": []}
+        problems = [e for e in map(_twitter_media.preflight_media, file_paths) if e]
+        if problems:
+            return {"success": False, "error": "; ".join(problems)}
+
+        def _upload(path: str) -> dict:
+            return _twitter_media.upload_media(
+                self._get_session(), path, preflighted=True
+            )
+
+        workers = max(1, min(max_workers, len(file_paths)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_upload, file_paths))
+
+        for path, result in zip(file_paths, results):
+            if not result["success"]:
+                return {"success": False, "error": f"{path}: {result['error']}"}
+        return {"success": True, "media_ids": [r["media_id"] for r in results]}
+
     def post(
         self,
         text: str,
         reply_to: Optional[str] = None,
         quote_tweet_id: Optional[str] = None,
         media_ids: Optional[list] = None,
+        media_paths: Optional[list[str]] = None,
     ) -> dict:
         """
         Post a tweet.
@@ -150,6 +210,9 @@ class Twitter(TwitterGrowthMixin, _Base):
             reply_to: Tweet ID to reply to
             quote_tweet_id: Tweet ID to quote
             media_ids: List of media IDs from upload_media()
+            media_paths: Media files to upload and attach. They are uploaded
+                concurrently and the tweet is sent as soon as the last one
+                is done, after the text has been validated.
 
         Returns:
             dict with 'success', 'id', 'url' or 'error'
@@ -164,7 +227,28 @@ class Twitter(TwitterGrowthMixin, _Base):
                 "error": f"Tweet too long: {len(text)} chars (max {self.MAX_TWEET_LENGTH})",
             }
 
-        oauth = self._get_session()
+        if media_paths:
+            uploaded = self.upload_media_many(media_paths)
+            if not uploaded["success"]:
+                return {
+                    "success": False,
+                    "error": f"Media upload failed: {uploaded['error']}",
+                }
+            media_ids = [*(media_ids or ()), *uploaded["media_ids"]]
+
+        return self._create_tweet(
+            self._get_session(), text, reply_to, quote_tweet_id, media_ids
+        )
+
+    def _create_tweet(
+        self,
+        oauth,
+        text: str,
+        reply_to: Optional[str] = None,
+        quote_tweet_id: Optional[str] = None,
+        media_ids: Optional[list] = None,
+    ) -> dict:
+        """POST one tweet through an existing session (see ``post``)."""
         payload = {"text": text}
 
         if reply_to:
@@ -215,30 +299,68 @@ class Twitter(TwitterGrowthMixin, _Base):
                 "error": f"{response.status_code}: {response.text}",
             }
 
-    def post_thread(self, tweets: list[str]) -> dict:
+    def post_thread(
+        self, tweets: list[str], media: Optional[list[Optional[list[str]]]] = None
+    ) -> dict:
         """
         Post a thread of tweets.
 
+        Media for every tweet is uploaded concurrently before the first
+        tweet goes out; the replies then reuse one OAuth session.
+
         Args:
             tweets: List of tweet texts
+            media: Optional per-tweet lists of media file paths; it may be
+                shorter than *tweets* but not longer
 
         Returns:
-            dict with 'success', 'ids', 'urls' or 'error'
+            dict with 'success', 'ids', 'urls' or 'error' (plus 'too_long',
+            the 1-based numbers of every over-length tweet)
         """
-        # Validate all tweets before posting
-        for i, text in enumerate(tweets):
-            if len(text) > self.MAX_TWEET_LENGTH:
+        # Validate all tweets in one pass before posting anything
+        lengths = list(map(len, tweets))
+        too_long = [i + 1 for i, n in enumerate(lengths) if n > self.MAX_TWEET_LENGTH]
+        if too_long:
+            first = too_long[0]
+            return {
+                "success": False,
+                "error": f"Tweet {first} too long: {lengths[first - 1]} chars (max {self.MAX_TWEET_LENGTH})",
+                "too_long": too_long,
+            }
+
+        if media and len(media) > len(tweets):
+            return {
+                "success": False,
+                "error": f"Got {len(media)} media groups for {len(tweets)} tweets",
+            }
+
+        if not self.validate_credentials():
+            return {"success": False, "error": "Missing credentials"}
+
+        media_ids = [None] * len(tweets)
+        if media:
+            paths = [p for group in media for p in group or ()]
+            uploaded = self.upload_media_many(paths)
+            if not uploaded["success"]:
                 return {
                     "success": False,
-                    "error": f"Tweet {i + 1} too long: {len(text)} chars (max {self.MAX_TWEET_LENGTH})",
+                    "error": f"Media upload failed: {uploaded['error']}",
+                    "partial_ids": [],
                 }
+            ids_iter = iter(uploaded["media_ids"])
+            for i, group in enumerate(media):
+                if group:
+                    media_ids[i] = [next(ids_iter) for _ in group]
 
+        oauth = self._get_session()
         ids = []
         urls = []
         reply_to = None
 
         for i, text in enumerate(tweets):
-            result = self.post(text, reply_to=reply_to)
+            result = self._create_tweet(
+                oauth, text, reply_to=reply_to, media_ids=media_ids[i]
+            )
             if result["success"]:
                 ids.append(result["id"])
                 urls.append(result["url"])
@@ -252,6 +374,14 @@ class Twitter(TwitterGrowthMixin, _Base):
 
         return {"success": True, "ids": ids, "urls": urls}
 
+    async def apost_thread(self, tweets: list[str], **kwargs) -> dict:
+        """Awaitable :meth:`post_thread` for hosts running an asyncio event loop.
+
+        The blocking reply chain runs in a worker thread, so the loop keeps
+        serving other tasks while each tweet's round-trip is in flight.
+        """
+        return await asyncio.to_thread(self.post_thread, tweets, **kwargs)
+
     def me(self) -> dict:
         """
         Get authenticated user information.
@@ -282,175 +412,16 @@ class Twitter(TwitterGrowthMixin, _Base):
             }
         return {"success": False, "error": f"{response.status_code}: {response.text}"}
 
-    def feed(self, limit: int = 10) -> dict:
-        """
-        Get user's recent tweets.
-
-        Args:
-            limit: Maximum number of tweets to return (max 100)
+    def _own_user(self) -> dict:
+        """Get the authenticated user's ``me()`` info, cached once it succeeds.
 
-        Returns:
-            dict with 'success', 'tweets' list or 'error'
-        """
-        backend_result = self._read_backend_user_call("user_tweets", limit=limit)
-        if backend_result is not None:
-            return backend_result
-
-        if not self.validate_credentials():
-            return {"success": False, "error": "Missing credentials"}
-
-        # First get user ID
-        user_info = self.me()
-        if not user_info.get("success"):
-            return user_info
-
-        oauth = self._get_session()
-        url = self.USER_TWEETS_ENDPOINT.format(user_id=user_info["id"])
-        response = oauth.get(
-            url,
-            params={
-                "max_results": max(5, min(limit, 100)),  # Twitter API requires 5-100
-                "tweet.fields": "created_at,public_metrics,text",
-            },
-        )
-
-        if response.status_code == 200:
-            data = response.json()
-            tweets = []
-            for tweet in data.get("data", []):
-                metrics = tweet.get("public_metrics", {})
-                tweets.append(
-                    {
-                        "id": tweet["id"],
-                        "text": tweet["text"],
-                        "created_at": tweet.get("created_at"),
-                        "likes": metrics.get("like_count", 0),
-                        "retweets": metrics.get("retweet_count", 0),
-                        "replies": metrics.get("reply_count", 0),
-                        "url": f"https://x.com/i/web/status/{tweet['id']}",
-                    }
-                )
-            return {"success": True, "tweets": tweets, "count": len(tweets)}
-        return {"success": False, "error": f"{response.status_code}: {response.text}"}
-
-    def mentions(self, limit: int = 10) -> dict:
-        """
-        Get recent mentions of the user.
-
-        Args:
-            limit: Maximum number of mentions to return (max 100)
-
-        Returns:
-            dict with 'success', 'mentions' list or 'error'
+        Feed, mention and follow calls only need the (stable) user id and
+        username, so they reuse this instead of hitting ``/users/me`` each
+        time.
         """
-        backend_result = self._read_backend_user_call("mentions", limit=limit)
-        if backend_result is not None:
-            return backend_result
-
-        if not self.validate_credentials():
-            return {"success": False, "error": "Missing credentials"}
-
-        # First get user ID
-        user_info = self.me()
-        if not user_info.get("success"):
-            return user_info
-
-        oauth = self._get_session()
-        url = self.USER_MENTIONS_ENDPOINT.format(user_id=user_info["id"])
-        response = oauth.get(
-            url,
-            params={
-                "max_results": max(5, min(limit, 100)),  # Twitter API requires 5-100
-                "tweet.fields": "created_at,public_metrics,text,author_id",
-                "expansions": "author_id",
-                "user.fields": "username,name",
-            },
-        )
-
-        if response.status_code == 200:
-            data = response.json()
-            # Build user lookup
-            users = {}
-            for user in data.get("includes", {}).get("users", []):
-                users[user["id"]] = user
-
-            mentions = []
-            for tweet in data.get("data", []):
-                author = users.get(tweet.get("author_id"), {})
-                mentions.append(
-                    {
-                        "id": tweet["id"],
-                        "text": tweet["text"],
-                        "created_at": tweet.get("created_at"),
-                        "author_id": tweet.get("author_id"),
-                        "author_username": author.get("username"),
-                        "author_name": author.get("name"),
-                        "url": f"https://x.com/i/web/status/{tweet['id']}",
-                    }
-                )
-            return {"success": True, "mentions": mentions, "count": len(mentions)}
-        return {"success": False, "error": f"{response.status_code}: {response.text}"}
-
-    def replies(self, limit: int = 10) -> dict:
-        """
-        Get recent replies to the user's tweets.
-
-        Args:
-            limit: Maximum number of replies to return (max 100)
-
-        Returns:
-            dict with 'success', 'replies' list or 'error'
-        """
-        backend_result = self._read_backend_user_call("replies", limit=limit)
-        if backend_result is not None:
-            return backend_result
-
-        if not self.validate_credentials():
-            return {"success": False, "error": "Missing credentials"}
-
-        # First get user info
-        user_info = self.me()
-        if not user_info.get("success"):
-            return user_info
-
-        oauth = self._get_session()
-        # Search for replies to this user (excluding own tweets)
-        query = f"to:{user_info['username']} -from:{user_info['username']}"
-        response = oauth.get(
-            self.SEARCH_ENDPOINT,
-            params={
-                "query": query,
-                "max_results": max(10, min(limit, 100)),  # Search requires 10-100
-                "tweet.fields": "created_at,public_metrics,text,author_id,in_reply_to_user_id,conversation_id",
-                "expansions": "author_id",
-                "user.fields": "username,name",
-            },
-        )
-
-        if response.status_code == 200:
-            data = response.json()
-            # Build user lookup
-            users = {}
-            for user in data.get("includes", {}).get("users", []):
-                users[user["id"]] = user
-
-            replies = []
-            for tweet in data.get("data", []):
-                author = users.get(tweet.get("author_id"), {})
-                metrics = tweet.get("public_metrics", {})
-                replies.append(
-                    {
-                        "id": tweet["id"],
-                        "text": tweet["text"],
-                        "created_at": tweet.get("created_at"),
-                        "author_id": tweet.get("author_id"),
-                        "author_username": author.get("username"),
-                        "author_name": author.get("name"),
-                        "conversation_id": tweet.get("conversation_id"),
-                        "likes": metrics.get("like_count", 0),
-                        "retweets": metrics.get("retweet_count", 0),
-                        "url": f"https://x.com/i/web/status/{tweet['id']}",
-                    }
-                )
-            return {"success": True, "replies": replies, "count": len(replies)}
-        return {"success": False, "error": f"{response.status_code}: {response.text}"}
+        if self._own_user_info is None:
+            user_info = self.me()
+            if not user_info.get("success"):
+                return user_info
+            self._own_user_info = user_info
+        return self._own_user_info
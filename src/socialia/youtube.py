@@ -2,55 +2,46 @@
 
 __all__ = ["YouTube"]
 
+import asyncio
+import mimetypes
+import mmap
 import os
-from typing import Optional
+import threading
+import time
+from typing import TYPE_CHECKING, Optional
 
 from ._base import _Base
 from ._branding import get_env
 from ._paths import get_youtube_token_file as _get_youtube_token_file
-
-from scitex_dev import try_import_optional
-
-Credentials = try_import_optional(
-    "google.oauth2.credentials", attr="Credentials", extra="youtube", pkg="google-auth"
-)
-InstalledAppFlow = try_import_optional(
-    "google_auth_oauthlib.flow",
-    attr="InstalledAppFlow",
-    extra="youtube",
-    pkg="google-auth-oauthlib",
-)
-Request = try_import_optional(
-    "google.auth.transport.requests",
-    attr="Request",
-    extra="youtube",
-    pkg="google-auth",
-)
-build = try_import_optional(
-    "googleapiclient.discovery",
-    attr="build",
-    extra="youtube",
-    pkg="google-api-python-client",
-)
-MediaFileUpload = try_import_optional(
-    "googleapiclient.http",
-    attr="MediaFileUpload",
-    extra="youtube",
-    pkg="google-api-python-client",
-)
-HAS_YOUTUBE = all(
-    x is not None
-    for x in (Credentials, InstalledAppFlow, Request, build, MediaFileUpload)
+from ._youtube_listing import YouTubeListingMixin
+from ._youtube_transport import (
+    _CRED_CACHE,
+    _THUMB_EXECUTOR,
+    _VIDEO_PARTS,
+    HAS_YOUTUBE,
+    _good_until,
+    _google_api,
+    _json_loads,
+    _next_chunk_with_retry,
+    _ReadAheadMap,
+    _requires_client,
+    _set_thumbnail,
+    _upload_chunksize,
+    _youtube_discovery,
 )
+from ._youtube_update import YouTubeUpdateMixin
+
+if TYPE_CHECKING:
+    from google.oauth2.credentials import Credentials
 
-SCOPES = [
+SCOPES = (
     "https://www.googleapis.com/auth/youtube.upload",
     "https://www.googleapis.com/auth/youtube",
     "https://www.googleapis.com/auth/youtube.force-ssl",
-]
+)
 
 
-class YouTube(_Base):
+class YouTube(YouTubeUpdateMixin, YouTubeListingMixin, _Base):
     """YouTube API client for video uploads and management.
 
     Environment Variables:
@@ -75,18 +66,38 @@ class YouTube(_Base):
         self.client_secrets_file = client_secrets_file or get_env(
             "YOUTUBE_CLIENT_SECRETS_FILE"
         )
-        default_token = str(_get_youtube_token_file())
-        self.token_file = token_file or (get_env("YOUTUBE_TOKEN_FILE") or default_token)
+        # The runtime default is only resolved (and its directory created)
+        # when no explicit token file is configured.
+        self.token_file = (
+            token_file
+            or get_env("YOUTUBE_TOKEN_FILE")
+            or str(_get_youtube_token_file())
+        )
         self._youtube = None
+        self._http = None
+        # Per-thread transports for uploads running off the main thread
+        # (see apost); httplib2 connections must not be shared across threads.
+        self._local = threading.local()
+        self._client_lock = threading.Lock()
         self._credentials = None
+        self._uploads_playlist_id: Optional[str] = None
+        # Memoized positive result of validate_credentials(); reset whenever
+        # the credentials have to be refreshed or re-authorized.
+        self._creds_ok: Optional[bool] = None
+        # time.monotonic() deadline before which self._credentials is
+        # trusted without re-checking validity.
+        self._creds_good_until = 0.0
 
     def validate_credentials(self) -> bool:
         """Check if credentials are available."""
         if not HAS_YOUTUBE:
             return False
-        if os.path.exists(self.token_file):
+        if self._creds_ok:
             return True
-        if self.client_secrets_file and os.path.exists(self.client_secrets_file):
+        if os.path.exists(self.token_file) or (
+            self.client_secrets_file and os.path.exists(self.client_secrets_file)
+        ):
+            self._creds_ok = True
             return True
         return False
 
@@ -94,36 +105,89 @@ class YouTube(_Base):
         """Get or refresh OAuth credentials."""
         if not HAS_YOUTUBE:
             return None
-
-        creds = None
-        if os.path.exists(self.token_file):
-            creds = Credentials.from_authorized_user_file(self.token_file, SCOPES)
+        if self._credentials is not None and time.monotonic() < self._creds_good_until:
+            return self._credentials
+
+        # Reuse the parsed credentials within the process; only fall back to
+        # the token file when nothing has been loaded yet.
+        cache_key = os.path.abspath(self.token_file)
+        creds = self._credentials or _CRED_CACHE.get(cache_key)
+        if creds is None and os.path.exists(self.token_file):
+            with open(self.token_file, "rb") as f:
+                info = _json_loads(f.read())
+            creds = _google_api().Credentials.from_authorized_user_info(info, SCOPES)
 
         if not creds or not creds.valid:
+            self._creds_ok = None
             if creds and creds.expired and creds.refresh_token:
-                creds.refresh(Request())
+                creds.refresh(_google_api().Request())
             elif self.client_secrets_file and os.path.exists(self.client_secrets_file):
-                flow = InstalledAppFlow.from_client_secrets_file(
+                flow = _google_api().InstalledAppFlow.from_client_secrets_file(
                     self.client_secrets_file, SCOPES
                 )
                 creds = flow.run_local_server(port=0)
             else:
                 return None
-            with open(self.token_file, "w") as f:
-                f.write(creds.to_json())
+            self._save_token(creds)
 
+        self._credentials = _CRED_CACHE[cache_key] = creds
+        self._creds_good_until = _good_until(creds)
         return creds
 
+    def _save_token(self, creds) -> None:
+        """Persist credentials to the token file.
+
+        The write is skipped when the serialized token is unchanged, and goes
+        through a temp file + ``os.replace`` so an interrupted write can never
+        leave a truncated token behind.
+        """
+        new_json = creds.to_json()
+        try:
+            with open(self.token_file) as f:
+                if f.read() == new_json:
+                    return
+        except OSError:
+            pass
+        tmp_path = self.token_file + ".tmp"
+        with open(tmp_path, "w") as f:
+            f.write(new_json)
+        os.replace(tmp_path, self.token_file)
+
     def _get_client(self):
         """Get authenticated YouTube client."""
         if self._youtube:
             return self._youtube
-        creds = self._get_credentials()
-        if not creds:
-            return None
-        self._youtube = build("youtube", "v3", credentials=creds)
+        with self._client_lock:
+            if self._youtube:
+                return self._youtube
+            creds = self._get_credentials()
+            if not creds:
+                return None
+            # One authorized transport for the whole client, so the video
+            # upload and the follow-up thumbnail/metadata calls share
+            # keep-alive connections instead of each paying a fresh TLS
+            # handshake.
+            self._http = self._new_http(creds)
+            self._local.http = self._http
+            google = _google_api()
+            self._youtube = google.build_from_document(
+                _youtube_discovery(), http=self._http, model=google.JsonModel()
+            )
         return self._youtube
 
+    def _thread_http(self):
+        """Return this thread's authorized transport, creating it on first use."""
+        http = getattr(self._local, "http", None)
+        if http is None:
+            http = self._local.http = self._new_http(self._credentials)
+        return http
+
+    @staticmethod
+    def _new_http(creds):
+        """Build an authorized httplib2 transport for *creds*."""
+        google = _google_api()
+        return google.AuthorizedHttp(creds, http=google.httplib2.Http(cache=None))
+
     def post(
         self,
         text: str,
@@ -134,6 +198,10 @@ class YouTube(_Base):
         category_id: str = "22",
         privacy_status: str = "public",
         thumbnail_path: Optional[str] = None,
+        wait_for_thumbnail: bool = False,
+        notify_subscribers: bool = True,
+        auto_levels: bool = False,
+        stabilize: bool = False,
     ) -> dict:
         """Upload a video or create a community post.
 
@@ -146,9 +214,19 @@ class YouTube(_Base):
             category_id: YouTube category ID (default: 22 = People & Blogs)
             privacy_status: 'public', 'private', or 'unlisted'
             thumbnail_path: Path to custom thumbnail image
+            wait_for_thumbnail: Block until the thumbnail is set. By default it
+                is uploaded in the background after the video is up.
+            notify_subscribers: Notify channel subscribers about the upload.
+                Pass False for silent publishes.
+            auto_levels: Ask YouTube to auto-correct lighting and color.
+            stabilize: Ask YouTube to remove camera shake. Both enhancements
+                add server-side processing before the video becomes
+                available, so they are off unless requested.
 
         Returns:
-            dict with 'success', 'id', 'url' or 'error'
+            dict with 'success', 'id', 'url' or 'error'. A failed thumbnail
+            is reported as 'thumbnail_error'; a background one leaves a
+            'thumbnail_future' resolving to that message or None.
         """
         if not HAS_YOUTUBE:
             return {
@@ -173,10 +251,23 @@ class YouTube(_Base):
                 category_id=category_id,
                 privacy_status=privacy_status,
                 thumbnail_path=thumbnail_path,
+                wait_for_thumbnail=wait_for_thumbnail,
+                notify_subscribers=notify_subscribers,
+                auto_levels=auto_levels,
+                stabilize=stabilize,
             )
 
         return self._create_community_post(youtube, text)
 
+    async def apost(self, text: str, **kwargs) -> dict:
+        """Awaitable :meth:`post` for hosts running an asyncio event loop.
+
+        The blocking upload runs in a worker thread with its own HTTP
+        transport, so several ``apost`` calls on one client can be in flight
+        at once without stalling the loop.
+        """
+        return await asyncio.to_thread(self.post, text, **kwargs)
+
     def _upload_video(
         self,
         youtube,
@@ -187,10 +278,19 @@ class YouTube(_Base):
         category_id: str,
         privacy_status: str,
         thumbnail_path: Optional[str] = None,
+        wait_for_thumbnail: bool = False,
+        notify_subscribers: bool = True,
+        auto_levels: bool = False,
+        stabilize: bool = False,
     ) -> dict:
         """Upload a video to YouTube."""
-        if not os.path.exists(video_path):
+        # One stat answers both "does it exist" and "how big is it".
+        try:
+            size = os.stat(video_path).st_size
+        except FileNotFoundError:
             return {"success": False, "error": f"Video file not found: {video_path}"}
+        if not size:
+            return {"success": False, "error": f"Video file is empty: {video_path}"}
 
         body = {
             "snippet": {
@@ -206,40 +306,61 @@ class YouTube(_Base):
         }
 
         try:
-            media = MediaFileUpload(
-                video_path,
-                chunksize=1024 * 1024,
-                resumable=True,
-            )
+            http = self._thread_http()
+            # Serve chunks straight from a read-only memory map so the file
+            # is paged in on demand instead of buffered through read(), with
+            # the next chunk prefetched while the current one uploads.
+            chunksize = _upload_chunksize(size)
+            with (
+                open(video_path, "rb") as f,
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+            ):
+                media = _google_api().MediaIoBaseUpload(
+                    _ReadAheadMap(mm, chunksize),
+                    mimetype=mimetypes.guess_type(video_path)[0] or "video/*",
+                    chunksize=chunksize,
+                    resumable=True,
+                )
 
-            request = youtube.videos().insert(
-                part=",".join(body.keys()),
-                body=body,
-                media_body=media,
-            )
+                request = youtube.videos().insert(
+                    part=_VIDEO_PARTS,
+                    body=body,
+                    media_body=media,
+                    notifySubscribers=notify_subscribers,
+                    autoLevels=auto_levels,
+                    stabilize=stabilize,
+                )
 
-            response = None
-            while response is None:
-                status, response = request.next_chunk()
+                response = None
+                while response is None:
+                    status, response = _next_chunk_with_retry(request, http=http)
 
             video_id = response["id"]
-
-            if thumbnail_path and os.path.exists(thumbnail_path):
-                try:
-                    youtube.thumbnails().set(
-                        videoId=video_id,
-                        media_body=MediaFileUpload(thumbnail_path),
-                    ).execute()
-                except Exception:
-                    pass
-
-            return {
+            result = {
                 "success": True,
                 "id": video_id,
                 "url": f"https://www.youtube.com/watch?v={video_id}",
                 "title": title,
             }
 
+            if thumbnail_path and os.path.exists(thumbnail_path):
+                if wait_for_thumbnail:
+                    error = _set_thumbnail(youtube, video_id, thumbnail_path, http)
+                    if error:
+                        result["thumbnail_error"] = error
+                else:
+                    # httplib2 transports are not thread-safe, so the
+                    # background upload gets a connection of its own.
+                    result["thumbnail_future"] = _THUMB_EXECUTOR.submit(
+                        _set_thumbnail,
+                        youtube,
+                        video_id,
+                        thumbnail_path,
+                        self._new_http(self._credentials),
+                    )
+
+            return result
+
         except Exception as e:
             return {"success": False, "error": str(e)}
 
@@ -250,6 +371,7 @@ class YouTube(_Base):
             "error": "Community posts require channel eligibility (500+ subscribers) and manual posting via YouTube Studio",
         }
 
+    @_requires_client
     def delete(self, video_id: str) -> dict:
         """Delete a video by ID.
 
@@ -259,87 +381,27 @@ class YouTube(_Base):
         Returns:
             dict with 'success' or 'error'
         """
-        if not HAS_YOUTUBE:
-            return {"success": False, "error": "YouTube libraries not installed"}
-        if not self.validate_credentials():
-            return {"success": False, "error": "Missing credentials"}
-        youtube = self._get_client()
-        if not youtube:
-            return {"success": False, "error": "Could not create YouTube client"}
+        youtube = self._youtube
         try:
             youtube.videos().delete(id=video_id).execute()
             return {"success": True, "deleted": True}
         except Exception as e:
             return {"success": False, "error": str(e)}
 
-    def update(
-        self,
-        video_id: str,
-        title: Optional[str] = None,
-        description: Optional[str] = None,
-        tags: Optional[list] = None,
-        privacy_status: Optional[str] = None,
-    ) -> dict:
-        """Update video metadata.
-
-        Args:
-            video_id: YouTube video ID
-            title: New title (optional)
-            description: New description (optional)
-            tags: New tags (optional)
-            privacy_status: New privacy status (optional)
-
-        Returns:
-            dict with 'success' or 'error'
-        """
-        if not HAS_YOUTUBE:
-            return {"success": False, "error": "YouTube libraries not installed"}
-        youtube = self._get_client()
-        if not youtube:
-            return {"success": False, "error": "Could not create YouTube client"}
-        try:
-            current = (
-                youtube.videos().list(part="snippet,status", id=video_id).execute()
-            )
-            if not current.get("items"):
-                return {"success": False, "error": f"Video not found: {video_id}"}
-
-            video = current["items"][0]
-            snippet = video["snippet"]
-            status = video["status"]
-
-            if title:
-                snippet["title"] = title
-            if description:
-                snippet["description"] = description
-            if tags:
-                snippet["tags"] = tags
-            if privacy_status:
-                status["privacyStatus"] = privacy_status
-
-            youtube.videos().update(
-                part="snippet,status",
-                body={"id": video_id, "snippet": snippet, "status": status},
-            ).execute()
-
-            return {
-                "success": True,
-                "id": video_id,
-                "url": f"https://www.youtube.com/watch?v={video_id}",
-            }
-        except Exception as e:
-            return {"success": False, "error": str(e)}
-
+    @_requires_client
     def get_channel_info(self) -> dict:
         """Get authenticated user's channel information."""
-        if not HAS_YOUTUBE:
-            return {"success": False, "error": "YouTube libraries not installed"}
-        youtube = self._get_client()
-        if not youtube:
-            return {"success": False, "error": "Could not create YouTube client"}
+        youtube = self._youtube
         try:
             response = (
-                youtube.channels().list(part="snippet,statistics", mine=True).execute()
+                youtube.channels()
+                .list(
+                    part="snippet,statistics",
+                    mine=True,
+                    fields="items(id,snippet(title,description),"
+                    "statistics(subscriberCount,videoCount,viewCount))",
+                )
+                .execute()
             )
             if not response.get("items"):
                 return {"success": False, "error": "No channel found"}
@@ -358,58 +420,6 @@ class YouTube(_Base):
         except Exception as e:
             return {"success": False, "error": str(e)}
 
-    def list_videos(self, max_results: int = 10) -> dict:
-        """List user's uploaded videos.
-
-        Args:
-            max_results: Maximum number of videos to return
-
-        Returns:
-            dict with videos list or error
-        """
-        if not HAS_YOUTUBE:
-            return {"success": False, "error": "YouTube libraries not installed"}
-        youtube = self._get_client()
-        if not youtube:
-            return {"success": False, "error": "Could not create YouTube client"}
-        try:
-            channels = (
-                youtube.channels().list(part="contentDetails", mine=True).execute()
-            )
-            if not channels.get("items"):
-                return {"success": False, "error": "No channel found"}
-
-            uploads_id = channels["items"][0]["contentDetails"]["relatedPlaylists"][
-                "uploads"
-            ]
-            videos_response = (
-                youtube.playlistItems()
-                .list(
-                    part="snippet",
-                    playlistId=uploads_id,
-                    maxResults=max_results,
-                )
-                .execute()
-            )
-
-            videos = []
-            for item in videos_response.get("items", []):
-                snippet = item["snippet"]
-                video_id = snippet["resourceId"]["videoId"]
-                videos.append(
-                    {
-                        "id": video_id,
-                        "title": snippet["title"],
-                        "description": snippet.get("description", "")[:100],
-                        "published_at": snippet["publishedAt"],
-                        "url": f"https://www.youtube.com/watch?v={video_id}",
-                    }
-                )
-
-            return {"success": True, "videos": videos, "count": len(videos)}
-        except Exception as e:
-            return {"success": False, "error": str(e)}
-
     def me(self) -> dict:
         """Get authenticated user's channel information."""
         return self.get_channel_info()
@@ -12,9 +12,14 @@ tree (rule PA-306 / STX-NM00*). See
 
 from __future__ import annotations
 
+import functools
+import io
 import os
 import sysconfig
+from collections.abc import Mapping
+from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Callable, Optional
 
 import pytest
@@ -68,6 +73,8 @@ _ensure_subprocess_coverage_shim()
 # environment for the duration of the test and restores the snapshot on
 # teardown.  Used for any test that needs to manipulate SOCIALIA_*, SCITEX_*,
 # or other env vars without using ``monkeypatch`` (forbidden by PA-306).
+# Teardown also re-reads ``_branding`` so a prefix one test switched to
+# cannot leak into whichever test the same worker runs next.
 
 
 class _EnvController:
@@ -105,6 +112,46 @@ def env_save_restore():
                 os.environ.pop(key, None)
             else:
                 os.environ[key] = original
+        # Imported here: conftest stays free of package imports until the
+        # coverage wiring above has run.
+        from socialia import _branding
+
+        _branding.refresh()
+
+
+# --- run_readonly -----------------------------------------------------------
+#
+# Several tests run the same side-effect-free CLI command just to grep its
+# output.  ``run_readonly`` runs each allow-listed argv once per session and
+# replays the ``(exit_code, stdout, stderr)`` triple for later callers.
+
+
+_READONLY_ARGV_PREFIXES: tuple[tuple[str, ...], ...] = (
+    ("--help-recursive",),
+    ("show-status",),
+    ("status",),
+    ("mcp", "doctor"),
+    ("mcp", "installation"),
+    ("mcp", "list-tools"),
+)
+
+
+@functools.cache
+def _run_readonly(argv: tuple[str, ...]) -> tuple[int, str, str]:
+    if not any(argv[: len(p)] == p for p in _READONLY_ARGV_PREFIXES):
+        raise ValueError(f"Not an allow-listed read-only command: {argv!r}")
+    from socialia.cli import main
+
+    out, err = io.StringIO(), io.StringIO()
+    with redirect_stdout(out), redirect_stderr(err):
+        rc = main(list(argv))
+    return rc, out.getvalue(), err.getvalue()
+
+
+@pytest.fixture
+def run_readonly() -> Callable[[tuple[str, ...]], tuple[int, str, str]]:
+    """Return the session-cached runner for read-only CLI commands."""
+    return _run_readonly
 
 
 # --- Fake HTTP collaborators ------------------------------------------------
@@ -121,6 +168,8 @@ class FakeResponse:
     ``headers``, and a ``.json()`` callable.
     """
 
+    __slots__ = ("_json", "headers", "status_code", "text")
+
     def __init__(
         self,
         status_code: int,
@@ -146,6 +195,11 @@ class _RecordingCall:
         self.kwargs = kwargs
 
 
+def _call_url(args: tuple, kwargs: dict) -> Optional[str]:
+    """URL of a ``get``/``post``/``delete`` call, positional or keyword."""
+    return args[0] if args else kwargs.get("url")
+
+
 class FakeRequestsModule:
     """Hand-rolled stand-in for the ``requests`` module surface that
     socialia uses (``get`` / ``post`` / ``delete``).
@@ -166,13 +220,19 @@ class FakeRequestsModule:
         self.get_sequence: list[FakeResponse] = []
         self.post_sequence: list[FakeResponse] = []
         self.delete_sequence: list[FakeResponse] = []
+        # Optional (method, url) -> response routes, checked first.
+        self.responses: dict[tuple[str, str], FakeResponse] = {}
 
     def _pop_or_single(
         self,
         sequence: list[FakeResponse],
         single: Optional[FakeResponse],
         method: str,
+        url: Optional[str] = None,
     ) -> FakeResponse:
+        routed = self.responses.get((method, url))
+        if routed is not None:
+            return routed
         if sequence:
             return sequence.pop(0)
         if single is not None:
@@ -183,25 +243,48 @@ class FakeRequestsModule:
 
     def get(self, *args, **kwargs) -> FakeResponse:
         self.calls.append(_RecordingCall("get", args, kwargs))
-        return self._pop_or_single(self.get_sequence, self.get_response, "get")
+        return self._pop_or_single(
+            self.get_sequence, self.get_response, "get", _call_url(args, kwargs)
+        )
 
     def post(self, *args, **kwargs) -> FakeResponse:
         self.calls.append(_RecordingCall("post", args, kwargs))
-        return self._pop_or_single(self.post_sequence, self.post_response, "post")
+        return self._pop_or_single(
+            self.post_sequence, self.post_response, "post", _call_url(args, kwargs)
+        )
 
     def delete(self, *args, **kwargs) -> FakeResponse:
         self.calls.append(_RecordingCall("delete", args, kwargs))
         return self._pop_or_single(
-            self.delete_sequence, self.delete_response, "delete"
+            self.delete_sequence,
+            self.delete_response,
+            "delete",
+            _call_url(args, kwargs),
         )
 
 
 class FakeOAuthSession:
     """Hand-rolled stand-in for ``requests_oauthlib.OAuth1Session`` that
     Twitter clients consume.  Surface: ``get`` / ``post`` / ``delete``
-    returning ``FakeResponse``.
+    returning ``FakeResponse``.  Responses resolve like
+    ``FakeRequestsModule``: ``responses[(method, url)]`` first, then the
+    method's sequence, then its single response.
+
+    Slotted, like a spec-bound double: assigning a misspelled attribute
+    (``post_responses = ...``) raises instead of being silently ignored.
     """
 
+    __slots__ = (
+        "calls",
+        "delete_response",
+        "delete_sequence",
+        "get_response",
+        "get_sequence",
+        "post_response",
+        "post_sequence",
+        "responses",
+    )
+
     def __init__(self) -> None:
         self.calls: list[_RecordingCall] = []
         self.get_response: Optional[FakeResponse] = None
@@ -210,13 +293,18 @@ class FakeOAuthSession:
         self.get_sequence: list[FakeResponse] = []
         self.post_sequence: list[FakeResponse] = []
         self.delete_sequence: list[FakeResponse] = []
+        self.responses: dict[tuple[str, str], FakeResponse] = {}
 
     def _resolve(
         self,
         sequence: list[FakeResponse],
         single: Optional[FakeResponse],
         method: str,
+        url: Optional[str] = None,
     ) -> FakeResponse:
+        routed = self.responses.get((method, url))
+        if routed is not None:
+            return routed
         if sequence:
             return sequence.pop(0)
         if single is not None:
@@ -227,15 +315,24 @@ class FakeOAuthSession:
 
     def get(self, *args, **kwargs) -> FakeResponse:
         self.calls.append(_RecordingCall("get", args, kwargs))
-        return self._resolve(self.get_sequence, self.get_response, "get")
+        return self._resolve(
+            self.get_sequence, self.get_response, "get", _call_url(args, kwargs)
+        )
 
     def post(self, *args, **kwargs) -> FakeResponse:
         self.calls.append(_RecordingCall("post", args, kwargs))
-        return self._resolve(self.post_sequence, self.post_response, "post")
+        return self._resolve(
+            self.post_sequence, self.post_response, "post", _call_url(args, kwargs)
+        )
 
     def delete(self, *args, **kwargs) -> FakeResponse:
         self.calls.append(_RecordingCall("delete", args, kwargs))
-        return self._resolve(self.delete_sequence, self.delete_response, "delete")
+        return self._resolve(
+            self.delete_sequence,
+            self.delete_response,
+            "delete",
+            _call_url(args, kwargs),
+        )
 
 
 @pytest.fixture
@@ -257,26 +354,200 @@ def twitter_session_factory(
     return lambda: fake_oauth_session
 
 
+@pytest.fixture
+def twitter_client(twitter_credentials, twitter_session_factory):
+    """A ``Twitter`` client whose sessions all come from ``fake_oauth_session``.
+
+    Function-scoped: the client keeps a per-thread session cache, so it is
+    rebuilt for every test along with the fake it is wired to.
+    """
+    from socialia.twitter import Twitter
+
+    return Twitter(**twitter_credentials, session_factory=twitter_session_factory)
+
+
 @pytest.fixture
 def fake_http() -> FakeRequestsModule:
     """Hand-rolled stand-in for the ``requests`` module surface."""
     return FakeRequestsModule()
 
 
-@pytest.fixture
-def twitter_credentials() -> dict:
+# Credential fixtures are plain constants, so they are built once per session
+# and handed out read-only; a test that tries to mutate one fails loudly
+# instead of leaking into the next test.
+
+
+@pytest.fixture(scope="session")
+def twitter_credentials() -> Mapping[str, str]:
     """Provide test Twitter credentials."""
-    return {
-        "consumer_key": "test_consumer_key",
-        "consumer_secret": "test_consumer_secret",
-        "access_token": "test_access_token",
-        "access_token_secret": "test_access_token_secret",
-    }
+    return MappingProxyType(
+        {
+            "consumer_key": "test_consumer_key",
+            "consumer_secret": "test_consumer_secret",
+            "access_token": "test_access_token",
+            "access_token_secret": "test_access_token_secret",
+        }
+    )
 
 
-@pytest.fixture
-def linkedin_credentials() -> dict:
+@pytest.fixture(scope="session")
+def linkedin_credentials() -> Mapping[str, str]:
     """Provide test LinkedIn credentials."""
-    return {
-        "access_token": "test_linkedin_token",
-    }
+    return MappingProxyType(
+        {
+            "access_token": "test_linkedin_token",
+        }
+    )
+
+
+@pytest.fixture
+def linkedin_client(linkedin_credentials, fake_http):
+    """A ``LinkedIn`` client wired to this test's ``fake_http``.
+
+    Function-scoped on purpose: the client caches the user URN after the
+    first lookup, so sharing one across tests would leak that state.
+    """
+    from socialia.linkedin import LinkedIn
+
+    return LinkedIn(**linkedin_credentials, http=fake_http)
+
+
+# --- Fake YouTube service ---------------------------------------------------
+#
+# Stands in for the ``googleapiclient`` YouTube resource a ``YouTube`` client
+# builds.  ``youtube_client`` injects ``fake_youtube_service`` in place of the
+# real resource; tests stock canned responses on the fake and then inspect
+# what was sent alongside what the client returned.
+
+
+class _FakeYouTubeRequest:
+    def __init__(self, service: FakeYouTubeService, name: str, kwargs: dict) -> None:
+        self._service = service
+        self._name = name
+        self._kwargs = kwargs
+
+    def execute(self, **_kwargs) -> dict:
+        self._service.calls.append((self._name, self._kwargs))
+        error = self._service.errors.get(self._name)
+        if error is not None:
+            raise error
+        return self._service.responses.get(self._name, {})
+
+    def next_chunk(self, **_kwargs) -> tuple[None, dict]:
+        return None, self.execute()
+
+
+class _FakeYouTubeResource:
+    def __init__(self, service: FakeYouTubeService, resource: str) -> None:
+        self._service = service
+        self._resource = resource
+
+    def __getattr__(self, method: str) -> Callable[..., _FakeYouTubeRequest]:
+        name = f"{self._resource}.{method}"
+        return lambda **kwargs: _FakeYouTubeRequest(self._service, name, kwargs)
+
+
+class _FakeYouTubeBatch:
+    def __init__(self, service: FakeYouTubeService, callback) -> None:
+        self._service = service
+        self._callback = callback
+        self._requests: list[tuple[Optional[str], _FakeYouTubeRequest]] = []
+
+    def add(self, request: _FakeYouTubeRequest, request_id=None) -> None:
+        self._requests.append((request_id, request))
+
+    def execute(self, **_kwargs) -> None:
+        self._service.batch_sizes.append(len(self._requests))
+        for request_id, request in self._requests:
+            self._callback(request_id, request.execute(), None)
+
+
+class FakeYouTubeService:
+    """Hand-rolled stand-in for the ``googleapiclient`` YouTube resource.
+
+    ``service.videos().update(**kw).execute()`` records
+    ``("videos.update", kw)`` onto ``calls`` and returns
+    ``responses["videos.update"]`` (default ``{}``), or raises
+    ``errors["videos.update"]`` when one is set.  Batches run their
+    requests in order and record their size onto ``batch_sizes``.
+    """
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, dict]] = []
+        self.responses: dict[str, dict] = {}
+        self.errors: dict[str, Exception] = {}
+        self.batch_sizes: list[int] = []
+
+    def new_batch_http_request(self, callback=None) -> _FakeYouTubeBatch:
+        return _FakeYouTubeBatch(self, callback)
+
+    def __getattr__(self, resource: str) -> Callable[[], _FakeYouTubeResource]:
+        return lambda: _FakeYouTubeResource(self, resource)
+
+    def call_names(self) -> list[str]:
+        return [name for name, _ in self.calls]
+
+    def stock_videos(self, video_ids: list[str]) -> None:
+        """Answer ``videos.list`` with a public "Old" video per id."""
+        self.responses["videos.list"] = {
+            "items": [
+                {
+                    "id": video_id,
+                    "snippet": {"title": "Old", "categoryId": "22"},
+                    "status": {"privacyStatus": "public"},
+                }
+                for video_id in video_ids
+            ]
+        }
+
+    def stock_uploads(self, count: int = 2) -> None:
+        """Answer the channel lookup and list *count* uploads ``v1``..``vN``."""
+        self.responses["channels.list"] = {
+            "items": [{"contentDetails": {"relatedPlaylists": {"uploads": "UU1"}}}]
+        }
+        self.responses["playlistItems.list"] = {
+            "items": [
+                {
+                    "snippet": {
+                        "title": f"Video {i}",
+                        "publishedAt": "2026-01-01T00:00:00Z",
+                        "resourceId": {"videoId": f"v{i}"},
+                    }
+                }
+                for i in range(1, count + 1)
+            ]
+        }
+
+
+@pytest.fixture
+def fake_youtube_service() -> FakeYouTubeService:
+    """Hand-rolled stand-in for the YouTube API resource."""
+    service = FakeYouTubeService()
+    service.responses["videos.insert"] = {"id": "new123"}
+    return service
+
+
+@pytest.fixture
+def youtube_client(tmp_path, fake_youtube_service):
+    """A ``YouTube`` client talking to ``fake_youtube_service``.
+
+    Function-scoped: the client memoizes credentials and the uploads
+    playlist id, and its token file lives in this test's ``tmp_path``.
+    """
+    from socialia.youtube import YouTube
+
+    (tmp_path / "token.json").write_text("{}")
+    client = YouTube(
+        client_secrets_file=str(tmp_path / "client_secrets.json"),
+        token_file=str(tmp_path / "token.json"),
+    )
+    client._youtube = fake_youtube_service
+    return client
+
+
+@pytest.fixture
+def video_file(tmp_path) -> Path:
+    """A small non-empty ``clip.mp4`` in this test's ``tmp_path``."""
+    video = tmp_path / "clip.mp4"
+    video.write_bytes(b"\x00" * 64)
+    return video
@@ -5,9 +5,11 @@ tests use the hand-rolled ``FakeRequestsModule`` and an env-controller
 fixture instead of unittest.mock + monkeypatch.
 """
 
-import importlib
+import pytest
 
+from socialia import _branding
 from socialia.analytics import GoogleAnalytics
+from socialia.cli import main
 
 from tests.conftest import FakeResponse
 
@@ -25,9 +27,7 @@ def _clear_ga_env(env, *, prefix: str = "SOCIALIA"):
     env.clear()
     if prefix != "SOCIALIA":
         env.set("SOCIALIA_ENV_PREFIX", prefix)
-    from socialia import _branding
-
-    importlib.reload(_branding)
+    _branding.refresh()
 
 
 # --- Initialisation ---------------------------------------------------------
@@ -236,9 +236,11 @@ class TestAnalyticsCLI:
     needed because we go via ``--help``.
     """
 
+    pytestmark = pytest.mark.cli
+
     def test_analytics_track_help_returns_exit_zero(self, capsys):
         # Arrange
-        from socialia.cli import main
+        # (no setup)
         # Act
         rc = main(["analytics", "track", "--help"])
         # Assert
@@ -246,7 +248,6 @@ class TestAnalyticsCLI:
 
     def test_analytics_track_help_mentions_event_name_argument(self, capsys):
         # Arrange
-        from socialia.cli import main
         main(["analytics", "track", "--help"])
         # Act
         out = capsys.readouterr().out
@@ -255,7 +256,6 @@ class TestAnalyticsCLI:
 
     def test_analytics_track_help_documents_param_flag(self, capsys):
         # Arrange
-        from socialia.cli import main
         main(["analytics", "track", "--help"])
         # Act
         out = capsys.readouterr().out
@@ -264,7 +264,6 @@ class TestAnalyticsCLI:
 
     def test_analytics_realtime_alias_renders_show_realtime_help(self, capsys):
         # Arrange
-        from socialia.cli import main
         main(["analytics", "realtime", "--help"])
         # Act
         out = capsys.readouterr().out
@@ -273,7 +272,6 @@ class TestAnalyticsCLI:
 
     def test_analytics_pageviews_alias_renders_show_pageviews_help(self, capsys):
         # Arrange
-        from socialia.cli import main
         main(["analytics", "pageviews", "--help"])
         # Act
         out = capsys.readouterr().out
@@ -282,7 +280,6 @@ class TestAnalyticsCLI:
 
     def test_analytics_pageviews_alias_documents_start_flag(self, capsys):
         # Arrange
-        from socialia.cli import main
         main(["analytics", "pageviews", "--help"])
         # Act
         out = capsys.readouterr().out
@@ -291,7 +288,6 @@ class TestAnalyticsCLI:
 
     def test_analytics_pageviews_alias_documents_end_flag(self, capsys):
         # Arrange
-        from socialia.cli import main
         main(["analytics", "pageviews", "--help"])
         # Act
         out = capsys.readouterr().out
@@ -300,7 +296,6 @@ class TestAnalyticsCLI:
 
     def test_analytics_sources_alias_renders_show_sources_help(self, capsys):
         # Arrange
-        from socialia.cli import main
         main(["analytics", "sources", "--help"])
         # Act
         out = capsys.readouterr().out
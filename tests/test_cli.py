@@ -9,6 +9,8 @@ import pytest
 
 from socialia.cli import main
 
+pytestmark = pytest.mark.cli
+
 
 # --- dry-run --------------------------------------------------------------
 
@@ -85,81 +87,59 @@ class TestCLINoCommand:
         # Assert
         assert "usage:" in out or "socialia" in out
 
-    def test_help_recursive_returns_exit_zero(self, capsys):
+    def test_help_recursive_returns_exit_zero(self, run_readonly):
         # Arrange
-        # (no setup)
+        argv = ("--help-recursive",)
         # Act
-        result = main(["--help-recursive"])
+        result, _, _ = run_readonly(argv)
         # Assert
         assert result == 0
 
-    def test_help_recursive_output_includes_post_subcommand(self, capsys):
+    def test_help_recursive_output_includes_post_subcommand(self, run_readonly):
         # Arrange
-        main(["--help-recursive"])
+        argv = ("--help-recursive",)
         # Act
-        out = capsys.readouterr().out.lower()
+        _, out, _ = run_readonly(argv)
         # Assert
-        assert "post" in out
+        assert "post" in out.lower()
 
-    def test_help_recursive_output_includes_delete_post_subcommand(self, capsys):
+    def test_help_recursive_output_includes_delete_post_subcommand(self, run_readonly):
         # Arrange
-        main(["--help-recursive"])
+        argv = ("--help-recursive",)
         # Act
-        out = capsys.readouterr().out.lower()
+        _, out, _ = run_readonly(argv)
         # Assert
-        assert "delete-post" in out
+        assert "delete-post" in out.lower()
 
 
 # --- show-status -----------------------------------------------------------
 
 
 class TestCLIStatus:
-    def test_show_status_canonical_returns_exit_zero(self, capsys):
+    def test_show_status_canonical_returns_exit_zero(self, run_readonly):
         # Arrange
-        # (no setup)
+        argv = ("show-status",)
         # Act
-        result = main(["show-status"])
+        result, _, _ = run_readonly(argv)
         # Assert
         assert result == 0
 
-    def test_show_status_canonical_output_mentions_socialia(self, capsys):
+    def test_show_status_canonical_output_mentions_socialia(self, run_readonly):
         # Arrange
-        main(["show-status"])
+        argv = ("show-status",)
         # Act
-        out = capsys.readouterr().out
+        _, out, _ = run_readonly(argv)
         # Assert
         assert "Socialia" in out or "socialia" in out.lower()
 
-    def test_status_deprecated_alias_returns_exit_zero(self, capsys):
-        # Arrange
-        # (no setup)
-        # Act
-        result = main(["status"])
-        # Assert
-        assert result == 0
-
-
-# --- mcp list-tools --------------------------------------------------------
-
-
-class TestCLIMCPListTools:
-    def test_mcp_list_tools_returns_exit_zero(self, capsys):
+    def test_status_deprecated_alias_returns_exit_zero(self, run_readonly):
         # Arrange
-        pytest.importorskip("fastmcp", reason="fastmcp not installed")
+        argv = ("status",)
         # Act
-        result = main(["mcp", "list-tools"])
+        result, _, _ = run_readonly(argv)
         # Assert
         assert result == 0
 
-    def test_mcp_list_tools_output_mentions_mcp_or_tools(self, capsys):
-        # Arrange
-        pytest.importorskip("fastmcp", reason="fastmcp not installed")
-        main(["mcp", "list-tools"])
-        # Act
-        out = capsys.readouterr().out
-        # Assert
-        assert "MCP" in out or "Tools" in out
-
 
 # --- completion -----------------------------------------------------------
 
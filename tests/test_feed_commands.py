@@ -9,11 +9,14 @@ at a tmp_path-backed file via the ``SOCIALIA_SCHEDULE_FILE`` env override
 honoured by the CLI wrapper.  No mocks.
 """
 
-import os
 from pathlib import Path
 
+import pytest
+
 from socialia.cli import main
 
+pytestmark = pytest.mark.cli
+
 
 # --- feed --help ------------------------------------------------------------
 
@@ -35,70 +38,40 @@ class TestFeedHelp:
         # Assert
         assert "feed" in out.lower()
 
-    def test_feed_help_documents_limit_flag(self, capsys):
-        # Arrange
-        main(["feed", "--help"])
-        # Act
-        out = capsys.readouterr().out
-        # Assert
-        assert "--limit" in out
-
-    def test_feed_help_documents_mentions_flag(self, capsys):
-        # Arrange
-        main(["feed", "--help"])
-        # Act
-        out = capsys.readouterr().out
-        # Assert
-        assert "--mentions" in out
-
-    def test_feed_help_documents_replies_flag(self, capsys):
-        # Arrange
-        main(["feed", "--help"])
-        # Act
-        out = capsys.readouterr().out
-        # Assert
-        assert "--replies" in out
-
-    def test_feed_help_documents_detail_flag(self, capsys):
+    @pytest.mark.parametrize("flag", ["--limit", "--mentions", "--replies", "--detail"])
+    def test_feed_help_documents_flag(self, capsys, flag):
         # Arrange
         main(["feed", "--help"])
         # Act
         out = capsys.readouterr().out
         # Assert
-        assert "--detail" in out
+        assert flag in out
 
 
 # --- check --help -----------------------------------------------------------
 
+# The deprecated ``check`` alias must behave exactly like ``check-platforms``.
+_CHECK_HELP_ARGVS = pytest.mark.parametrize(
+    "argv",
+    [["check-platforms", "--help"], ["check", "--help"]],
+    ids=["canonical", "deprecated-alias"],
+)
 
-class TestCheckHelp:
-    def test_check_platforms_canonical_help_returns_exit_zero(self, capsys):
-        # Arrange
-        # (no setup)
-        # Act
-        rc = main(["check-platforms", "--help"])
-        # Assert
-        assert rc == 0
 
-    def test_check_platforms_help_mentions_canonical_command_name(self, capsys):
-        # Arrange
-        main(["check-platforms", "--help"])
-        # Act
-        out = capsys.readouterr().out
-        # Assert
-        assert "check-platforms" in out
-
-    def test_check_deprecated_alias_returns_exit_zero(self, capsys):
+class TestCheckHelp:
+    @_CHECK_HELP_ARGVS
+    def test_check_help_returns_exit_zero(self, capsys, argv):
         # Arrange
         # (no setup)
         # Act
-        rc = main(["check", "--help"])
+        rc = main(argv)
         # Assert
         assert rc == 0
 
-    def test_check_deprecated_alias_help_routes_to_check_platforms(self, capsys):
+    @_CHECK_HELP_ARGVS
+    def test_check_help_mentions_canonical_command_name(self, capsys, argv):
         # Arrange
-        main(["check", "--help"])
+        main(argv)
         # Act
         out = capsys.readouterr().out
         # Assert
@@ -138,19 +111,12 @@ class TestMeHelp:
 
 
 class TestScheduleHelp:
-    def test_schedule_list_help_returns_exit_zero(self, capsys):
-        # Arrange
-        # (no setup)
-        # Act
-        rc = main(["schedule", "list", "--help"])
-        # Assert
-        assert rc == 0
-
-    def test_schedule_cancel_help_returns_exit_zero(self, capsys):
+    @pytest.mark.parametrize("subcommand", ["list", "cancel"])
+    def test_schedule_subcommand_help_returns_exit_zero(self, capsys, subcommand):
         # Arrange
         # (no setup)
         # Act
-        rc = main(["schedule", "cancel", "--help"])
+        rc = main(["schedule", subcommand, "--help"])
         # Assert
         assert rc == 0
 
@@ -162,21 +128,17 @@ class TestScheduleHelp:
         # Assert
         assert "JOB_ID" in out or "job_id" in out.lower()
 
-    def test_schedule_run_alias_renders_start_due_jobs_help(self, capsys):
-        # Arrange
-        main(["schedule", "run", "--help"])
-        # Act
-        out = capsys.readouterr().out
-        # Assert
-        assert "start-due-jobs" in out
-
-    def test_schedule_daemon_alias_renders_start_daemon_help(self, capsys):
+    @pytest.mark.parametrize(
+        "alias, canonical",
+        [("run", "start-due-jobs"), ("daemon", "start-daemon")],
+    )
+    def test_schedule_alias_renders_canonical_help(self, capsys, alias, canonical):
         # Arrange
-        main(["schedule", "daemon", "--help"])
+        main(["schedule", alias, "--help"])
         # Act
         out = capsys.readouterr().out
         # Assert
-        assert "start-daemon" in out
+        assert canonical in out
 
     def test_post_with_schedule_flag_does_not_crash(self, capsys):
         # Arrange
@@ -191,35 +153,12 @@ class TestScheduleHelp:
 
 
 class TestMCPParsing:
-    def test_mcp_start_help_returns_exit_zero(self, capsys):
-        # Arrange
-        # (no setup)
-        # Act
-        rc = main(["mcp", "start", "--help"])
-        # Assert
-        assert rc == 0
-
-    def test_mcp_doctor_help_returns_exit_zero(self, capsys):
+    @pytest.mark.parametrize("subcommand", ["doctor", "list-tools", "installation"])
+    def test_mcp_subcommand_help_returns_exit_zero(self, capsys, subcommand):
         # Arrange
         # (no setup)
         # Act
-        rc = main(["mcp", "doctor", "--help"])
-        # Assert
-        assert rc == 0
-
-    def test_mcp_list_tools_help_returns_exit_zero(self, capsys):
-        # Arrange
-        # (no setup)
-        # Act
-        rc = main(["mcp", "list-tools", "--help"])
-        # Assert
-        assert rc == 0
-
-    def test_mcp_installation_alias_returns_exit_zero(self, capsys):
-        # Arrange
-        # (no setup)
-        # Act
-        rc = main(["mcp", "installation", "--help"])
+        rc = main(["mcp", subcommand, "--help"])
         # Assert
         assert rc == 0
 
@@ -232,67 +171,6 @@ class TestMCPParsing:
         assert "show-installation" in out
 
 
-# --- mcp commands ----------------------------------------------------------
-
-
-class TestMCPCommands:
-    def test_mcp_doctor_command_completes(self, capsys):
-        # Arrange
-        # (no setup)
-        # Act
-        rc = main(["mcp", "doctor"])
-        # Assert
-        assert rc in (0, 1)
-
-    def test_mcp_doctor_output_contains_health_check_header(self, capsys):
-        # Arrange
-        main(["mcp", "doctor"])
-        # Act
-        out = capsys.readouterr().out
-        # Assert
-        assert "Health Check" in out
-
-    def test_mcp_doctor_output_includes_twitter_platform_row(self, capsys):
-        # Arrange
-        main(["mcp", "doctor"])
-        # Act
-        out = capsys.readouterr().out
-        # Assert
-        assert "Twitter" in out
-
-    def test_mcp_show_installation_returns_exit_zero(self, capsys):
-        # Arrange
-        # (no setup)
-        # Act
-        rc = main(["mcp", "show-installation"])
-        # Assert
-        assert rc == 0
-
-    def test_mcp_show_installation_mentions_claude_desktop(self, capsys):
-        # Arrange
-        main(["mcp", "show-installation"])
-        # Act
-        out = capsys.readouterr().out
-        # Assert
-        assert "Claude Desktop" in out
-
-    def test_mcp_show_installation_renders_mcp_servers_block(self, capsys):
-        # Arrange
-        main(["mcp", "show-installation"])
-        # Act
-        out = capsys.readouterr().out
-        # Assert
-        assert "mcpServers" in out
-
-    def test_mcp_show_installation_mentions_socialia_entry(self, capsys):
-        # Arrange
-        main(["mcp", "show-installation"])
-        # Act
-        out = capsys.readouterr().out
-        # Assert
-        assert "socialia" in out
-
-
 # --- schedule list / cancel (CLI integration) -------------------------------
 
 
@@ -333,7 +211,6 @@ class TestScheduleCommands:
     ):
         # Arrange
         schedule_file = tmp_path / "scheduled.json"
-        schedule_file.write_text("[]")
         _override_schedule_file(env_save_restore, schedule_file)
         try:
             # Act
@@ -350,7 +227,6 @@ class TestScheduleCommands:
     ):
         # Arrange
         schedule_file = tmp_path / "scheduled.json"
-        schedule_file.write_text("[]")
         _override_schedule_file(env_save_restore, schedule_file)
         try:
             main(["schedule", "list"])
@@ -368,7 +244,6 @@ class TestScheduleCommands:
     ):
         # Arrange
         schedule_file = tmp_path / "scheduled.json"
-        schedule_file.write_text("[]")
         _override_schedule_file(env_save_restore, schedule_file)
         try:
             # Act
@@ -385,7 +260,6 @@ class TestScheduleCommands:
     ):
         # Arrange
         schedule_file = tmp_path / "scheduled.json"
-        schedule_file.write_text("[]")
         _override_schedule_file(env_save_restore, schedule_file)
         try:
             main(["schedule", "cancel", "nonexistent", "--yes"])
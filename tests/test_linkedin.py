@@ -5,8 +5,10 @@ construct a hand-rolled ``FakeRequestsModule`` (see ``conftest.py``) and
 configure ``FakeResponse`` objects ahead of each call.  No mocks.
 """
 
-import importlib
+import pytest
+import requests
 
+from socialia import _branding
 from socialia.linkedin import LinkedIn
 
 from tests.conftest import FakeResponse
@@ -15,14 +17,30 @@ from tests.conftest import FakeResponse
 # --- Helpers ----------------------------------------------------------------
 
 
-def _clear_linkedin_env(env):
-    """Clear LinkedIn token env vars across known brand prefixes."""
-    env.delete("SOCIALIA_ENV_PREFIX")
-    for prefix in ("SOCIALIA", "SCITEX", "SCITEX_SOCIAL"):
-        env.delete(f"{prefix}_LINKEDIN_ACCESS_TOKEN")
-    from socialia import _branding
+_LINKEDIN_TOKEN_VARS = tuple(
+    f"{prefix}_LINKEDIN_ACCESS_TOKEN"
+    for prefix in ("SOCIALIA", "SCITEX", "SCITEX_SOCIAL")
+)
 
-    importlib.reload(_branding)
+
+@pytest.fixture
+def cleared_linkedin_env(env_save_restore):
+    """``env_save_restore`` with LinkedIn token vars cleared across prefixes."""
+    env_save_restore.delete("SOCIALIA_ENV_PREFIX")
+    for key in _LINKEDIN_TOKEN_VARS:
+        env_save_restore.delete(key)
+    _branding.refresh()
+    return env_save_restore
+
+
+# Canned responses shared across tests; the client only reads them.
+_USERINFO = FakeResponse(status_code=200, json_data={"sub": "user123"})
+_SHARE_CREATED = FakeResponse(
+    status_code=201, json_data={}, headers={"X-RestLi-Id": "share123"}
+)
+_UNAUTHORIZED = FakeResponse(status_code=401, text="Unauthorized")
+_DELETED = FakeResponse(status_code=204)
+_NOT_FOUND = FakeResponse(status_code=404, text="Not Found")
 
 
 # --- Initialisation ---------------------------------------------------------
@@ -39,15 +57,22 @@ class TestLinkedInInit:
         # Assert
         assert client.access_token == "test_linkedin_token"
 
-    def test_init_from_environment_reads_access_token(self, env_save_restore):
+    def test_init_from_environment_reads_access_token(self, cleared_linkedin_env):
         # Arrange
-        _clear_linkedin_env(env_save_restore)
-        env_save_restore.set("SOCIALIA_LINKEDIN_ACCESS_TOKEN", "env_token")
+        cleared_linkedin_env.set("SOCIALIA_LINKEDIN_ACCESS_TOKEN", "env_token")
         # Act
         client = LinkedIn()
         # Assert
         assert client.access_token == "env_token"
 
+    def test_init_without_http_uses_keep_alive_session(self, linkedin_credentials):
+        # Arrange
+        creds = linkedin_credentials
+        # Act
+        client = LinkedIn(**creds)
+        # Assert
+        assert isinstance(client._http, requests.Session)
+
 
 # --- Validation -------------------------------------------------------------
 
@@ -64,10 +89,9 @@ class TestLinkedInValidateCredentials:
         assert ok is True
 
     def test_validate_credentials_returns_false_when_token_absent(
-        self, env_save_restore
+        self, cleared_linkedin_env
     ):
         # Arrange
-        _clear_linkedin_env(env_save_restore)
         client = LinkedIn()
         # Act
         ok = client.validate_credentials()
@@ -79,20 +103,16 @@ class TestLinkedInValidateCredentials:
 
 
 class TestLinkedInPost:
-    def test_post_without_credentials_reports_success_false(
-        self, env_save_restore
-    ):
+    def test_post_without_credentials_reports_success_false(self, cleared_linkedin_env):
         # Arrange
-        _clear_linkedin_env(env_save_restore)
         client = LinkedIn()
         # Act
         result = client.post("Test")
         # Assert
         assert result["success"] is False
 
-    def test_post_without_credentials_error_mentions_token(self, env_save_restore):
+    def test_post_without_credentials_error_mentions_token(self, cleared_linkedin_env):
         # Arrange
-        _clear_linkedin_env(env_save_restore)
         client = LinkedIn()
         # Act
         result = client.post("Test")
@@ -100,83 +120,56 @@ class TestLinkedInPost:
         assert "token" in result["error"].lower()
 
     def test_get_user_urn_builds_person_urn_from_userinfo_sub(
-        self, linkedin_credentials, fake_http
+        self, linkedin_client, fake_http
     ):
         # Arrange
-        fake_http.get_response = FakeResponse(
-            status_code=200, json_data={"sub": "user123"}
-        )
-        client = LinkedIn(**linkedin_credentials, http=fake_http)
+        fake_http.get_response = _USERINFO
         # Act
-        urn = client._get_user_urn()
+        urn = linkedin_client._get_user_urn()
         # Assert
         assert urn == "urn:li:person:user123"
 
     def test_post_success_marks_success_true(
-        self, linkedin_credentials, fake_http
+        self, linkedin_client, fake_http
     ):
         # Arrange
-        fake_http.get_response = FakeResponse(
-            status_code=200, json_data={"sub": "user123"}
-        )
-        fake_http.post_response = FakeResponse(
-            status_code=201,
-            json_data={},
-            headers={"X-RestLi-Id": "share123"},
-        )
-        client = LinkedIn(**linkedin_credentials, http=fake_http)
+        fake_http.get_response = _USERINFO
+        fake_http.post_response = _SHARE_CREATED
         # Act
-        result = client.post("Hello LinkedIn!")
+        result = linkedin_client.post("Hello LinkedIn!")
         # Assert
         assert result["success"] is True
 
     def test_post_success_returns_post_id_from_response_header(
-        self, linkedin_credentials, fake_http
+        self, linkedin_client, fake_http
     ):
         # Arrange
-        fake_http.get_response = FakeResponse(
-            status_code=200, json_data={"sub": "user123"}
-        )
-        fake_http.post_response = FakeResponse(
-            status_code=201,
-            json_data={},
-            headers={"X-RestLi-Id": "share123"},
-        )
-        client = LinkedIn(**linkedin_credentials, http=fake_http)
+        fake_http.get_response = _USERINFO
+        fake_http.post_response = _SHARE_CREATED
         # Act
-        result = client.post("Hello LinkedIn!")
+        result = linkedin_client.post("Hello LinkedIn!")
         # Assert
         assert result["id"] == "share123"
 
     def test_post_failure_marks_success_false(
-        self, linkedin_credentials, fake_http
+        self, linkedin_client, fake_http
     ):
         # Arrange
-        fake_http.get_response = FakeResponse(
-            status_code=200, json_data={"sub": "user123"}
-        )
-        fake_http.post_response = FakeResponse(
-            status_code=401, text="Unauthorized"
-        )
-        client = LinkedIn(**linkedin_credentials, http=fake_http)
+        fake_http.get_response = _USERINFO
+        fake_http.post_response = _UNAUTHORIZED
         # Act
-        result = client.post("Test post")
+        result = linkedin_client.post("Test post")
         # Assert
         assert result["success"] is False
 
     def test_post_failure_includes_status_code_in_error(
-        self, linkedin_credentials, fake_http
+        self, linkedin_client, fake_http
     ):
         # Arrange
-        fake_http.get_response = FakeResponse(
-            status_code=200, json_data={"sub": "user123"}
-        )
-        fake_http.post_response = FakeResponse(
-            status_code=401, text="Unauthorized"
-        )
-        client = LinkedIn(**linkedin_credentials, http=fake_http)
+        fake_http.get_response = _USERINFO
+        fake_http.post_response = _UNAUTHORIZED
         # Act
-        result = client.post("Test post")
+        result = linkedin_client.post("Test post")
         # Assert
         assert "401" in result["error"]
 
@@ -186,49 +179,41 @@ class TestLinkedInPost:
 
 class TestLinkedInDelete:
     def test_delete_success_marks_success_true(
-        self, linkedin_credentials, fake_http
+        self, linkedin_client, fake_http
     ):
         # Arrange
-        fake_http.delete_response = FakeResponse(status_code=204)
-        client = LinkedIn(**linkedin_credentials, http=fake_http)
+        fake_http.delete_response = _DELETED
         # Act
-        result = client.delete("share123")
+        result = linkedin_client.delete("share123")
         # Assert
         assert result["success"] is True
 
     def test_delete_success_marks_deleted_true(
-        self, linkedin_credentials, fake_http
+        self, linkedin_client, fake_http
     ):
         # Arrange
-        fake_http.delete_response = FakeResponse(status_code=204)
-        client = LinkedIn(**linkedin_credentials, http=fake_http)
+        fake_http.delete_response = _DELETED
         # Act
-        result = client.delete("share123")
+        result = linkedin_client.delete("share123")
         # Assert
         assert result["deleted"] is True
 
     def test_delete_failure_marks_success_false(
-        self, linkedin_credentials, fake_http
+        self, linkedin_client, fake_http
     ):
         # Arrange
-        fake_http.delete_response = FakeResponse(
-            status_code=404, text="Not Found"
-        )
-        client = LinkedIn(**linkedin_credentials, http=fake_http)
+        fake_http.delete_response = _NOT_FOUND
         # Act
-        result = client.delete("invalid_id")
+        result = linkedin_client.delete("invalid_id")
         # Assert
         assert result["success"] is False
 
     def test_delete_failure_includes_status_code_in_error(
-        self, linkedin_credentials, fake_http
+        self, linkedin_client, fake_http
     ):
         # Arrange
-        fake_http.delete_response = FakeResponse(
-            status_code=404, text="Not Found"
-        )
-        client = LinkedIn(**linkedin_credentials, http=fake_http)
+        fake_http.delete_response = _NOT_FOUND
         # Act
-        result = client.delete("invalid_id")
+        result = linkedin_client.delete("invalid_id")
         # Assert
         assert "404" in result["error"]
@@ -1,182 +1,95 @@
-"""Tests for socialia MCP server module."""
+"""Tests for socialia MCP server module.
+
+This is the single home for the ``socialia mcp ...`` command tests; only the
+tool listing and server module need the optional ``fastmcp`` dependency.
+"""
 
 import pytest
 
-fastmcp = pytest.importorskip("fastmcp", reason="fastmcp not installed")
+from socialia.cli import main
+
+pytestmark = pytest.mark.cli
 
 
 # --- mcp list-tools --------------------------------------------------------
 
 
 class TestMCPToolsList:
-    def test_mcp_list_tools_returns_exit_zero(self, capsys):
+    def test_mcp_list_tools_returns_exit_zero(self, run_readonly):
         # Arrange
-        from socialia.cli import main
+        pytest.importorskip("fastmcp", reason="fastmcp not installed")
+        argv = ("mcp", "list-tools")
         # Act
-        result = main(["mcp", "list-tools"])
+        result, _, _ = run_readonly(argv)
         # Assert
         assert result == 0
 
-    def test_mcp_list_tools_output_includes_social_post(self, capsys):
+    @pytest.mark.parametrize(
+        "tool",
+        [
+            "social_post",
+            "social_delete",
+            "social_status",
+            "analytics_track",
+            "analytics_realtime",
+        ],
+    )
+    def test_mcp_list_tools_output_includes_tool(self, run_readonly, tool):
         # Arrange
-        from socialia.cli import main
-        main(["mcp", "list-tools"])
+        pytest.importorskip("fastmcp", reason="fastmcp not installed")
+        argv = ("mcp", "list-tools")
         # Act
-        out = capsys.readouterr().out
+        _, out, _ = run_readonly(argv)
         # Assert
-        assert "social_post" in out
-
-    def test_mcp_list_tools_output_includes_social_delete(self, capsys):
-        # Arrange
-        from socialia.cli import main
-        main(["mcp", "list-tools"])
-        # Act
-        out = capsys.readouterr().out
-        # Assert
-        assert "social_delete" in out
-
-    def test_mcp_list_tools_output_includes_social_status(self, capsys):
-        # Arrange
-        from socialia.cli import main
-        main(["mcp", "list-tools"])
-        # Act
-        out = capsys.readouterr().out
-        # Assert
-        assert "social_status" in out
-
-    def test_mcp_list_tools_output_includes_analytics_track(self, capsys):
-        # Arrange
-        from socialia.cli import main
-        main(["mcp", "list-tools"])
-        # Act
-        out = capsys.readouterr().out
-        # Assert
-        assert "analytics_track" in out
-
-    def test_mcp_list_tools_output_includes_analytics_realtime(self, capsys):
-        # Arrange
-        from socialia.cli import main
-        main(["mcp", "list-tools"])
-        # Act
-        out = capsys.readouterr().out
-        # Assert
-        assert "analytics_realtime" in out
+        assert tool in out
 
 
 # --- mcp doctor ------------------------------------------------------------
 
 
 class TestMCPDoctor:
-    def test_mcp_doctor_returns_zero_or_one(self, capsys):
+    def test_mcp_doctor_returns_zero_or_one(self, run_readonly):
         # Arrange
-        from socialia.cli import main
+        argv = ("mcp", "doctor")
         # Act
-        result = main(["mcp", "doctor"])
+        result, _, _ = run_readonly(argv)
         # Assert
         assert result in (0, 1)
 
-    def test_mcp_doctor_output_contains_health_check_header(self, capsys):
-        # Arrange
-        from socialia.cli import main
-        main(["mcp", "doctor"])
-        # Act
-        out = capsys.readouterr().out
-        # Assert
-        assert "Health Check" in out
-
-    def test_mcp_doctor_output_lists_twitter_platform(self, capsys):
+    @pytest.mark.parametrize(
+        "needle", ["Health Check", "Twitter", "LinkedIn", "Reddit"]
+    )
+    def test_mcp_doctor_output_lists_header_and_platforms(self, run_readonly, needle):
         # Arrange
-        from socialia.cli import main
-        main(["mcp", "doctor"])
+        argv = ("mcp", "doctor")
         # Act
-        out = capsys.readouterr().out
+        _, out, _ = run_readonly(argv)
         # Assert
-        assert "Twitter" in out
-
-    def test_mcp_doctor_output_lists_linkedin_platform(self, capsys):
-        # Arrange
-        from socialia.cli import main
-        main(["mcp", "doctor"])
-        # Act
-        out = capsys.readouterr().out
-        # Assert
-        assert "LinkedIn" in out
-
-    def test_mcp_doctor_output_lists_reddit_platform(self, capsys):
-        # Arrange
-        from socialia.cli import main
-        main(["mcp", "doctor"])
-        # Act
-        out = capsys.readouterr().out
-        # Assert
-        assert "Reddit" in out
+        assert needle in out
 
 
 # --- mcp installation ------------------------------------------------------
 
 
 class TestMCPInstallation:
-    def test_mcp_installation_returns_exit_zero(self, capsys):
+    def test_mcp_installation_returns_exit_zero(self, run_readonly):
         # Arrange
-        from socialia.cli import main
+        argv = ("mcp", "installation")
         # Act
-        rc = main(["mcp", "installation"])
+        rc, _, _ = run_readonly(argv)
         # Assert
         assert rc == 0
 
-    def test_mcp_installation_output_mentions_claude_desktop(self, capsys):
-        # Arrange
-        from socialia.cli import main
-        main(["mcp", "installation"])
-        # Act
-        out = capsys.readouterr().out
-        # Assert
-        assert "Claude Desktop" in out
-
-    def test_mcp_installation_output_renders_mcp_servers_section(self, capsys):
-        # Arrange
-        from socialia.cli import main
-        main(["mcp", "installation"])
-        # Act
-        out = capsys.readouterr().out
-        # Assert
-        assert "mcpServers" in out
-
-    def test_mcp_installation_output_mentions_socialia_entry(self, capsys):
+    @pytest.mark.parametrize(
+        "needle", ["Claude Desktop", "mcpServers", "socialia", "{", "}", "command"]
+    )
+    def test_mcp_installation_output_renders_config_snippet(self, run_readonly, needle):
         # Arrange
-        from socialia.cli import main
-        main(["mcp", "installation"])
+        argv = ("mcp", "installation")
         # Act
-        out = capsys.readouterr().out
-        # Assert
-        assert "socialia" in out
-
-    def test_mcp_installation_output_renders_json_open_brace(self, capsys):
-        # Arrange
-        from socialia.cli import main
-        main(["mcp", "installation"])
-        # Act
-        out = capsys.readouterr().out
-        # Assert
-        assert "{" in out
-
-    def test_mcp_installation_output_renders_json_close_brace(self, capsys):
-        # Arrange
-        from socialia.cli import main
-        main(["mcp", "installation"])
-        # Act
-        out = capsys.readouterr().out
-        # Assert
-        assert "}" in out
-
-    def test_mcp_installation_output_documents_command_key(self, capsys):
-        # Arrange
-        from socialia.cli import main
-        main(["mcp", "installation"])
-        # Act
-        out = capsys.readouterr().out
+        _, out, _ = run_readonly(argv)
         # Assert
-        assert '"command"' in out or "command" in out
+        assert needle in out
 
 
 # --- mcp_server module surface --------------------------------------------
@@ -185,6 +98,7 @@ class TestMCPInstallation:
 class TestMCPServerModuleImports:
     def test_mcp_server_module_imports_cleanly(self):
         # Arrange
+        pytest.importorskip("fastmcp", reason="fastmcp not installed")
         from socialia import mcp_server
         # Act
         module = mcp_server
@@ -193,6 +107,7 @@ class TestMCPServerModuleImports:
 
     def test_get_tools_returns_list_or_dict_when_available(self):
         # Arrange
+        pytest.importorskip("fastmcp", reason="fastmcp not installed")
         import importlib
 
         mod = importlib.import_module("socialia.mcp_server")
@@ -212,7 +127,7 @@ class TestMCPServerModuleImports:
 class TestMCPStartHelp:
     def test_mcp_start_help_returns_exit_zero(self, capsys):
         # Arrange
-        from socialia.cli import main
+        # (no setup)
         # Act
         rc = main(["mcp", "start", "--help"])
         # Assert
@@ -220,7 +135,6 @@ class TestMCPStartHelp:
 
     def test_mcp_start_help_mentions_start_subcommand(self, capsys):
         # Arrange
-        from socialia.cli import main
         main(["mcp", "start", "--help"])
         # Act
         out = capsys.readouterr().out
@@ -229,7 +143,6 @@ class TestMCPStartHelp:
 
     def test_mcp_start_help_documents_dry_run_flag(self, capsys):
         # Arrange
-        from socialia.cli import main
         main(["mcp", "start", "--help"])
         # Act
         out = capsys.readouterr().out
@@ -238,7 +151,6 @@ class TestMCPStartHelp:
 
     def test_mcp_start_help_documents_yes_flag(self, capsys):
         # Arrange
-        from socialia.cli import main
         main(["mcp", "start", "--help"])
         # Act
         out = capsys.readouterr().out
@@ -247,7 +159,7 @@ class TestMCPStartHelp:
 
     def test_mcp_root_without_subcommand_returns_zero_or_one(self, capsys):
         # Arrange
-        from socialia.cli import main
+        # (no setup)
         # Act
         result = main(["mcp"])
         # Assert
@@ -5,14 +5,14 @@ from datetime import datetime, timedelta
 
 import pytest
 
+from socialia.cli import main
 from socialia.org import OrgDraft, OrgDraftManager, OrgParser
 
 
 # --- Shared fixtures --------------------------------------------------------
 
 
-@pytest.fixture
-def sample_org_content():
+def _build_sample_org_content() -> str:
     """Sample org file content for testing."""
     tomorrow = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")
     yesterday = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
@@ -53,18 +53,37 @@ This was already posted.
 """
 
 
+# Built once at import; the dates are a day either side of now, so the
+# due/scheduled split holds for the length of any test run.
+_SAMPLE_ORG_CONTENT = _build_sample_org_content()
+
+
 @pytest.fixture
-def org_file(sample_org_content, tmp_path):
-    """Create a temporary org file."""
+def org_file(tmp_path):
+    """Create a temporary org file (per test, safe to modify)."""
     filepath = tmp_path / "test_drafts.org"
-    filepath.write_text(sample_org_content)
+    filepath.write_text(_SAMPLE_ORG_CONTENT)
     return filepath
 
 
-@pytest.fixture
-def parsed_drafts(org_file):
+@pytest.fixture(scope="module")
+def shared_org_file(tmp_path_factory):
+    """Sample org file written once per module, for read-only tests."""
+    filepath = tmp_path_factory.mktemp("org") / "test_drafts.org"
+    filepath.write_text(_SAMPLE_ORG_CONTENT)
+    return filepath
+
+
+@pytest.fixture(scope="module")
+def parsed_drafts(shared_org_file):
     """Parsed drafts from the shared sample org file."""
-    return OrgParser(org_file).parse()
+    return OrgParser(shared_org_file).parse()
+
+
+@pytest.fixture(scope="module")
+def manager(shared_org_file):
+    """Draft manager over the shared sample org file."""
+    return OrgDraftManager(shared_org_file)
 
 
 # --- OrgParser -------------------------------------------------------------
@@ -79,101 +98,32 @@ class TestOrgParser:
         # Assert
         assert count == 3
 
-    def test_parse_first_draft_headline_is_future_post(self, parsed_drafts):
-        # Arrange
-        # (drafts already parsed by fixture)
-        # Act
-        headline = parsed_drafts[0].headline
-        # Assert
-        assert headline == "Future Post"
-
-    def test_parse_second_draft_headline_is_due_post(self, parsed_drafts):
-        # Arrange
-        # (drafts already parsed by fixture)
-        # Act
-        headline = parsed_drafts[1].headline
-        # Assert
-        assert headline == "Due Post"
-
-    def test_parse_third_draft_headline_is_completed_post(self, parsed_drafts):
-        # Arrange
-        # (drafts already parsed by fixture)
-        # Act
-        headline = parsed_drafts[2].headline
-        # Assert
-        assert headline == "Completed Post"
-
-    def test_parse_first_draft_status_is_todo(self, parsed_drafts):
-        # Arrange
-        # (drafts already parsed by fixture)
-        # Act
-        status = parsed_drafts[0].status
-        # Assert
-        assert status == "TODO"
-
-    def test_parse_second_draft_status_is_todo(self, parsed_drafts):
-        # Arrange
-        # (drafts already parsed by fixture)
-        # Act
-        status = parsed_drafts[1].status
-        # Assert
-        assert status == "TODO"
-
-    def test_parse_third_draft_status_is_done(self, parsed_drafts):
-        # Arrange
-        # (drafts already parsed by fixture)
-        # Act
-        status = parsed_drafts[2].status
-        # Assert
-        assert status == "DONE"
-
-    def test_parse_first_draft_priority_is_a(self, parsed_drafts):
-        # Arrange
-        # (drafts already parsed by fixture)
-        # Act
-        priority = parsed_drafts[0].priority
-        # Assert
-        assert priority == "A"
-
-    def test_parse_second_draft_priority_is_b(self, parsed_drafts):
-        # Arrange
-        # (drafts already parsed by fixture)
-        # Act
-        priority = parsed_drafts[1].priority
-        # Assert
-        assert priority == "B"
-
-    def test_parse_third_draft_priority_is_c(self, parsed_drafts):
-        # Arrange
-        # (drafts already parsed by fixture)
-        # Act
-        priority = parsed_drafts[2].priority
-        # Assert
-        assert priority == "C"
-
-    def test_parse_first_draft_platform_is_twitter(self, parsed_drafts):
-        # Arrange
-        # (drafts already parsed by fixture)
-        # Act
-        platform = parsed_drafts[0].platform
-        # Assert
-        assert platform == "twitter"
-
-    def test_parse_second_draft_platform_is_twitter(self, parsed_drafts):
-        # Arrange
-        # (drafts already parsed by fixture)
-        # Act
-        platform = parsed_drafts[1].platform
-        # Assert
-        assert platform == "twitter"
-
-    def test_parse_third_draft_platform_is_linkedin(self, parsed_drafts):
+    @pytest.mark.parametrize(
+        "index, field, expected",
+        [
+            (0, "headline", "Future Post"),
+            (1, "headline", "Due Post"),
+            (2, "headline", "Completed Post"),
+            (0, "status", "TODO"),
+            (1, "status", "TODO"),
+            (2, "status", "DONE"),
+            (0, "priority", "A"),
+            (1, "priority", "B"),
+            (2, "priority", "C"),
+            (0, "platform", "twitter"),
+            (1, "platform", "twitter"),
+            (2, "platform", "linkedin"),
+        ],
+    )
+    def test_parse_reads_draft_field_from_sample(
+        self, parsed_drafts, index, field, expected
+    ):
         # Arrange
-        # (drafts already parsed by fixture)
+        draft = parsed_drafts[index]
         # Act
-        platform = parsed_drafts[2].platform
+        value = getattr(draft, field)
         # Assert
-        assert platform == "linkedin"
+        assert value == expected
 
     def test_parse_first_draft_has_scheduled_timestamp_present(
         self, parsed_drafts
@@ -334,143 +284,152 @@ class TestOrgDraftIsDue:
         assert result is False
 
 
+class TestOrgParserUpdateStatus:
+    def test_update_status_inserts_keyword_into_headline_without_one(self, tmp_path):
+        # Arrange
+        filepath = tmp_path / "test.org"
+        filepath.write_text("** Untagged Post\n")
+        draft = _draft(status="", line_number=0)
+        # Act
+        OrgParser(filepath).update_status(draft, "DONE")
+        # Assert
+        assert filepath.read_text() == "** DONE Untagged Post\n"
+
+
 # --- OrgDraftManager -------------------------------------------------------
 
 
 class TestOrgDraftManager:
-    def test_list_drafts_returns_all_three_entries(self, org_file):
+    def test_list_drafts_returns_all_three_entries(self, manager):
         # Arrange
-        manager = OrgDraftManager(org_file)
+        # (manager shared across the module)
         # Act
         drafts = manager.list_drafts()
         # Assert
         assert len(drafts) == 3
 
-    def test_list_drafts_filter_todo_returns_two_entries(self, org_file):
+    def test_list_drafts_filter_todo_returns_two_entries(self, manager):
         # Arrange
-        manager = OrgDraftManager(org_file)
+        # (manager shared across the module)
         # Act
         pending = manager.list_drafts(status="TODO")
         # Assert
         assert len(pending) == 2
 
-    def test_list_drafts_filter_done_returns_one_entry(self, org_file):
+    def test_list_drafts_filter_done_returns_one_entry(self, manager):
         # Arrange
-        manager = OrgDraftManager(org_file)
+        # (manager shared across the module)
         # Act
         done = manager.list_drafts(status="DONE")
         # Assert
         assert len(done) == 1
 
-    def test_get_pending_returns_two_entries(self, org_file):
+    def test_get_pending_returns_two_entries(self, manager):
         # Arrange
-        manager = OrgDraftManager(org_file)
+        # (manager shared across the module)
         # Act
         pending = manager.get_pending()
         # Assert
         assert len(pending) == 2
 
-    def test_get_pending_returns_only_todo_status_entries(self, org_file):
+    def test_get_pending_returns_only_todo_status_entries(self, manager):
         # Arrange
-        manager = OrgDraftManager(org_file)
+        # (manager shared across the module)
         # Act
         pending = manager.get_pending()
         # Assert
         assert all(d.status == "TODO" for d in pending)
 
-    def test_get_due_returns_one_entry_for_yesterday_schedule(self, org_file):
+    def test_get_due_returns_one_entry_for_yesterday_schedule(self, manager):
         # Arrange
-        manager = OrgDraftManager(org_file)
+        # (manager shared across the module)
         # Act
         due = manager.get_due()
         # Assert
         assert len(due) == 1
 
-    def test_get_due_returns_due_post_headline(self, org_file):
+    def test_get_due_returns_due_post_headline(self, manager):
         # Arrange
-        manager = OrgDraftManager(org_file)
+        # (manager shared across the module)
         # Act
         due = manager.get_due()
         # Assert
         assert due[0].headline == "Due Post"
 
-    def test_get_scheduled_returns_one_future_entry(self, org_file):
+    def test_get_scheduled_returns_one_future_entry(self, manager):
         # Arrange
-        manager = OrgDraftManager(org_file)
+        # (manager shared across the module)
         # Act
         scheduled = manager.get_scheduled()
         # Assert
         assert len(scheduled) == 1
 
-    def test_get_scheduled_returns_future_post_headline(self, org_file):
+    def test_get_scheduled_returns_future_post_headline(self, manager):
         # Arrange
-        manager = OrgDraftManager(org_file)
+        # (manager shared across the module)
         # Act
         scheduled = manager.get_scheduled()
         # Assert
         assert scheduled[0].headline == "Future Post"
 
-    def test_status_report_total_is_three(self, org_file):
+    def test_status_report_total_is_three(self, manager):
         # Arrange
-        manager = OrgDraftManager(org_file)
+        # (manager shared across the module)
         # Act
         report = manager.status_report()
         # Assert
         assert report["total"] == 3
 
-    def test_status_report_pending_is_two(self, org_file):
+    def test_status_report_pending_is_two(self, manager):
         # Arrange
-        manager = OrgDraftManager(org_file)
+        # (manager shared across the module)
         # Act
         report = manager.status_report()
         # Assert
         assert report["pending"] == 2
 
-    def test_status_report_done_is_one(self, org_file):
+    def test_status_report_done_is_one(self, manager):
         # Arrange
-        manager = OrgDraftManager(org_file)
+        # (manager shared across the module)
         # Act
         report = manager.status_report()
         # Assert
         assert report["done"] == 1
 
-    def test_status_report_due_now_is_one(self, org_file):
+    def test_status_report_due_now_is_one(self, manager):
         # Arrange
-        manager = OrgDraftManager(org_file)
+        # (manager shared across the module)
         # Act
         report = manager.status_report()
         # Assert
         assert report["due_now"] == 1
 
-    def test_status_report_scheduled_is_one(self, org_file):
+    def test_status_report_scheduled_is_one(self, manager):
         # Arrange
-        manager = OrgDraftManager(org_file)
+        # (manager shared across the module)
         # Act
         report = manager.status_report()
         # Assert
         assert report["scheduled"] == 1
 
-    def test_post_draft_dry_run_marks_success_true(self, org_file):
+    def test_post_draft_dry_run_marks_success_true(self, manager):
         # Arrange
-        manager = OrgDraftManager(org_file)
         draft = manager.get_pending()[0]
         # Act
         result = manager.post_draft(draft, dry_run=True)
         # Assert
         assert result["success"] is True
 
-    def test_post_draft_dry_run_marks_dry_run_flag_true(self, org_file):
+    def test_post_draft_dry_run_marks_dry_run_flag_true(self, manager):
         # Arrange
-        manager = OrgDraftManager(org_file)
         draft = manager.get_pending()[0]
         # Act
         result = manager.post_draft(draft, dry_run=True)
         # Assert
         assert result["dry_run"] is True
 
-    def test_post_draft_dry_run_returns_platform_from_draft(self, org_file):
+    def test_post_draft_dry_run_returns_platform_from_draft(self, manager):
         # Arrange
-        manager = OrgDraftManager(org_file)
         draft = manager.get_pending()[0]
         # Act
         result = manager.post_draft(draft, dry_run=True)
@@ -482,41 +441,29 @@ class TestOrgDraftManager:
 
 
 class TestOrgCLI:
-    def test_org_status_command_returns_exit_zero(self, org_file):
-        # Arrange
-        from socialia.cli import main
-        # Act
-        result = main(["org", "status", str(org_file)])
-        # Assert
-        assert result == 0
-
-    def test_org_list_command_returns_exit_zero(self, org_file):
-        # Arrange
-        from socialia.cli import main
-        # Act
-        result = main(["org", "list", str(org_file)])
-        # Assert
-        assert result == 0
-
-    def test_org_schedule_dry_run_returns_exit_zero(self, org_file):
-        # Arrange
-        from socialia.cli import main
-        # Act
-        result = main(["org", "schedule", str(org_file), "--dry-run"])
-        # Assert
-        assert result == 0
-
-    def test_org_post_dry_run_returns_exit_zero(self, org_file):
+    pytestmark = pytest.mark.cli
+
+    @pytest.mark.parametrize(
+        "subcommand, extra",
+        [
+            ("status", []),
+            ("list", []),
+            ("schedule", ["--dry-run"]),
+            ("post", ["--dry-run"]),
+        ],
+    )
+    def test_org_command_on_sample_file_returns_exit_zero(
+        self, org_file, subcommand, extra
+    ):
         # Arrange
-        from socialia.cli import main
+        argv = ["org", subcommand, str(org_file), *extra]
         # Act
-        result = main(["org", "post", str(org_file), "--dry-run"])
+        result = main(argv)
         # Assert
         assert result == 0
 
     def test_org_init_command_returns_exit_zero(self, tmp_path):
         # Arrange
-        from socialia.cli import main
         filepath = tmp_path / "new_drafts.org"
         # Act
         result = main(["org", "init", str(filepath)])
@@ -525,7 +472,6 @@ class TestOrgCLI:
 
     def test_org_init_creates_target_org_file(self, tmp_path):
         # Arrange
-        from socialia.cli import main
         filepath = tmp_path / "new_drafts.org"
         # Act
         main(["org", "init", str(filepath)])
@@ -534,7 +480,6 @@ class TestOrgCLI:
 
     def test_org_init_writes_title_directive_into_file(self, tmp_path):
         # Arrange
-        from socialia.cli import main
         filepath = tmp_path / "new_drafts.org"
         main(["org", "init", str(filepath)])
         # Act
@@ -544,7 +489,6 @@ class TestOrgCLI:
 
     def test_org_init_writes_todo_keyword_into_file(self, tmp_path):
         # Arrange
-        from socialia.cli import main
         filepath = tmp_path / "new_drafts.org"
         main(["org", "init", str(filepath)])
         # Act
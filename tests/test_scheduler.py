@@ -21,41 +21,78 @@ from socialia.scheduler import (
 
 # --- Helpers ----------------------------------------------------------------
 
+# Fixed reference time for parse_schedule_time, so relative results are exact.
+_NOW = datetime(2026, 1, 1, 12, 0)
+
 
 @pytest.fixture
 def schedule_file(tmp_path):
-    """Per-test scheduler JSON file under tmp_path."""
-    sf = tmp_path / "scheduled.json"
-    sf.parent.mkdir(parents=True, exist_ok=True)
-    sf.write_text("[]")
-    return sf
+    """Per-test scheduler JSON path under tmp_path (absent until first save)."""
+    return tmp_path / "scheduled.json"
+
+
+# Seed job lists are serialised once; fixtures write the bytes directly.
+_PENDING_JOB = {
+    "id": "test-123",
+    "platform": "twitter",
+    "text": "Test",
+    "scheduled_for": "2026-01-25 10:00:00",
+    "created_at": "2026-01-22 09:00:00",
+    "status": "pending",
+    "kwargs": {},
+}
+_FUTURE_JOB = {
+    "id": "future-job",
+    "platform": "twitter",
+    "text": "Future post",
+    "scheduled_for": "2099-01-01T10:00:00",
+    "created_at": "2026-01-22T09:00:00",
+    "status": "pending",
+    "kwargs": {},
+}
+_PENDING_SEED_JSON = json.dumps([_PENDING_JOB]).encode()
+_FUTURE_SEED_JSON = json.dumps([_FUTURE_JOB]).encode()
+
+
+@pytest.fixture
+def pending_schedule(schedule_file):
+    """Schedule file holding one pending job, ``test-123``."""
+    schedule_file.write_bytes(_PENDING_SEED_JSON)
+    return schedule_file
+
+
+@pytest.fixture
+def future_schedule(schedule_file):
+    """Schedule file holding one pending job far in the future."""
+    schedule_file.write_bytes(_FUTURE_SEED_JSON)
+    return schedule_file
 
 
 # --- parse_schedule_time ----------------------------------------------------
 
 
 class TestParseScheduleTime:
-    def test_relative_hours_format_returns_datetime_near_target(self):
+    def test_relative_hours_format_returns_exact_target(self):
         # Arrange
-        expected = datetime.now() + timedelta(hours=1)
+        expected = _NOW + timedelta(hours=1)
         # Act
-        result = parse_schedule_time("+1h")
+        result = parse_schedule_time("+1h", now=_NOW)
         # Assert
-        assert abs((result - expected).total_seconds()) < 2
+        assert result == expected
 
-    def test_relative_minutes_format_returns_datetime_near_target(self):
+    def test_relative_minutes_format_returns_exact_target(self):
         # Arrange
-        expected = datetime.now() + timedelta(minutes=30)
+        expected = _NOW + timedelta(minutes=30)
         # Act
-        result = parse_schedule_time("+30m")
+        result = parse_schedule_time("+30m", now=_NOW)
         # Assert
-        assert abs((result - expected).total_seconds()) < 2
+        assert result == expected
 
     def test_time_only_format_resolves_to_target_hour(self):
         # Arrange
         target_hh = 10
         # Act
-        result = parse_schedule_time("10:00")
+        result = parse_schedule_time("10:00", now=_NOW)
         # Assert
         assert result.hour == target_hh
 
@@ -63,10 +100,18 @@ class TestParseScheduleTime:
         # Arrange
         target_mm = 0
         # Act
-        result = parse_schedule_time("10:00")
+        result = parse_schedule_time("10:00", now=_NOW)
         # Assert
         assert result.minute == target_mm
 
+    def test_time_only_format_already_past_today_rolls_to_tomorrow(self):
+        # Arrange
+        expected = datetime(2026, 1, 2, 10, 0)
+        # Act
+        result = parse_schedule_time("10:00", now=_NOW)
+        # Assert
+        assert result == expected
+
     def test_full_datetime_format_returns_target_year(self):
         # Arrange
         target = "2026-01-25 14:30"
@@ -178,47 +223,33 @@ class TestSchedulePost:
 class TestListScheduled:
     def test_list_returns_empty_list_when_no_jobs_recorded(self, schedule_file):
         # Arrange
-        # (schedule_file already contains "[]")
+        # (no schedule file on disk yet)
         # Act
         result = list_scheduled(schedule_file=schedule_file)
         # Assert
         assert result == []
 
-    def test_list_returns_one_entry_when_one_pending_job_exists(self, schedule_file):
+    def test_list_on_missing_schedule_does_not_create_file(self, schedule_file):
         # Arrange
-        jobs = [
-            {
-                "id": "test-123",
-                "platform": "twitter",
-                "text": "Test",
-                "scheduled_for": "2026-01-25 10:00:00",
-                "created_at": "2026-01-22 09:00:00",
-                "status": "pending",
-                "kwargs": {},
-            }
-        ]
-        schedule_file.write_text(json.dumps(jobs))
+        # (no schedule file on disk yet)
         # Act
-        result = list_scheduled(schedule_file=schedule_file)
+        list_scheduled(schedule_file=schedule_file)
+        # Assert
+        assert not schedule_file.exists()
+
+    def test_list_returns_one_entry_when_one_pending_job_exists(self, pending_schedule):
+        # Arrange
+        # (schedule seeded by fixture)
+        # Act
+        result = list_scheduled(schedule_file=pending_schedule)
         # Assert
         assert len(result) == 1
 
-    def test_list_returns_pending_job_with_expected_id(self, schedule_file):
+    def test_list_returns_pending_job_with_expected_id(self, pending_schedule):
         # Arrange
-        jobs = [
-            {
-                "id": "test-123",
-                "platform": "twitter",
-                "text": "Test",
-                "scheduled_for": "2026-01-25 10:00:00",
-                "created_at": "2026-01-22 09:00:00",
-                "status": "pending",
-                "kwargs": {},
-            }
-        ]
-        schedule_file.write_text(json.dumps(jobs))
+        # (schedule seeded by fixture)
         # Act
-        result = list_scheduled(schedule_file=schedule_file)
+        result = list_scheduled(schedule_file=pending_schedule)
         # Assert
         assert result[0]["id"] == "test-123"
 
@@ -229,7 +260,7 @@ class TestListScheduled:
 class TestCancelScheduled:
     def test_cancel_nonexistent_job_marks_success_false(self, schedule_file):
         # Arrange
-        # (schedule_file already contains "[]")
+        # (no schedule file on disk yet)
         # Act
         result = cancel_scheduled("nonexistent-id", schedule_file=schedule_file)
         # Assert
@@ -237,48 +268,27 @@ class TestCancelScheduled:
 
     def test_cancel_nonexistent_job_error_mentions_not_found(self, schedule_file):
         # Arrange
-        # (schedule_file already contains "[]")
+        # (no schedule file on disk yet)
         # Act
         result = cancel_scheduled("nonexistent-id", schedule_file=schedule_file)
         # Assert
         assert "not found" in result["error"].lower()
 
-    def test_cancel_existing_job_marks_success_true(self, schedule_file):
+    def test_cancel_existing_job_marks_success_true(self, pending_schedule):
         # Arrange
-        jobs = [
-            {
-                "id": "test-123",
-                "platform": "twitter",
-                "text": "Test",
-                "scheduled_for": "2026-01-25 10:00:00",
-                "created_at": "2026-01-22 09:00:00",
-                "status": "pending",
-                "kwargs": {},
-            }
-        ]
-        schedule_file.write_text(json.dumps(jobs))
+        # (schedule seeded by fixture)
         # Act
-        result = cancel_scheduled("test-123", schedule_file=schedule_file)
+        result = cancel_scheduled("test-123", schedule_file=pending_schedule)
         # Assert
         assert result["success"] is True
 
-    def test_cancel_existing_job_removes_it_from_pending_listing(self, schedule_file):
+    def test_cancel_existing_job_removes_it_from_pending_listing(
+        self, pending_schedule
+    ):
         # Arrange
-        jobs = [
-            {
-                "id": "test-123",
-                "platform": "twitter",
-                "text": "Test",
-                "scheduled_for": "2026-01-25 10:00:00",
-                "created_at": "2026-01-22 09:00:00",
-                "status": "pending",
-                "kwargs": {},
-            }
-        ]
-        schedule_file.write_text(json.dumps(jobs))
-        cancel_scheduled("test-123", schedule_file=schedule_file)
+        cancel_scheduled("test-123", schedule_file=pending_schedule)
         # Act
-        remaining = list_scheduled(schedule_file=schedule_file)
+        remaining = list_scheduled(schedule_file=pending_schedule)
         # Assert
         assert len(remaining) == 0
 
@@ -289,49 +299,24 @@ class TestCancelScheduled:
 class TestRunDueJobs:
     def test_run_due_jobs_returns_empty_list_when_no_jobs_recorded(self, schedule_file):
         # Arrange
-        # (schedule_file already contains "[]")
+        # (no schedule file on disk yet)
         # Act
         results = run_due_jobs(schedule_file=schedule_file)
         # Assert
         assert results == []
 
-    def test_run_due_jobs_skips_jobs_scheduled_for_the_future(self, schedule_file):
+    def test_run_due_jobs_skips_jobs_scheduled_for_the_future(self, future_schedule):
         # Arrange
-        future_time = (datetime.now() + timedelta(hours=24)).isoformat()
-        jobs = [
-            {
-                "id": "future-job",
-                "platform": "twitter",
-                "text": "Future post",
-                "scheduled_for": future_time,
-                "created_at": datetime.now().isoformat(),
-                "status": "pending",
-                "kwargs": {},
-            }
-        ]
-        schedule_file.write_text(json.dumps(jobs))
+        # (schedule seeded by fixture)
         # Act
-        results = run_due_jobs(schedule_file=schedule_file)
+        results = run_due_jobs(schedule_file=future_schedule)
         # Assert
         assert results == []
 
-    def test_run_due_jobs_leaves_future_jobs_in_pending_listing(self, schedule_file):
+    def test_run_due_jobs_leaves_future_jobs_in_pending_listing(self, future_schedule):
         # Arrange
-        future_time = (datetime.now() + timedelta(hours=24)).isoformat()
-        jobs = [
-            {
-                "id": "future-job",
-                "platform": "twitter",
-                "text": "Future post",
-                "scheduled_for": future_time,
-                "created_at": datetime.now().isoformat(),
-                "status": "pending",
-                "kwargs": {},
-            }
-        ]
-        schedule_file.write_text(json.dumps(jobs))
-        run_due_jobs(schedule_file=schedule_file)
+        run_due_jobs(schedule_file=future_schedule)
         # Act
-        remaining = list_scheduled(schedule_file=schedule_file)
+        remaining = list_scheduled(schedule_file=future_schedule)
         # Assert
         assert len(remaining) == 1
@@ -5,8 +5,13 @@ construct a hand-rolled ``FakeOAuthSession`` (see ``conftest.py``) and
 configure ``FakeResponse`` objects ahead of the call.  No mocks.
 """
 
-import importlib
+import asyncio
+import subprocess
+import sys
 
+import pytest
+
+from socialia import _branding
 from socialia.twitter import Twitter
 
 from tests.conftest import FakeResponse
@@ -15,26 +20,65 @@ from tests.conftest import FakeResponse
 # --- Helpers ----------------------------------------------------------------
 
 
-def _clear_twitter_env(env, *, set_socialia_prefix: bool = True):
-    """Clear every Twitter credential env var across known prefixes.
+_TWITTER_CREDENTIAL_VARS = tuple(
+    f"{prefix}_{suffix}"
+    for prefix in ("SOCIALIA", "SCITEX", "SCITEX_SOCIAL")
+    for suffix in (
+        "X_CONSUMER_KEY",
+        "X_CONSUMER_KEY_SECRET",
+        "X_ACCESSTOKEN",
+        "X_ACCESSTOKEN_SECRET",
+    )
+)
+
+
+@pytest.fixture
+def cleared_twitter_env(env_save_restore):
+    """``env_save_restore`` with every Twitter credential var cleared.
 
     Tests that exercise the credential-fallback paths need a clean slate;
-    this helper centralises the brand-prefix bookkeeping so the per-test
+    the fixture does the brand-prefix bookkeeping once so the per-test
     bodies stay focused on a single Act + Assert.
     """
-    env.delete("SOCIALIA_ENV_PREFIX")
-    for prefix in ("SOCIALIA", "SCITEX", "SCITEX_SOCIAL"):
-        for suffix in (
-            "X_CONSUMER_KEY",
-            "X_CONSUMER_KEY_SECRET",
-            "X_ACCESSTOKEN",
-            "X_ACCESSTOKEN_SECRET",
-        ):
-            env.delete(f"{prefix}_{suffix}")
-    # Reload branding so prefix changes take effect.
-    from socialia import _branding
+    env_save_restore.delete("SOCIALIA_ENV_PREFIX")
+    for key in _TWITTER_CREDENTIAL_VARS:
+        env_save_restore.delete(key)
+    # Re-read the branding prefix so the env changes take effect.
+    _branding.refresh()
+    return env_save_restore
+
+
+_ENV_CREDENTIALS = {
+    "SOCIALIA_X_CONSUMER_KEY": "env_consumer_key",
+    "SOCIALIA_X_CONSUMER_KEY_SECRET": "env_consumer_secret",
+    "SOCIALIA_X_ACCESSTOKEN": "env_access_token",
+    "SOCIALIA_X_ACCESSTOKEN_SECRET": "env_access_secret",
+}
 
-    importlib.reload(_branding)
+
+@pytest.fixture
+def twitter_env_credentials(cleared_twitter_env):
+    """``cleared_twitter_env`` with a full set of SOCIALIA_X_* credentials."""
+    for key, value in _ENV_CREDENTIALS.items():
+        cleared_twitter_env.set(key, value)
+    return cleared_twitter_env
+
+
+@pytest.fixture(scope="module")
+def credentialed_client(twitter_credentials):
+    """One credentialed client shared by tests that only read its attributes.
+
+    Tests that make calls or touch sessions use ``twitter_client`` instead.
+    """
+    return Twitter(**twitter_credentials)
+
+
+# Canned responses shared across tests; the client only reads them.
+_CREATED = FakeResponse(status_code=201, json_data={"data": {"id": "12345"}})
+_FORBIDDEN = FakeResponse(status_code=403, text="Forbidden")
+_DELETED = FakeResponse(status_code=200)
+_NOT_FOUND = FakeResponse(status_code=404, text="Not Found")
+_MEDIA_UPLOADED = FakeResponse(status_code=200, json_data={"media_id_string": "m1"})
 
 
 class FakeReadBackend:
@@ -67,82 +111,56 @@ class FakeReadBackend:
 
 
 class TestTwitterInit:
-    def test_init_with_credentials_records_consumer_key(self, twitter_credentials):
-        # Arrange
-        creds = twitter_credentials
-        # Act
-        client = Twitter(**creds)
-        # Assert
-        assert client.consumer_key == "test_consumer_key"
-
-    def test_init_with_credentials_records_consumer_secret(self, twitter_credentials):
-        # Arrange
-        creds = twitter_credentials
-        # Act
-        client = Twitter(**creds)
-        # Assert
-        assert client.consumer_secret == "test_consumer_secret"
-
-    def test_init_with_credentials_records_access_token(self, twitter_credentials):
-        # Arrange
-        creds = twitter_credentials
-        # Act
-        client = Twitter(**creds)
-        # Assert
-        assert client.access_token == "test_access_token"
-
-    def test_init_with_credentials_records_access_token_secret(
-        self, twitter_credentials
+    @pytest.mark.parametrize(
+        "attr",
+        ["consumer_key", "consumer_secret", "access_token", "access_token_secret"],
+    )
+    def test_init_with_credentials_records_each_credential(
+        self, credentialed_client, twitter_credentials, attr
     ):
         # Arrange
-        creds = twitter_credentials
+        expected = twitter_credentials[attr]
         # Act
-        client = Twitter(**creds)
-        # Assert
-        assert client.access_token_secret == "test_access_token_secret"
-
-    def test_init_from_environment_reads_consumer_key(self, env_save_restore):
-        # Arrange
-        _clear_twitter_env(env_save_restore)
-        env_save_restore.set("SOCIALIA_X_CONSUMER_KEY", "env_consumer_key")
-        env_save_restore.set("SOCIALIA_X_CONSUMER_KEY_SECRET", "env_consumer_secret")
-        env_save_restore.set("SOCIALIA_X_ACCESSTOKEN", "env_access_token")
-        env_save_restore.set("SOCIALIA_X_ACCESSTOKEN_SECRET", "env_access_secret")
-        # Act
-        client = Twitter()
+        value = getattr(credentialed_client, attr)
         # Assert
-        assert client.consumer_key == "env_consumer_key"
-
-    def test_init_from_environment_reads_consumer_secret(self, env_save_restore):
+        assert value == expected
+
+    @pytest.mark.parametrize(
+        "attr, expected",
+        [
+            ("consumer_key", "env_consumer_key"),
+            ("consumer_secret", "env_consumer_secret"),
+            ("access_token", "env_access_token"),
+            ("access_token_secret", "env_access_secret"),
+        ],
+    )
+    def test_init_from_environment_reads_each_credential(
+        self, twitter_env_credentials, attr, expected
+    ):
         # Arrange
-        _clear_twitter_env(env_save_restore)
-        env_save_restore.set("SOCIALIA_X_CONSUMER_KEY", "env_consumer_key")
-        env_save_restore.set("SOCIALIA_X_CONSUMER_KEY_SECRET", "env_consumer_secret")
-        env_save_restore.set("SOCIALIA_X_ACCESSTOKEN", "env_access_token")
-        env_save_restore.set("SOCIALIA_X_ACCESSTOKEN_SECRET", "env_access_secret")
+        # (credentials preset by fixture)
         # Act
         client = Twitter()
         # Assert
-        assert client.consumer_secret == "env_consumer_secret"
+        assert getattr(client, attr) == expected
 
 
 # --- Validation -------------------------------------------------------------
 
 
 class TestTwitterValidateCredentials:
-    def test_validate_credentials_returns_true_when_all_set(self, twitter_credentials):
+    def test_validate_credentials_returns_true_when_all_set(self, credentialed_client):
         # Arrange
-        client = Twitter(**twitter_credentials)
+        # (client built once by fixture)
         # Act
-        ok = client.validate_credentials()
+        ok = credentialed_client.validate_credentials()
         # Assert
         assert ok is True
 
     def test_validate_credentials_returns_false_when_only_one_set(
-        self, env_save_restore
+        self, cleared_twitter_env
     ):
         # Arrange
-        _clear_twitter_env(env_save_restore)
         client = Twitter(consumer_key="only_one")
         # Act
         ok = client.validate_credentials()
@@ -151,9 +169,8 @@ class TestTwitterValidateCredentials:
 
 
 class TestTwitterReadBackend:
-    def test_search_tweets_uses_read_backend_without_oauth(self, env_save_restore):
+    def test_search_tweets_uses_read_backend_without_oauth(self, cleared_twitter_env):
         # Arrange
-        _clear_twitter_env(env_save_restore)
         backend = FakeReadBackend()
         client = Twitter(read_backend=backend)
         # Act
@@ -164,9 +181,8 @@ class TestTwitterReadBackend:
             ("search_tweets", "ai agents", 3, True),
         )
 
-    def test_feed_uses_read_backend_when_username_is_set(self, env_save_restore):
+    def test_feed_uses_read_backend_when_username_is_set(self, cleared_twitter_env):
         # Arrange
-        _clear_twitter_env(env_save_restore)
         backend = FakeReadBackend()
         client = Twitter(read_backend=backend, read_username="@alice")
         # Act
@@ -177,9 +193,8 @@ class TestTwitterReadBackend:
             ("user_tweets", "alice", 5),
         )
 
-    def test_mentions_uses_read_backend_when_username_is_set(self, env_save_restore):
+    def test_mentions_uses_read_backend_when_username_is_set(self, cleared_twitter_env):
         # Arrange
-        _clear_twitter_env(env_save_restore)
         backend = FakeReadBackend()
         client = Twitter(read_backend=backend, read_username="alice")
         # Act
@@ -190,9 +205,8 @@ class TestTwitterReadBackend:
             ("mentions", "alice", 5),
         )
 
-    def test_replies_uses_read_backend_when_username_is_set(self, env_save_restore):
+    def test_replies_uses_read_backend_when_username_is_set(self, cleared_twitter_env):
         # Arrange
-        _clear_twitter_env(env_save_restore)
         backend = FakeReadBackend()
         client = Twitter(read_backend=backend, read_username="alice")
         # Act
@@ -204,10 +218,9 @@ class TestTwitterReadBackend:
         )
 
     def test_validate_read_credentials_needs_username_for_backend(
-        self, env_save_restore
+        self, cleared_twitter_env
     ):
         # Arrange
-        _clear_twitter_env(env_save_restore)
         client = Twitter(read_backend=FakeReadBackend())
         # Act
         ok = client.validate_read_credentials()
@@ -219,231 +232,379 @@ class TestTwitterReadBackend:
 
 
 class TestTwitterPost:
-    def test_post_without_credentials_reports_success_false(self, env_save_restore):
+    def test_post_without_credentials_reports_success_false(self, cleared_twitter_env):
         # Arrange
-        _clear_twitter_env(env_save_restore)
         client = Twitter()
         # Act
         result = client.post("Test")
         # Assert
         assert result["success"] is False
 
-    def test_post_without_credentials_error_mentions_credentials(
-        self, env_save_restore
+    def test_post_without_credentials_reports_missing_credentials(
+        self, cleared_twitter_env
     ):
         # Arrange
-        _clear_twitter_env(env_save_restore)
         client = Twitter()
         # Act
         result = client.post("Test")
         # Assert
-        assert "credentials" in result["error"].lower()
+        assert result["error"] == "Missing credentials"
 
-    def test_post_success_returns_success_true(
-        self, twitter_credentials, fake_oauth_session, twitter_session_factory
+    @pytest.mark.parametrize(
+        "response, expected", [(_CREATED, True), (_FORBIDDEN, False)]
+    )
+    def test_post_reports_success_from_status_code(
+        self, twitter_client, fake_oauth_session, response, expected
     ):
         # Arrange
-        fake_oauth_session.post_response = FakeResponse(
-            status_code=201, json_data={"data": {"id": "12345"}}
-        )
-        client = Twitter(**twitter_credentials, session_factory=twitter_session_factory)
+        fake_oauth_session.post_response = response
         # Act
-        result = client.post("Hello World!")
+        result = twitter_client.post("Hello World!")
         # Assert
-        assert result["success"] is True
+        assert result["success"] is expected
 
     def test_post_success_returns_id_from_api_response(
-        self, twitter_credentials, fake_oauth_session, twitter_session_factory
+        self, twitter_client, fake_oauth_session
     ):
         # Arrange
-        fake_oauth_session.post_response = FakeResponse(
-            status_code=201, json_data={"data": {"id": "12345"}}
-        )
-        client = Twitter(**twitter_credentials, session_factory=twitter_session_factory)
+        fake_oauth_session.post_response = _CREATED
         # Act
-        result = client.post("Hello World!")
+        result = twitter_client.post("Hello World!")
         # Assert
         assert result["id"] == "12345"
 
-    def test_post_success_returns_x_com_url(
-        self, twitter_credentials, fake_oauth_session, twitter_session_factory
+    def test_post_success_returns_status_url_for_id(
+        self, twitter_client, fake_oauth_session
     ):
         # Arrange
-        fake_oauth_session.post_response = FakeResponse(
-            status_code=201, json_data={"data": {"id": "12345"}}
-        )
-        client = Twitter(**twitter_credentials, session_factory=twitter_session_factory)
+        fake_oauth_session.post_response = _CREATED
+        # Act
+        result = twitter_client.post("Hello World!")
+        # Assert
+        assert result["url"] == "https://x.com/i/web/status/12345"
+
+    def test_post_failure_includes_status_code_in_error(
+        self, twitter_client, fake_oauth_session
+    ):
+        # Arrange
+        fake_oauth_session.post_response = _FORBIDDEN
         # Act
-        result = client.post("Hello World!")
+        result = twitter_client.post("Hello World!")
         # Assert
-        assert "x.com" in result["url"]
+        assert "403" in result["error"]
 
-    def test_post_failure_returns_success_false(
-        self, twitter_credentials, fake_oauth_session, twitter_session_factory
+    def test_post_with_reply_to_sends_reply_payload_field(
+        self, twitter_client, fake_oauth_session
     ):
         # Arrange
-        fake_oauth_session.post_response = FakeResponse(
-            status_code=403, text="Forbidden"
-        )
-        client = Twitter(**twitter_credentials, session_factory=twitter_session_factory)
+        fake_oauth_session.post_response = _CREATED
         # Act
-        result = client.post("Hello World!")
+        twitter_client.post("Reply text", reply_to="12345")
         # Assert
-        assert result["success"] is False
+        assert "reply" in fake_oauth_session.calls[0].kwargs["json"]
 
-    def test_post_failure_includes_status_code_in_error(
-        self, twitter_credentials, fake_oauth_session, twitter_session_factory
+    def test_post_with_media_paths_attaches_uploaded_media(
+        self, twitter_client, fake_oauth_session, tmp_path
     ):
         # Arrange
-        fake_oauth_session.post_response = FakeResponse(
-            status_code=403, text="Forbidden"
-        )
-        client = Twitter(**twitter_credentials, session_factory=twitter_session_factory)
+        image = tmp_path / "fig.png"
+        image.write_bytes(b"\x89PNG")
+        fake_oauth_session.post_sequence = [_MEDIA_UPLOADED, _CREATED]
         # Act
-        result = client.post("Hello World!")
+        twitter_client.post("Figure", media_paths=[str(image)])
         # Assert
-        assert "403" in result["error"]
+        assert fake_oauth_session.calls[1].kwargs["json"]["media"] == {
+            "media_ids": ["m1"]
+        }
 
-    def test_post_with_reply_to_sends_reply_payload_field(
-        self, twitter_credentials, fake_oauth_session, twitter_session_factory
+    def test_post_too_long_with_media_paths_uploads_nothing(
+        self, twitter_client, fake_oauth_session, tmp_path
     ):
         # Arrange
-        fake_oauth_session.post_response = FakeResponse(
-            status_code=201, json_data={"data": {"id": "67890"}}
-        )
-        client = Twitter(**twitter_credentials, session_factory=twitter_session_factory)
+        image = tmp_path / "fig.png"
+        image.write_bytes(b"\x89PNG")
         # Act
-        client.post("Reply text", reply_to="12345")
+        twitter_client.post("x" * 281, media_paths=[str(image)])
         # Assert
-        assert "reply" in fake_oauth_session.calls[0].kwargs["json"]
+        assert fake_oauth_session.calls == []
 
 
 # --- Deleting --------------------------------------------------------------
 
 
 class TestTwitterDelete:
-    def test_delete_success_returns_success_true(
-        self, twitter_credentials, fake_oauth_session, twitter_session_factory
+    @pytest.mark.parametrize(
+        "response, expected", [(_DELETED, True), (_NOT_FOUND, False)]
+    )
+    def test_delete_reports_success_from_status_code(
+        self, twitter_client, fake_oauth_session, response, expected
     ):
         # Arrange
-        fake_oauth_session.delete_response = FakeResponse(status_code=200)
-        client = Twitter(**twitter_credentials, session_factory=twitter_session_factory)
+        fake_oauth_session.delete_response = response
         # Act
-        result = client.delete("12345")
+        result = twitter_client.delete("12345")
         # Assert
-        assert result["success"] is True
+        assert result["success"] is expected
 
     def test_delete_success_marks_deleted_true(
-        self, twitter_credentials, fake_oauth_session, twitter_session_factory
+        self, twitter_client, fake_oauth_session
     ):
         # Arrange
-        fake_oauth_session.delete_response = FakeResponse(status_code=200)
-        client = Twitter(**twitter_credentials, session_factory=twitter_session_factory)
+        fake_oauth_session.delete_response = _DELETED
         # Act
-        result = client.delete("12345")
+        result = twitter_client.delete("12345")
         # Assert
         assert result["deleted"] is True
 
-    def test_delete_failure_returns_success_false(
-        self, twitter_credentials, fake_oauth_session, twitter_session_factory
-    ):
-        # Arrange
-        fake_oauth_session.delete_response = FakeResponse(
-            status_code=404, text="Not Found"
-        )
-        client = Twitter(**twitter_credentials, session_factory=twitter_session_factory)
-        # Act
-        result = client.delete("invalid_id")
-        # Assert
-        assert result["success"] is False
-
     def test_delete_failure_includes_status_code_in_error(
-        self, twitter_credentials, fake_oauth_session, twitter_session_factory
+        self, twitter_client, fake_oauth_session
     ):
         # Arrange
-        fake_oauth_session.delete_response = FakeResponse(
-            status_code=404, text="Not Found"
-        )
-        client = Twitter(**twitter_credentials, session_factory=twitter_session_factory)
+        fake_oauth_session.delete_response = _NOT_FOUND
         # Act
-        result = client.delete("invalid_id")
+        result = twitter_client.delete("invalid_id")
         # Assert
         assert "404" in result["error"]
 
 
 # --- Threads ---------------------------------------------------------------
 
+# FakeResponse is never mutated by the client, so the thread tests share
+# these and copy only the list the session pops from.
+_THREAD_CREATED = tuple(
+    FakeResponse(status_code=201, json_data={"data": {"id": str(i)}})
+    for i in range(1, 4)
+)
+_THREAD_RATE_LIMITED = (
+    _THREAD_CREATED[0],
+    FakeResponse(status_code=403, text="Rate limited"),
+)
+
 
 class TestTwitterThread:
     def test_post_thread_success_marks_success_true(
-        self, twitter_credentials, fake_oauth_session, twitter_session_factory
+        self, twitter_client, fake_oauth_session
     ):
         # Arrange
-        fake_oauth_session.post_sequence = [
-            FakeResponse(status_code=201, json_data={"data": {"id": "1"}}),
-            FakeResponse(status_code=201, json_data={"data": {"id": "2"}}),
-            FakeResponse(status_code=201, json_data={"data": {"id": "3"}}),
-        ]
-        client = Twitter(**twitter_credentials, session_factory=twitter_session_factory)
+        fake_oauth_session.post_sequence = list(_THREAD_CREATED)
         # Act
-        result = client.post_thread(["First", "Second", "Third"])
+        result = twitter_client.post_thread(["First", "Second", "Third"])
         # Assert
         assert result["success"] is True
 
     def test_post_thread_success_returns_one_id_per_tweet(
-        self, twitter_credentials, fake_oauth_session, twitter_session_factory
+        self, twitter_client, fake_oauth_session
     ):
         # Arrange
-        fake_oauth_session.post_sequence = [
-            FakeResponse(status_code=201, json_data={"data": {"id": "1"}}),
-            FakeResponse(status_code=201, json_data={"data": {"id": "2"}}),
-            FakeResponse(status_code=201, json_data={"data": {"id": "3"}}),
-        ]
-        client = Twitter(**twitter_credentials, session_factory=twitter_session_factory)
+        fake_oauth_session.post_sequence = list(_THREAD_CREATED)
         # Act
-        result = client.post_thread(["First", "Second", "Third"])
+        result = twitter_client.post_thread(["First", "Second", "Third"])
         # Assert
         assert len(result["ids"]) == 3
 
     def test_post_thread_success_returns_one_url_per_tweet(
-        self, twitter_credentials, fake_oauth_session, twitter_session_factory
+        self, twitter_client, fake_oauth_session
     ):
         # Arrange
-        fake_oauth_session.post_sequence = [
-            FakeResponse(status_code=201, json_data={"data": {"id": "1"}}),
-            FakeResponse(status_code=201, json_data={"data": {"id": "2"}}),
-            FakeResponse(status_code=201, json_data={"data": {"id": "3"}}),
-        ]
-        client = Twitter(**twitter_credentials, session_factory=twitter_session_factory)
+        fake_oauth_session.post_sequence = list(_THREAD_CREATED)
         # Act
-        result = client.post_thread(["First", "Second", "Third"])
+        result = twitter_client.post_thread(["First", "Second", "Third"])
         # Assert
         assert len(result["urls"]) == 3
 
     def test_post_thread_partial_failure_reports_success_false(
-        self, twitter_credentials, fake_oauth_session, twitter_session_factory
+        self, twitter_client, fake_oauth_session
     ):
         # Arrange
-        fake_oauth_session.post_sequence = [
-            FakeResponse(status_code=201, json_data={"data": {"id": "1"}}),
-            FakeResponse(status_code=403, text="Rate limited"),
-        ]
-        client = Twitter(**twitter_credentials, session_factory=twitter_session_factory)
+        fake_oauth_session.post_sequence = list(_THREAD_RATE_LIMITED)
         # Act
-        result = client.post_thread(["First", "Second", "Third"])
+        result = twitter_client.post_thread(["First", "Second", "Third"])
         # Assert
         assert result["success"] is False
 
     def test_post_thread_partial_failure_returns_partial_ids_list(
-        self, twitter_credentials, fake_oauth_session, twitter_session_factory
+        self, twitter_client, fake_oauth_session
     ):
         # Arrange
+        fake_oauth_session.post_sequence = list(_THREAD_RATE_LIMITED)
+        # Act
+        result = twitter_client.post_thread(["First", "Second", "Third"])
+        # Assert
+        assert len(result["partial_ids"]) == 1
+
+    def test_post_thread_lists_every_over_length_tweet(self, twitter_client):
+        # Arrange
+        # (no setup)
+        # Act
+        result = twitter_client.post_thread(["x" * 281, "ok", "y" * 300])
+        # Assert
+        assert result["too_long"] == [1, 3]
+
+    def test_post_thread_opens_one_session_for_all_replies(
+        self, twitter_credentials, fake_oauth_session
+    ):
+        # Arrange
+        fake_oauth_session.post_response = _CREATED
+        opened = []
+
+        def factory():
+            opened.append(fake_oauth_session)
+            return fake_oauth_session
+
+        client = Twitter(**twitter_credentials, session_factory=factory)
+        # Act
+        client.post_thread(["First", "Second", "Third"])
+        # Assert
+        assert len(opened) == 1
+
+    def test_post_thread_attaches_preuploaded_media_to_its_tweet(
+        self, twitter_client, fake_oauth_session, tmp_path
+    ):
+        # Arrange
+        image = tmp_path / "fig.png"
+        image.write_bytes(b"\x89PNG")
+        fake_oauth_session.post_sequence = [_MEDIA_UPLOADED, *_THREAD_CREATED[:2]]
+        # Act
+        twitter_client.post_thread(["First", "Second"], media=[None, [str(image)]])
+        # Assert
+        assert fake_oauth_session.calls[2].kwargs["json"]["media"] == {
+            "media_ids": ["m1"]
+        }
+
+    def test_post_thread_rejects_more_media_groups_than_tweets(
+        self, twitter_client, fake_oauth_session, tmp_path
+    ):
+        # Arrange
+        image = tmp_path / "fig.png"
+        image.write_bytes(b"\x89PNG")
+        # Act
+        twitter_client.post_thread(["Only"], media=[None, [str(image)]])
+        # Assert
+        assert fake_oauth_session.calls == []
+
+    def test_apost_thread_awaits_posted_ids(self, twitter_client, fake_oauth_session):
+        # Arrange
+        fake_oauth_session.post_sequence = list(_THREAD_CREATED[:2])
+        # Act
+        result = asyncio.run(twitter_client.apost_thread(["First", "Second"]))
+        # Assert
+        assert result["ids"] == ["1", "2"]
+
+
+# --- Authenticated-user cache ------------------------------------------------
+
+
+class TestTwitterOwnUserCache:
+    def test_repeated_feed_calls_fetch_me_only_once(
+        self, twitter_client, fake_oauth_session
+    ):
+        # Arrange
+        me = FakeResponse(
+            status_code=200,
+            json_data={"data": {"id": "42", "username": "alice", "name": "Alice"}},
+        )
+        fake_oauth_session.responses = {("get", Twitter.ME_ENDPOINT): me}
+        fake_oauth_session.get_response = FakeResponse(200, {"data": []})
+        twitter_client.feed()
+        # Act
+        twitter_client.feed()
+        # Assert
+        assert [c.args[0] for c in fake_oauth_session.calls].count(
+            Twitter.ME_ENDPOINT
+        ) == 1
+
+
+class TestTwitterUploadMediaMany:
+    def test_upload_media_many_returns_ids_in_path_order(
+        self, twitter_client, fake_oauth_session, tmp_path
+    ):
+        # Arrange
+        paths = []
+        for name in ("a.png", "b.png"):
+            (tmp_path / name).write_bytes(b"\x89PNG")
+            paths.append(str(tmp_path / name))
         fake_oauth_session.post_sequence = [
-            FakeResponse(status_code=201, json_data={"data": {"id": "1"}}),
-            FakeResponse(status_code=403, text="Rate limited"),
+            FakeResponse(200, {"media_id_string": "m1"}),
+            FakeResponse(200, {"media_id_string": "m2"}),
         ]
-        client = Twitter(**twitter_credentials, session_factory=twitter_session_factory)
         # Act
-        result = client.post_thread(["First", "Second", "Third"])
+        result = twitter_client.upload_media_many(paths, max_workers=1)
         # Assert
-        assert len(result["partial_ids"]) == 1
+        assert result == {"success": True, "media_ids": ["m1", "m2"]}
+
+    def test_upload_media_many_uploads_every_file_concurrently(
+        self, twitter_client, fake_oauth_session, tmp_path
+    ):
+        # Arrange
+        paths = []
+        for i in range(4):
+            (tmp_path / f"{i}.png").write_bytes(b"\x89PNG")
+            paths.append(str(tmp_path / f"{i}.png"))
+        fake_oauth_session.post_response = FakeResponse(200, {"media_id_string": "m"})
+        # Act
+        twitter_client.upload_media_many(paths)
+        # Assert
+        assert len(fake_oauth_session.calls) == 4
+
+    def test_upload_media_many_reports_every_missing_path(
+        self, twitter_client, tmp_path
+    ):
+        # Arrange
+        missing = [str(tmp_path / "gone.png"), str(tmp_path / "lost.png")]
+        # Act
+        result = twitter_client.upload_media_many(missing)
+        # Assert
+        assert result["error"] == (
+            f"File not found: {missing[0]}; File not found: {missing[1]}"
+        )
+
+    def test_upload_media_many_rejects_mislabelled_image_before_upload(
+        self, twitter_client, fake_oauth_session, tmp_path
+    ):
+        # Arrange
+        (tmp_path / "a.png").write_bytes(b"GIF89a")
+        # Act
+        twitter_client.upload_media_many([str(tmp_path / "a.png")])
+        # Assert
+        assert fake_oauth_session.calls == []
+
+    def test_upload_media_many_with_missing_path_uploads_nothing(
+        self, twitter_client, fake_oauth_session, tmp_path
+    ):
+        # Arrange
+        (tmp_path / "a.png").write_bytes(b"\x89PNG")
+        paths = [str(tmp_path / "a.png"), str(tmp_path / "gone.png")]
+        # Act
+        twitter_client.upload_media_many(paths)
+        # Assert
+        assert fake_oauth_session.calls == []
+
+
+class TestTwitterSessionReuse:
+    def test_importing_twitter_module_defers_oauth_library(self):
+        # Arrange
+        code = "import sys, socialia.twitter; print('requests_oauthlib' in sys.modules)"
+        # Act
+        proc = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=False
+        )
+        # Assert
+        assert proc.stdout.strip() == "False"
+
+    def test_get_session_reuses_session_within_thread(self, twitter_credentials):
+        # Arrange
+        client = Twitter(**twitter_credentials)
+        first = client._get_session()
+        # Act
+        second = client._get_session()
+        # Assert
+        assert second is first
+
+    def test_get_session_builds_separate_session_per_thread(self, twitter_credentials):
+        # Arrange
+        client = Twitter(**twitter_credentials)
+        main_session = client._get_session()
+        # Act
+        worker_session = asyncio.run(asyncio.to_thread(client._get_session))
+        # Assert
+        assert worker_session is not main_session
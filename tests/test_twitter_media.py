@@ -0,0 +1,148 @@
+"""Tests for Twitter media uploads.
+
+The OAuth1 session is the hand-rolled ``FakeOAuthSession`` from
+``conftest.py``; responses are queued per call.  No mocks.
+"""
+
+from socialia import _twitter_media
+from tests.conftest import FakeResponse
+
+# --- Helpers ----------------------------------------------------------------
+
+
+def _queue_video_upload(session, processing_info: dict) -> None:
+    """Queue INIT / APPEND / FINALIZE responses for a one-chunk video."""
+    session.post_sequence = [
+        FakeResponse(202, {"media_id_string": "m1"}),
+        FakeResponse(204),
+        FakeResponse(200, {"media_id": 1, "processing_info": processing_info}),
+    ]
+
+
+# --- upload_video -----------------------------------------------------------
+
+
+class TestUploadVideoStatusPolling:
+    def test_upload_video_succeeds_once_processing_completes(
+        self, fake_oauth_session, tmp_path
+    ):
+        # Arrange
+        video = tmp_path / "clip.mp4"
+        video.write_bytes(b"\x00" * 16)
+        _queue_video_upload(
+            fake_oauth_session, {"state": "pending", "check_after_secs": 0}
+        )
+        fake_oauth_session.get_response = FakeResponse(
+            200, {"processing_info": {"state": "succeeded"}}
+        )
+        # Act
+        result = _twitter_media.upload_video(fake_oauth_session, str(video))
+        # Assert
+        assert result == {"success": True, "media_id": "m1"}
+
+    def test_upload_video_gives_up_when_processing_exceeds_timeout(
+        self, fake_oauth_session, tmp_path
+    ):
+        # Arrange
+        video = tmp_path / "clip.mp4"
+        video.write_bytes(b"\x00" * 16)
+        _queue_video_upload(
+            fake_oauth_session, {"state": "in_progress", "check_after_secs": 0}
+        )
+        fake_oauth_session.get_response = FakeResponse(
+            200, {"processing_info": {"state": "in_progress", "check_after_secs": 0}}
+        )
+        # Act
+        result = _twitter_media.upload_video(
+            fake_oauth_session, str(video), status_timeout=0
+        )
+        # Assert
+        assert "timed out" in result["error"]
+
+
+class TestUploadMissingFiles:
+    def test_upload_video_missing_file_reports_not_found(
+        self, fake_oauth_session, tmp_path
+    ):
+        # Arrange
+        missing = tmp_path / "nope.mp4"
+        # Act
+        result = _twitter_media.upload_video(fake_oauth_session, str(missing))
+        # Assert
+        assert result["error"] == f"File not found: {missing}"
+
+    def test_upload_media_missing_video_reports_not_found(
+        self, fake_oauth_session, tmp_path
+    ):
+        # Arrange
+        missing = tmp_path / "nope.mov"
+        # Act
+        result = _twitter_media.upload_media(fake_oauth_session, str(missing))
+        # Assert
+        assert result["error"] == f"File not found: {missing}"
+
+
+class TestUploadMediaPreflight:
+    def test_upload_media_rejects_oversized_image_without_posting(
+        self, fake_oauth_session, tmp_path
+    ):
+        # Arrange
+        image = tmp_path / "big.png"
+        image.write_bytes(b"\x89PNG" + b"\x00" * _twitter_media.IMAGE_SIZE_LIMIT)
+        # Act
+        _twitter_media.upload_media(fake_oauth_session, str(image))
+        # Assert
+        assert fake_oauth_session.calls == []
+
+    def test_upload_media_reports_image_with_wrong_signature(
+        self, fake_oauth_session, tmp_path
+    ):
+        # Arrange
+        image = tmp_path / "fake.jpg"
+        image.write_bytes(b"not a jpeg")
+        # Act
+        result = _twitter_media.upload_media(fake_oauth_session, str(image))
+        # Assert
+        assert result["error"] == f"Not a valid image/jpeg file: {image}"
+
+    def test_upload_media_preflighted_skips_signature_check(
+        self, fake_oauth_session, tmp_path
+    ):
+        # Arrange
+        image = tmp_path / "fake.jpg"
+        image.write_bytes(b"not a jpeg")
+        fake_oauth_session.post_response = FakeResponse(200, {"media_id_string": "m1"})
+        # Act
+        result = _twitter_media.upload_media(
+            fake_oauth_session, str(image), preflighted=True
+        )
+        # Assert
+        assert result == {"success": True, "media_id": "m1"}
+
+    def test_upload_media_missing_unsupported_file_reports_type(
+        self, fake_oauth_session, tmp_path
+    ):
+        # Arrange
+        missing = tmp_path / "notes.txt"
+        # Act
+        result = _twitter_media.upload_media(fake_oauth_session, str(missing))
+        # Assert
+        assert result["error"].startswith("Unsupported file type: .txt")
+
+    def test_preflight_media_accepts_webp_container(self, tmp_path):
+        # Arrange
+        image = tmp_path / "pic.webp"
+        image.write_bytes(b"RIFF\x10\x00\x00\x00WEBPVP8 ")
+        # Act
+        error = _twitter_media.preflight_media(str(image))
+        # Assert
+        assert error is None
+
+    def test_preflight_media_allows_large_gif_under_gif_limit(self, tmp_path):
+        # Arrange
+        image = tmp_path / "anim.gif"
+        image.write_bytes(b"GIF89a" + b"\x00" * _twitter_media.IMAGE_SIZE_LIMIT)
+        # Act
+        error = _twitter_media.preflight_media(str(image))
+        # Assert
+        assert error is None
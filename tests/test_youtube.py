@@ -0,0 +1,790 @@
+"""Tests for YouTube client.
+
+The Google API client is never built here: tests hand the ``YouTube``
+instance hand-rolled credential fakes (see helpers below) or the shared
+``fake_youtube_service`` from conftest and exercise the surrounding logic.
+No mocks.
+"""
+
+import asyncio
+import json
+import mmap
+import os
+import time
+
+import pytest
+
+pytest.importorskip("googleapiclient", reason="google-api-python-client not installed")
+
+from socialia._youtube_transport import (
+    _google_api,
+    _next_chunk_with_retry,
+    _ReadAheadMap,
+    _settle_thumbnail,
+    _upload_chunksize,
+)
+from socialia.youtube import YouTube
+
+# --- Helpers ----------------------------------------------------------------
+
+
+class FakeCredentials:
+    """Stand-in for ``google.oauth2.credentials.Credentials``."""
+
+    def __init__(self, payload: str = '{"token": "abc"}', valid: bool = True):
+        self._payload = payload
+        self.valid = valid
+        self.expired = not valid
+        self.refresh_token = None
+
+    def to_json(self) -> str:
+        return self._payload
+
+
+_AUTHORIZED_USER_TOKEN = (
+    '{"client_id": "cid", "client_secret": "sec", "refresh_token": "r",'
+    ' "token": "tok", "expiry": "2999-01-01T00:00:00Z"}'
+)
+
+
+def _make_client(tmp_path) -> YouTube:
+    return YouTube(
+        client_secrets_file=str(tmp_path / "client_secrets.json"),
+        token_file=str(tmp_path / "token.json"),
+    )
+
+
+# --- Lazy Google imports ---------------------------------------------------
+
+
+class TestGoogleApiLoader:
+    def test_google_api_loader_returns_cached_namespace(self):
+        # Arrange
+        first = _google_api()
+        # Act
+        second = _google_api()
+        # Assert
+        assert second is first
+
+    def test_google_api_json_model_parses_response_bytes(self):
+        # Arrange
+        model = _google_api().JsonModel()
+        # Act
+        body = model.deserialize(b'{"items": [{"id": "v1"}]}')
+        # Assert
+        assert body == {"items": [{"id": "v1"}]}
+
+    def test_google_api_json_model_serializes_request_body_to_str(self):
+        # Arrange
+        model = _google_api().JsonModel()
+        # Act
+        payload = model.serialize({"snippet": {"title": "T"}})
+        # Assert
+        assert json.loads(payload) == {"snippet": {"title": "T"}}
+
+    def test_google_api_json_model_serializes_unusual_keys(self):
+        # Arrange
+        model = _google_api().JsonModel()
+        # Act
+        payload = model.serialize({1: "one"})
+        # Assert
+        assert json.loads(payload) == {"1": "one"}
+
+
+# --- Token persistence -----------------------------------------------------
+
+
+class TestYouTubeSaveToken:
+    def test_save_token_writes_serialized_credentials(self, tmp_path):
+        # Arrange
+        client = _make_client(tmp_path)
+        # Act
+        client._save_token(FakeCredentials('{"token": "new"}'))
+        # Assert
+        assert (tmp_path / "token.json").read_text() == '{"token": "new"}'
+
+    def test_save_token_leaves_no_temp_file_behind(self, tmp_path):
+        # Arrange
+        client = _make_client(tmp_path)
+        # Act
+        client._save_token(FakeCredentials())
+        # Assert
+        assert not (tmp_path / "token.json.tmp").exists()
+
+    def test_save_token_skips_write_when_unchanged(self, tmp_path):
+        # Arrange
+        client = _make_client(tmp_path)
+        client._save_token(FakeCredentials())
+        before = (tmp_path / "token.json").stat().st_mtime_ns
+        # Act
+        client._save_token(FakeCredentials())
+        # Assert
+        assert (tmp_path / "token.json").stat().st_mtime_ns == before
+
+
+class TestYouTubeCredentialCache:
+    def test_get_credentials_reuses_in_process_credentials(self, tmp_path):
+        # Arrange
+        client = _make_client(tmp_path)
+        cached = FakeCredentials()
+        client._credentials = cached
+        # Act
+        creds = client._get_credentials()
+        # Assert
+        assert creds is cached
+
+    def test_get_credentials_loads_authorized_user_token_file(self, tmp_path):
+        # Arrange
+        (tmp_path / "token.json").write_text(_AUTHORIZED_USER_TOKEN)
+        client = _make_client(tmp_path)
+        # Act
+        creds = client._get_credentials()
+        # Assert
+        assert creds.token == "tok"
+
+    def test_get_credentials_trusts_cache_until_deadline(self, tmp_path):
+        # Arrange
+        client = _make_client(tmp_path)
+        cached = FakeCredentials(valid=False)
+        client._credentials = cached
+        client._creds_good_until = time.monotonic() + 600
+        # Act
+        creds = client._get_credentials()
+        # Assert
+        assert creds is cached
+
+    def test_get_credentials_sets_deadline_from_token_expiry(self, tmp_path):
+        # Arrange
+        (tmp_path / "token.json").write_text(_AUTHORIZED_USER_TOKEN)
+        client = _make_client(tmp_path)
+        # Act
+        client._get_credentials()
+        # Assert
+        assert client._creds_good_until > time.monotonic()
+
+    def test_get_credentials_shares_loaded_token_across_instances(self, tmp_path):
+        # Arrange
+        (tmp_path / "token.json").write_text(_AUTHORIZED_USER_TOKEN)
+        first = _make_client(tmp_path)._get_credentials()
+        (tmp_path / "token.json").unlink()
+        # Act
+        creds = _make_client(tmp_path)._get_credentials()
+        # Assert
+        assert creds is first
+
+
+class TestYouTubeGetClient:
+    def test_get_client_builds_service_from_bundled_discovery(self, tmp_path):
+        # Arrange
+        client = _make_client(tmp_path)
+        client._credentials = FakeCredentials()
+        # Act
+        service = client._get_client()
+        # Assert
+        assert hasattr(service, "videos")
+
+    def test_client_method_without_credentials_reports_missing(self, tmp_path):
+        # Arrange
+        client = _make_client(tmp_path)
+        # Act
+        result = client.get_channel_info()
+        # Assert
+        assert result["error"] == "Missing credentials"
+
+    def test_client_method_with_built_service_skips_credential_check(
+        self, tmp_path, fake_youtube_service
+    ):
+        # Arrange
+        client = _make_client(tmp_path)
+        client._youtube = fake_youtube_service
+        # Act
+        result = client.delete("vid1")
+        # Assert
+        assert result["success"] is True
+
+
+class TestYouTubeValidateCredentials:
+    def test_validate_credentials_true_when_token_file_exists(self, tmp_path):
+        # Arrange
+        (tmp_path / "token.json").write_text("{}")
+        client = _make_client(tmp_path)
+        # Act
+        ok = client.validate_credentials()
+        # Assert
+        assert ok is True
+
+    def test_validate_credentials_false_without_any_credential_file(self, tmp_path):
+        # Arrange
+        client = _make_client(tmp_path)
+        # Act
+        ok = client.validate_credentials()
+        # Assert
+        assert ok is False
+
+    def test_validate_credentials_caches_positive_result(self, tmp_path):
+        # Arrange
+        (tmp_path / "token.json").write_text("{}")
+        client = _make_client(tmp_path)
+        client.validate_credentials()
+        (tmp_path / "token.json").unlink()
+        # Act
+        ok = client.validate_credentials()
+        # Assert
+        assert ok is True
+
+    def test_validate_credentials_sees_token_file_written_after_miss(self, tmp_path):
+        # Arrange
+        client = _make_client(tmp_path)
+        client.validate_credentials()
+        (tmp_path / "token.json").write_text("{}")
+        # Act
+        ok = client.validate_credentials()
+        # Assert
+        assert ok is True
+
+
+# --- update ----------------------------------------------------------------
+
+
+_SCHEDULED_STATUS = {"privacyStatus": "private", "publishAt": "2026-02-01T10:00:00Z"}
+
+
+class TestYouTubeUpdate:
+    def test_update_privacy_only_keeps_fetched_status_fields(
+        self, youtube_client, fake_youtube_service
+    ):
+        # Arrange
+        fake_youtube_service.responses["videos.list"] = {
+            "items": [{"snippet": {"title": "Old"}, "status": _SCHEDULED_STATUS}]
+        }
+        # Act
+        youtube_client.update("vid1", privacy_status="unlisted")
+        # Assert
+        assert fake_youtube_service.calls[1][1]["body"]["status"] == {
+            "privacyStatus": "unlisted",
+            "publishAt": "2026-02-01T10:00:00Z",
+        }
+
+    def test_update_privacy_only_sends_status_part(
+        self, youtube_client, fake_youtube_service
+    ):
+        # Arrange
+        fake_youtube_service.responses["videos.list"] = {
+            "items": [{"snippet": {"title": "Old"}, "status": _SCHEDULED_STATUS}]
+        }
+        # Act
+        youtube_client.update("vid1", privacy_status="unlisted")
+        # Assert
+        assert fake_youtube_service.calls[1][1]["part"] == "status"
+
+    def test_update_replace_parts_privacy_only_skips_metadata_fetch(
+        self, youtube_client, fake_youtube_service
+    ):
+        # Arrange
+        # (no setup)
+        # Act
+        youtube_client.update("vid1", privacy_status="private", replace_parts=True)
+        # Assert
+        assert fake_youtube_service.call_names() == ["videos.update"]
+
+    def test_update_replace_parts_title_with_category_sends_snippet_only(
+        self, youtube_client, fake_youtube_service
+    ):
+        # Arrange
+        # (no setup)
+        # Act
+        youtube_client.update("vid1", title="New", category_id="28", replace_parts=True)
+        # Assert
+        assert fake_youtube_service.calls == [
+            (
+                "videos.update",
+                {
+                    "part": "snippet",
+                    "body": {
+                        "id": "vid1",
+                        "snippet": {"title": "New", "categoryId": "28"},
+                    },
+                    "fields": "id",
+                },
+            )
+        ]
+
+    def test_update_title_without_category_merges_fetched_snippet(
+        self, youtube_client, fake_youtube_service
+    ):
+        # Arrange
+        fake_youtube_service.responses["videos.list"] = {
+            "items": [
+                {
+                    "snippet": {"title": "Old", "categoryId": "22"},
+                    "status": {"privacyStatus": "public"},
+                }
+            ]
+        }
+        # Act
+        youtube_client.update("vid1", title="New")
+        # Assert
+        assert fake_youtube_service.calls[1][1]["body"] == {
+            "id": "vid1",
+            "snippet": {"title": "New", "categoryId": "22"},
+        }
+
+    def test_update_merged_update_reports_watch_url(
+        self, youtube_client, fake_youtube_service
+    ):
+        # Arrange
+        fake_youtube_service.stock_videos(["vid1"])
+        # Act
+        result = youtube_client.update("vid1", title="New")
+        # Assert
+        assert result == {
+            "success": True,
+            "id": "vid1",
+            "url": "https://www.youtube.com/watch?v=vid1",
+        }
+
+    def test_update_missing_video_reports_not_found(self, youtube_client):
+        # Arrange
+        # (no setup)
+        # Act
+        result = youtube_client.update("vid1", title="New")
+        # Assert
+        assert result["error"] == "Video not found: vid1"
+
+
+class TestYouTubeUpdateMany:
+    def test_update_many_fetches_fifty_videos_per_list_call(
+        self, youtube_client, fake_youtube_service
+    ):
+        # Arrange
+        ids = [f"v{i}" for i in range(60)]
+        fake_youtube_service.stock_videos(ids)
+        # Act
+        youtube_client.update_many([{"video_id": v, "title": "New"} for v in ids])
+        # Assert
+        assert fake_youtube_service.call_names().count("videos.list") == 2
+
+    def test_update_many_batches_fifty_updates_per_request(
+        self, youtube_client, fake_youtube_service
+    ):
+        # Arrange
+        ids = [f"v{i}" for i in range(60)]
+        fake_youtube_service.stock_videos(ids)
+        # Act
+        youtube_client.update_many([{"video_id": v, "title": "New"} for v in ids])
+        # Assert
+        assert fake_youtube_service.batch_sizes == [50, 10]
+
+    def test_update_many_merges_fetched_snippet_per_video(
+        self, youtube_client, fake_youtube_service
+    ):
+        # Arrange
+        fake_youtube_service.stock_videos(["a"])
+        # Act
+        youtube_client.update_many([{"video_id": "a", "title": "New"}])
+        # Assert
+        assert fake_youtube_service.calls[-1][1]["body"] == {
+            "id": "a",
+            "snippet": {"title": "New", "categoryId": "22"},
+        }
+
+    def test_update_many_replace_parts_privacy_only_skips_metadata_fetch(
+        self, youtube_client, fake_youtube_service
+    ):
+        # Arrange
+        # (no setup)
+        # Act
+        youtube_client.update_many(
+            [
+                {"video_id": v, "privacy_status": "private", "replace_parts": True}
+                for v in ("a", "b")
+            ]
+        )
+        # Assert
+        assert fake_youtube_service.call_names() == ["videos.update", "videos.update"]
+
+    def test_update_many_reports_success_when_every_video_updates(
+        self, youtube_client, fake_youtube_service
+    ):
+        # Arrange
+        fake_youtube_service.stock_videos(["a", "b"])
+        # Act
+        result = youtube_client.update_many(
+            [{"video_id": "a", "title": "New"}, {"video_id": "b", "title": "New"}]
+        )
+        # Assert
+        assert result["success"] is True
+
+    def test_update_many_reports_missing_video_in_its_result(
+        self, youtube_client, fake_youtube_service
+    ):
+        # Arrange
+        fake_youtube_service.stock_videos(["a"])
+        # Act
+        result = youtube_client.update_many(
+            [{"video_id": "a", "title": "New"}, {"video_id": "gone", "title": "X"}]
+        )
+        # Assert
+        assert result["results"][1] == {
+            "success": False,
+            "error": "Video not found: gone",
+        }
+
+
+# --- playlists -------------------------------------------------------------
+
+
+class TestYouTubeAddToPlaylist:
+    def test_add_to_playlist_batches_fifty_inserts_per_request(
+        self, youtube_client, fake_youtube_service
+    ):
+        # Arrange
+        # (no setup)
+        # Act
+        youtube_client.add_to_playlist("PL1", [f"v{i}" for i in range(120)])
+        # Assert
+        assert fake_youtube_service.batch_sizes == [50, 50, 20]
+
+    def test_add_to_playlist_reports_added_ids_in_order(self, youtube_client):
+        # Arrange
+        # (no setup)
+        # Act
+        result = youtube_client.add_to_playlist("PL1", ["a", "b", "c"])
+        # Assert
+        assert result["added"] == ["a", "b", "c"]
+
+    def test_add_to_playlist_targets_given_playlist(
+        self, youtube_client, fake_youtube_service
+    ):
+        # Arrange
+        # (no setup)
+        # Act
+        youtube_client.add_to_playlist("PL1", ["a"])
+        # Assert
+        assert (
+            fake_youtube_service.calls[0][1]["body"]["snippet"]["playlistId"] == "PL1"
+        )
+
+
+# --- list_videos -----------------------------------------------------------
+
+
+class TestYouTubeListVideos:
+    def test_list_videos_include_stats_fetches_all_ids_in_one_call(
+        self, youtube_client, fake_youtube_service
+    ):
+        # Arrange
+        fake_youtube_service.stock_uploads()
+        # Act
+        youtube_client.list_videos(include_stats=True)
+        # Assert
+        assert [
+            kw["id"] for name, kw in fake_youtube_service.calls if name == "videos.list"
+        ] == ["v1,v2"]
+
+    def test_list_videos_include_stats_merges_view_counts(
+        self, youtube_client, fake_youtube_service
+    ):
+        # Arrange
+        fake_youtube_service.stock_uploads()
+        fake_youtube_service.responses["videos.list"] = {
+            "items": [
+                {"id": "v1", "statistics": {"viewCount": "7"}},
+                {"id": "v2", "statistics": {"viewCount": "3"}},
+            ]
+        }
+        # Act
+        result = youtube_client.list_videos(include_stats=True)
+        # Assert
+        assert [v["views"] for v in result["videos"]] == [7, 3]
+
+    def test_list_videos_include_stats_reports_privacy_status(
+        self, youtube_client, fake_youtube_service
+    ):
+        # Arrange
+        fake_youtube_service.stock_uploads()
+        fake_youtube_service.responses["videos.list"] = {
+            "items": [{"id": "v1", "status": {"privacyStatus": "unlisted"}}]
+        }
+        # Act
+        result = youtube_client.list_videos(include_stats=True)
+        # Assert
+        assert result["videos"][0]["privacy_status"] == "unlisted"
+
+    def test_add_video_stats_splits_ids_into_batches_of_fifty(
+        self, youtube_client, fake_youtube_service
+    ):
+        # Arrange
+        videos = [{"id": f"v{i}"} for i in range(120)]
+        # Act
+        youtube_client._add_video_stats(fake_youtube_service, videos)
+        # Assert
+        assert [len(kw["id"].split(",")) for _, kw in fake_youtube_service.calls] == [
+            50,
+            50,
+            20,
+        ]
+
+    def test_list_videos_reuses_cached_uploads_playlist_id(
+        self, youtube_client, fake_youtube_service
+    ):
+        # Arrange
+        fake_youtube_service.stock_uploads()
+        youtube_client.list_videos()
+        # Act
+        youtube_client.list_videos()
+        # Assert
+        assert fake_youtube_service.call_names().count("channels.list") == 1
+
+    def test_list_videos_forgets_uploads_playlist_id_on_404(
+        self, youtube_client, fake_youtube_service
+    ):
+        # Arrange
+        google = _google_api()
+        youtube_client._uploads_playlist_id = "UUstale"
+        fake_youtube_service.errors["playlistItems.list"] = google.HttpError(
+            google.httplib2.Response({"status": 404}), b"gone"
+        )
+        # Act
+        youtube_client.list_videos()
+        # Assert
+        assert youtube_client._uploads_playlist_id is None
+
+
+# --- video upload ----------------------------------------------------------
+
+
+class TestYouTubeUploadVideo:
+    def test_post_with_video_returns_uploaded_video_id(
+        self, youtube_client, video_file
+    ):
+        # Arrange
+        # (no setup)
+        # Act
+        result = youtube_client.post("Title", video_path=str(video_file))
+        # Assert
+        assert result["id"] == "new123"
+
+    def test_post_with_video_guesses_mimetype_from_extension(
+        self, youtube_client, fake_youtube_service, video_file
+    ):
+        # Arrange
+        # (no setup)
+        # Act
+        youtube_client.post("Title", video_path=str(video_file))
+        # Assert
+        assert fake_youtube_service.calls[0][1]["media_body"].mimetype() == "video/mp4"
+
+    def test_post_with_missing_video_reports_file_not_found(
+        self, tmp_path, youtube_client
+    ):
+        # Arrange
+        # (no setup)
+        # Act
+        result = youtube_client.post("Title", video_path=str(tmp_path / "nope.mp4"))
+        # Assert
+        assert "not found" in result["error"]
+
+    def test_post_with_empty_video_reports_empty_file(self, youtube_client, video_file):
+        # Arrange
+        video_file.write_bytes(b"")
+        # Act
+        result = youtube_client.post("Title", video_path=str(video_file))
+        # Assert
+        assert "empty" in result["error"]
+
+    def test_upload_chunksize_small_file_uses_minimum_chunk(self):
+        # Arrange
+        size = 64
+        # Act
+        chunk = _upload_chunksize(size)
+        # Assert
+        assert chunk == 1024 * 1024
+
+    def test_upload_chunksize_is_multiple_of_256_kib(self):
+        # Arrange
+        size = 123_456_789
+        # Act
+        chunk = _upload_chunksize(size)
+        # Assert
+        assert chunk % (256 * 1024) == 0
+
+    def test_post_silent_upload_disables_subscriber_notification(
+        self, youtube_client, fake_youtube_service, video_file
+    ):
+        # Arrange
+        # (no setup)
+        # Act
+        youtube_client.post(
+            "Title", video_path=str(video_file), notify_subscribers=False
+        )
+        # Assert
+        assert fake_youtube_service.calls[0][1]["notifySubscribers"] is False
+
+    def test_post_with_video_skips_stabilize_by_default(
+        self, youtube_client, fake_youtube_service, video_file
+    ):
+        # Arrange
+        # (no setup)
+        # Act
+        youtube_client.post("Title", video_path=str(video_file))
+        # Assert
+        assert fake_youtube_service.calls[0][1]["stabilize"] is False
+
+    def test_apost_awaits_uploaded_video_id(self, youtube_client, video_file):
+        # Arrange
+        # (no setup)
+        # Act
+        result = asyncio.run(youtube_client.apost("Title", video_path=str(video_file)))
+        # Assert
+        assert result["id"] == "new123"
+
+    def test_thread_http_differs_between_threads(self, tmp_path):
+        # Arrange
+        client = _make_client(tmp_path)
+        main_http = client._thread_http()
+        # Act
+        worker_http = asyncio.run(asyncio.to_thread(client._thread_http))
+        # Assert
+        assert worker_http is not main_http
+
+    def test_post_wait_for_thumbnail_sets_thumbnail_before_returning(
+        self, tmp_path, youtube_client, fake_youtube_service, video_file
+    ):
+        # Arrange
+        thumb = tmp_path / "thumb.jpg"
+        thumb.write_bytes(b"\xff\xd8\xff")
+        # Act
+        youtube_client.post(
+            "Title",
+            video_path=str(video_file),
+            thumbnail_path=str(thumb),
+            wait_for_thumbnail=True,
+        )
+        # Assert
+        assert fake_youtube_service.call_names() == ["videos.insert", "thumbnails.set"]
+
+    def test_post_wait_for_thumbnail_reports_thumbnail_failure(
+        self, tmp_path, youtube_client, fake_youtube_service, video_file
+    ):
+        # Arrange
+        thumb = tmp_path / "thumb.jpg"
+        thumb.write_bytes(b"\xff\xd8\xff")
+        fake_youtube_service.errors["thumbnails.set"] = OSError("thumb upload broke")
+        # Act
+        result = youtube_client.post(
+            "Title",
+            video_path=str(video_file),
+            thumbnail_path=str(thumb),
+            wait_for_thumbnail=True,
+        )
+        # Assert
+        assert result["thumbnail_error"] == "thumb upload broke"
+
+    def test_post_background_thumbnail_failure_is_settled_into_result(
+        self, tmp_path, youtube_client, fake_youtube_service, video_file
+    ):
+        # Arrange
+        thumb = tmp_path / "thumb.jpg"
+        thumb.write_bytes(b"\xff\xd8\xff")
+        fake_youtube_service.errors["thumbnails.set"] = OSError("thumb upload broke")
+        result = youtube_client.post(
+            "Title", video_path=str(video_file), thumbnail_path=str(thumb)
+        )
+        # Act
+        settled = _settle_thumbnail(result)
+        # Assert
+        assert settled == {
+            "success": True,
+            "id": "new123",
+            "url": "https://www.youtube.com/watch?v=new123",
+            "title": "Title",
+            "thumbnail_error": "thumb upload broke",
+        }
+
+
+# --- read-ahead upload map -------------------------------------------------
+
+
+def _read_ahead_map(tmp_path, pages: int = 3) -> _ReadAheadMap:
+    data = bytes(range(256)) * (pages * mmap.PAGESIZE // 256)
+    video = tmp_path / "clip.mp4"
+    video.write_bytes(data)
+    with open(video, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return _ReadAheadMap(mm, mmap.PAGESIZE)
+
+
+class TestReadAheadMap:
+    def test_read_ahead_map_reads_chunk_at_seek_position(self, tmp_path):
+        # Arrange
+        view = _read_ahead_map(tmp_path)
+        view.seek(mmap.PAGESIZE)
+        # Act
+        data = view.read(4)
+        # Assert
+        assert data == bytes(range(4))
+
+    def test_read_ahead_map_seek_to_end_reports_file_size(self, tmp_path):
+        # Arrange
+        view = _read_ahead_map(tmp_path)
+        # Act
+        size = view.seek(0, os.SEEK_END)
+        # Assert
+        assert size == 3 * mmap.PAGESIZE
+
+
+# --- chunk retry -----------------------------------------------------------
+
+
+class FlakyChunkRequest:
+    """Resumable request whose first ``failures`` next_chunk() calls fail."""
+
+    def __init__(self, failures: int, status: int = 503) -> None:
+        self.failures = failures
+        self.status = status
+        self.calls = 0
+
+    def next_chunk(self, http=None):
+        self.calls += 1
+        if self.calls <= self.failures:
+            resp = _google_api().httplib2.Response({"status": self.status})
+            raise _google_api().HttpError(resp, b"")
+        return None, {"id": "ok"}
+
+
+class TestNextChunkWithRetry:
+    def test_next_chunk_retry_recovers_from_transient_503(self):
+        # Arrange
+        request = FlakyChunkRequest(failures=2)
+        # Act
+        result = _next_chunk_with_retry(request, sleep=lambda _s: None)
+        # Assert
+        assert result == (None, {"id": "ok"})
+
+    def test_next_chunk_retry_backs_off_exponentially(self):
+        # Arrange
+        request = FlakyChunkRequest(failures=3)
+        delays = []
+        # Act
+        _next_chunk_with_retry(request, sleep=delays.append)
+        # Assert
+        assert [int(d) for d in delays] == [2, 4, 8]
+
+    def test_next_chunk_retry_reraises_client_errors(self):
+        # Arrange
+        request = FlakyChunkRequest(failures=1, status=403)
+        # Act
+        with pytest.raises(_google_api().HttpError) as exc_info:
+            _next_chunk_with_retry(request, sleep=lambda _s: None)
+        # Assert
+        assert exc_info.value.resp.status == 403
+
+    def test_next_chunk_retry_gives_up_after_max_attempts(self):
+        # Arrange
+        request = FlakyChunkRequest(failures=100)
+        # Act
+        with pytest.raises(_google_api().HttpError):
+            _next_chunk_with_retry(request, sleep=lambda _s: None)
+        # Assert
+        assert request.calls == 8
@@ -0,0 +1,338 @@
+"""Tests for YAML-driven YouTube batch uploads."""
+
+import pytest
+
+from socialia.youtube_batch import (
+    YouTubeBatch,
+    create_scitex_config,
+    generate_config_from_directory,
+    load_defaults_only,
+    load_video_config,
+)
+
+# --- Helpers ----------------------------------------------------------------
+
+
+class FakeUploader:
+    """Stand-in for ``YouTube`` recording ``post`` calls."""
+
+    def __init__(self, success: bool = True) -> None:
+        self.success = success
+        self.posted: list[str] = []
+
+    def validate_credentials(self) -> bool:
+        return True
+
+    def post(self, text: str, video_path: str, **kwargs) -> dict:
+        self.posted.append(video_path)
+        if self.success:
+            return {"success": True, "url": f"https://youtu.be/{video_path}"}
+        return {"success": False, "error": "quota exceeded"}
+
+
+@pytest.fixture
+def make_batch(env_save_restore, tmp_path):
+    """Build a YouTubeBatch over *n* configured videos and a FakeUploader."""
+    env_save_restore.set("YOUTUBE_TOKEN_FILE", str(tmp_path / "token.json"))
+
+    def _make(n: int, success: bool = True) -> YouTubeBatch:
+        config = {"videos": [{"path": f"v{i}.mp4", "title": f"V{i}"} for i in range(n)]}
+        batch = YouTubeBatch(config=config)
+        batch.youtube = FakeUploader(success=success)
+        return batch
+
+    return _make
+
+
+# --- YAML config round trip -------------------------------------------------
+
+
+class TestVideoConfigYaml:
+    def test_generated_config_round_trips_through_yaml(self, tmp_path):
+        # Arrange
+        (tmp_path / "intro-demo.mp4").write_bytes(b"")
+        out = tmp_path / "videos.yaml"
+        config = generate_config_from_directory(str(tmp_path), output_path=str(out))
+        # Act
+        loaded = load_video_config(str(out))
+        # Assert
+        assert loaded == config
+
+    def test_generated_config_titles_videos_from_filename(self, tmp_path):
+        # Arrange
+        (tmp_path / "intro-demo.mp4").write_bytes(b"")
+        # Act
+        config = generate_config_from_directory(str(tmp_path))
+        # Assert
+        assert config["videos"][0]["title"] == "Intro Demo"
+
+    def test_generated_config_finds_mp4s_in_nested_directories(self, tmp_path):
+        # Arrange
+        (tmp_path / "b").mkdir()
+        (tmp_path / "b" / "two.mp4").write_bytes(b"")
+        (tmp_path / "one.mp4").write_bytes(b"")
+        (tmp_path / "notes.txt").write_bytes(b"")
+        # Act
+        config = generate_config_from_directory(str(tmp_path))
+        # Assert
+        assert [v["path"] for v in config["videos"]] == [
+            str(tmp_path / "b" / "two.mp4"),
+            str(tmp_path / "one.mp4"),
+        ]
+
+    def test_generated_config_for_missing_directory_is_empty(self, tmp_path):
+        # Arrange
+        missing = tmp_path / "nope"
+        # Act
+        config = generate_config_from_directory(str(missing))
+        # Assert
+        assert config["videos"] == []
+
+
+class TestLoadDefaultsOnly:
+    def test_defaults_only_matches_full_load_defaults(self, tmp_path):
+        # Arrange
+        out = tmp_path / "videos.yaml"
+        out.write_text(
+            "videos:\n"
+            "  - path: a.mp4\n"
+            "    tags: [x, {y: 1}]\n"
+            "defaults:\n"
+            "  category_id: '28'\n"
+            "  tags: [scitex, research]\n"
+        )
+        # Act
+        defaults = load_defaults_only(str(out))
+        # Assert
+        assert defaults == load_video_config(str(out))["defaults"]
+
+    def test_defaults_only_resolves_alias_anchored_outside_defaults(self, tmp_path):
+        # Arrange
+        out = tmp_path / "videos.yaml"
+        out.write_text(
+            "base: &base\n"
+            "  category_id: '28'\n"
+            "defaults:\n"
+            "  <<: *base\n"
+            "  privacy_status: unlisted\n"
+            "videos: []\n"
+        )
+        # Act
+        defaults = load_defaults_only(str(out))
+        # Assert
+        assert defaults == {"category_id": "28", "privacy_status": "unlisted"}
+
+    def test_defaults_only_without_defaults_section_is_empty(self, tmp_path):
+        # Arrange
+        out = tmp_path / "videos.yaml"
+        out.write_text("videos:\n  - path: a.mp4\n")
+        # Act
+        defaults = load_defaults_only(str(out))
+        # Assert
+        assert defaults == {}
+
+
+# --- SciTeX demo config -----------------------------------------------------
+
+
+class TestCreateScitexConfig:
+    def test_scitex_config_lists_only_present_videos_by_priority(self, tmp_path):
+        # Arrange
+        (tmp_path / "figrecipe-v0.14.0-demo.mp4").write_bytes(b"")
+        (tmp_path / "scitex-automated-research-demo.mp4").write_bytes(b"")
+        # Act
+        config = create_scitex_config(video_dir=str(tmp_path))
+        # Assert
+        assert [v["path"] for v in config["videos"]] == [
+            str(tmp_path / "scitex-automated-research-demo.mp4"),
+            str(tmp_path / "figrecipe-v0.14.0-demo.mp4"),
+        ]
+
+    def test_scitex_config_yaml_keeps_unicode_unescaped(self, tmp_path):
+        # Arrange
+        (tmp_path / "figrecipe-v0.14.0-demo.mp4").write_bytes(b"")
+        out = tmp_path / "videos.yaml"
+        # Act
+        create_scitex_config(video_dir=str(tmp_path), output_path=str(out))
+        # Assert
+        assert "━━━" in out.read_text(encoding="utf-8")
+
+    def test_scitex_config_for_missing_directory_has_no_videos(self, tmp_path):
+        # Arrange
+        missing = tmp_path / "nope"
+        # Act
+        config = create_scitex_config(video_dir=str(missing))
+        # Assert
+        assert config["videos"] == []
+
+    def test_scitex_config_for_file_path_has_no_videos(self, tmp_path):
+        # Arrange
+        not_a_dir = tmp_path / "figrecipe-v0.14.0-demo.mp4"
+        not_a_dir.write_bytes(b"")
+        # Act
+        config = create_scitex_config(video_dir=str(not_a_dir))
+        # Assert
+        assert config["videos"] == []
+
+
+# --- upload_all -------------------------------------------------------------
+
+
+class TestUploadAll:
+    def test_parallel_upload_all_uploads_every_video(self, make_batch):
+        # Arrange
+        batch = make_batch(6)
+        # Act
+        batch.upload_all(max_workers=3)
+        # Assert
+        assert sorted(batch.youtube.posted) == [f"v{i}.mp4" for i in range(6)]
+
+    def test_parallel_upload_all_tags_results_with_video_index(self, make_batch):
+        # Arrange
+        batch = make_batch(6)
+        # Act
+        results = batch.upload_all(max_workers=3)
+        # Assert
+        assert sorted(r["index"] for r in results) == [1, 2, 3, 4, 5, 6]
+
+    def test_parallel_upload_all_stops_collecting_after_first_error(self, make_batch):
+        # Arrange
+        batch = make_batch(10, success=False)
+        # Act
+        results = batch.upload_all(stop_on_error=True, max_workers=2)
+        # Assert
+        assert len(results) == 1
+
+
+class TestIterUploadAll:
+    def test_iter_upload_all_yields_results_in_video_order(self, make_batch):
+        # Arrange
+        batch = make_batch(3)
+        # Act
+        indexes = [r["index"] for r in batch.iter_upload_all()]
+        # Assert
+        assert indexes == [1, 2, 3]
+
+    def test_closing_iter_upload_all_starts_no_further_uploads(self, make_batch):
+        # Arrange
+        batch = make_batch(5)
+        results = batch.iter_upload_all()
+        next(results)
+        # Act
+        results.close()
+        # Assert
+        assert batch.youtube.posted == ["v0.mp4"]
+
+    def test_upload_all_calls_callback_for_each_streamed_result(self, make_batch):
+        # Arrange
+        batch = make_batch(3)
+        seen = []
+        # Act
+        batch.upload_all(callback=lambda i, total, r: seen.append((i, total)))
+        # Assert
+        assert seen == [(1, 3), (2, 3), (3, 3)]
+
+
+class TestSummary:
+    def test_summary_counts_and_collects_mixed_results(self, make_batch):
+        # Arrange
+        batch = make_batch(0)
+        batch.results = [
+            {"success": True, "url": "https://youtu.be/a"},
+            {"success": True},
+            {"success": False, "title": "C", "error": "quota exceeded"},
+        ]
+        # Act
+        summary = batch.summary()
+        # Assert
+        assert summary == {
+            "total": 3,
+            "successful": 2,
+            "failed": 1,
+            "urls": ["https://youtu.be/a"],
+            "errors": [{"title": "C", "error": "quota exceeded"}],
+        }
+
+
+# --- upload_one defaults ----------------------------------------------------
+
+
+class TestUploadOneDefaults:
+    def test_dry_run_merges_default_and_video_tags_without_duplicates(self, make_batch):
+        # Arrange
+        batch = make_batch(0)
+        batch.config = {"defaults": {"tags": ["a", "b"]}}
+        # Act
+        result = batch.upload_one({"path": "x.mp4", "tags": ["b", "c"]}, dry_run=True)
+        # Assert
+        assert result["tags"] == ["a", "b", "c"]
+
+    def test_dry_run_accepts_video_with_null_tags(self, make_batch):
+        # Arrange
+        batch = make_batch(0)
+        batch.config = {"defaults": {"tags": ["a"]}}
+        # Act
+        result = batch.upload_one({"path": "x.mp4", "tags": None}, dry_run=True)
+        # Assert
+        assert result["tags"] == ["a"]
+
+    def test_replacing_config_refreshes_cached_defaults(self, make_batch):
+        # Arrange
+        batch = make_batch(0)
+        batch.config = {"defaults": {"privacy_status": "private"}}
+        batch.upload_one({"path": "x.mp4"}, dry_run=True)
+        batch.config = {"defaults": {"privacy_status": "public"}}
+        # Act
+        result = batch.upload_one({"path": "x.mp4"}, dry_run=True)
+        # Assert
+        assert result["privacy_status"] == "public"
+
+
+# --- validate ---------------------------------------------------------------
+
+
+class TestValidate:
+    def test_validate_reports_only_missing_video_files(self, make_batch, tmp_path):
+        # Arrange
+        (tmp_path / "here.mp4").write_bytes(b"")
+        batch = make_batch(0)
+        batch.config = {
+            "videos": [
+                {"path": str(tmp_path / "here.mp4"), "title": "Here"},
+                {"path": str(tmp_path / "gone.mp4"), "title": "Gone"},
+                {"path": str(tmp_path / "nodir" / "x.mp4"), "title": "X"},
+            ]
+        }
+        # Act
+        result = batch.validate()
+        # Assert
+        assert result["errors"] == [
+            f"Video 2: file not found: {tmp_path / 'gone.mp4'}",
+            f"Video 3: file not found: {tmp_path / 'nodir' / 'x.mp4'}",
+        ]
+
+    def test_validate_reports_broken_symlink_as_missing(self, make_batch, tmp_path):
+        # Arrange
+        link = tmp_path / "dangling.mp4"
+        link.symlink_to(tmp_path / "target.mp4")
+        batch = make_batch(0)
+        batch.config = {"videos": [{"path": str(link), "title": "Dangling"}]}
+        # Act
+        result = batch.validate()
+        # Assert
+        assert result["errors"] == [f"Video 1: file not found: {link}"]
+
+    def test_validate_accepts_path_with_parent_segment(self, make_batch, tmp_path):
+        # Arrange
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "here.mp4").write_bytes(b"")
+        batch = make_batch(0)
+        batch.config = {
+            "videos": [
+                {"path": str(tmp_path / "sub" / ".." / "here.mp4"), "title": "H"}
+            ]
+        }
+        # Act
+        result = batch.validate()
+        # Assert
+        assert result["errors"] == []